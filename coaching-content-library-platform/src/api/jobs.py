@@ -0,0 +1,202 @@
+"""Background ingestion jobs: queue a URL now, fetch and save it later."""
+import asyncio
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from ..config import settings
+from ..models.content import ContentSource
+from ..storage.jobs import Job, JobStatus, JobStore
+from . import routes
+from .models import ContentItemResponse, JobResponse, SaveContentRequest
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["jobs"])
+
+job_store = JobStore(
+    settings.database_path,
+    pragmas=settings.sqlite_pragmas,
+    max_attempts=settings.job_max_attempts,
+)
+
+# Jobs fetch and save here rather than on routes.ingest_executor, so a burst
+# of queued jobs doesn't starve synchronous POST /content saves
+job_executor = ThreadPoolExecutor(
+    max_workers=settings.job_max_workers,
+    thread_name_prefix="job",
+)
+
+
+class JobRunner:
+    """Asyncio workers that drain the job queue.
+
+    Each worker claims one job at a time and runs the blocking fetch and
+    save on `executor` (job_executor by default). Workers sleep until
+    notify() is called or `poll_interval` passes, so jobs queued by another
+    process are still picked up.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 4,
+        poll_interval: float = 5.0,
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            store: Queue to drain
+            workers: Number of jobs to run concurrently
+            poll_interval: Seconds between queue checks when idle
+            executor: Where blocking fetches and saves run (job_executor if None)
+        """
+        self.store = store
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.executor = executor or job_executor
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self) -> None:
+        """Requeue jobs interrupted by the last shutdown and start the workers."""
+        await asyncio.to_thread(self.store.requeue_running)
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the workers. Jobs they were running are requeued on next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._wakeup = None
+        self._loop = None
+
+    def notify(self) -> None:
+        """Wake idle workers after a job is queued. Safe to call from any thread."""
+        if self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def run_pending(self) -> int:
+        """Run queued jobs one after another until the queue is empty.
+
+        Returns:
+            Number of jobs run
+        """
+        count = 0
+        while (job := await asyncio.to_thread(self.store.claim)) is not None:
+            await self.run(job)
+            count += 1
+        return count
+
+    async def _work(self) -> None:
+        """Worker loop: claim and run jobs, sleeping while the queue is empty."""
+        while True:
+            # Clear before claiming so a notify() during the claim isn't lost
+            self._wakeup.clear()
+            try:
+                job = await asyncio.to_thread(self.store.claim)
+            except Exception as e:
+                logger.error(f"Failed to claim job: {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self.run(job)
+
+    async def run(self, job: Job) -> None:
+        """Fetch and save one claimed job, recording the outcome.
+
+        Args:
+            job: Job returned by JobStore.claim()
+        """
+        try:
+            request = SaveContentRequest(**job.payload)
+            ingestor = routes.ingestors.get(request.source)
+            if not ingestor:
+                raise ValueError(f"Unsupported content source: {request.source}")
+
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(
+                self.executor, routes._fetch_and_save, ingestor, request
+            )
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            await asyncio.to_thread(self.store.fail, job.id, str(e))
+            return
+
+        if not content:
+            await asyncio.to_thread(
+                self.store.fail, job.id, f"Could not fetch content from URL: {request.url}"
+            )
+            return
+
+        await asyncio.to_thread(self.store.complete, job.id, content.source.value, content.id)
+
+
+job_runner = JobRunner(job_store, workers=settings.job_max_workers)
+
+
+# Plain def like the content routes: the job store and repository calls
+# block, so FastAPI runs these in its threadpool
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+def create_job(request: SaveContentRequest, http_request: Request, response: Response):
+    """Queue a URL to be fetched and saved in the background.
+
+    Returns immediately with the job; poll GET /jobs/{id} (also given in
+    the Location header) for the result.
+    """
+    if request.source not in routes.ingestors:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported content source: {request.source}"
+        )
+
+    job = job_store.create(request.model_dump(mode="json"))
+    job_runner.notify()
+
+    response.headers["Location"] = str(http_request.url_for("get_job", job_id=job.id))
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
+    """Get the status of an ingestion job, and its content once saved."""
+    job = job_store.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job not found: {job_id}"
+        )
+
+    return _job_response(job)
+
+
+def _job_response(job: Job) -> JobResponse:
+    """Build a JobResponse, loading the saved content for succeeded jobs."""
+    content = None
+    if job.status == JobStatus.SUCCEEDED:
+        item = routes.repository.get_by_id(ContentSource(job.result_source), job.result_id)
+        if item:
+            content = ContentItemResponse.model_validate(item)
+
+    return JobResponse(
+        id=job.id,
+        status=job.status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        content=content,
+    )
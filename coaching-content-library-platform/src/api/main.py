@@ -1,13 +1,83 @@
 """FastAPI application entry point."""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from . import jobs, routes
 from .routes import router
+from ..config import settings
+from ..ingestors.resilience import upstream_status
+
+logger = logging.getLogger(__name__)
+
+
+async def checkpoint_wal_periodically(interval: float):
+    """Checkpoint the WAL every `interval` seconds so it doesn't grow unbounded.
+
+    Uses PASSIVE mode, which never blocks readers or the writer.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(routes.repository.checkpoint)
+        except Exception as e:
+            logger.warning(f"Periodic WAL checkpoint failed: {e}")
+
+
+async def refresh_metadata_periodically(interval: float):
+    """Refresh stale engagement stats every `interval` seconds.
+
+    Runs on a worker thread; each run is bounded by the per-source call budgets.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(routes.refresher.run, settings.refresh_max_items)
+        except Exception as e:
+            logger.warning(f"Periodic metadata refresh failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background maintenance and ingestion jobs; release pooled connections on shutdown."""
+    checkpoint_task = None
+    if (
+        settings.sqlite_journal_mode.upper() == "WAL"
+        and settings.sqlite_wal_checkpoint_interval > 0
+    ):
+        checkpoint_task = asyncio.create_task(
+            checkpoint_wal_periodically(settings.sqlite_wal_checkpoint_interval)
+        )
+
+    refresh_task = None
+    if settings.refresh_interval > 0:
+        refresh_task = asyncio.create_task(
+            refresh_metadata_periodically(settings.refresh_interval)
+        )
+
+    await jobs.job_runner.start()
+
+    yield
+
+    await jobs.job_runner.stop()
+    if checkpoint_task:
+        checkpoint_task.cancel()
+    if refresh_task:
+        refresh_task.cancel()
+    jobs.job_store.close()
+    routes.url_resolver.close()
+    routes.youtube_quota.close()
+    routes.repository.close()
+
 
 app = FastAPI(
     title="Goalie Drill Library API",
     description="Content aggregation API for hockey goalie coaches",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -21,9 +91,18 @@ app.add_middleware(
 
 # Include content routes
 app.include_router(router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
 
 
+# Plain def: health_check() queries SQLite, so it runs in the threadpool
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "version": "2.0.0"}
+def health_check():
+    """Health check endpoint, with per-source retry counters, circuit states and refresh progress."""
+    database_ok = routes.repository.health_check()
+    return {
+        "status": "healthy" if database_ok else "degraded",
+        "version": "2.0.0",
+        "database": "ok" if database_ok else "unavailable",
+        "upstreams": upstream_status(),
+        "refresh": routes.refresher.status(),
+    }
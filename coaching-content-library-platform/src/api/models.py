@@ -3,7 +3,8 @@ from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-from ..models.content import ContentSource, ContentType
+from ..models.content import ContentItem, ContentSource, ContentType
+from ..storage.jobs import JobStatus
 
 
 class ContentItemResponse(BaseModel):
@@ -57,6 +58,8 @@ class SaveContentRequest(BaseModel):
     equipment: Optional[str] = Field(None, description="Required equipment (e.g., 'pucks, cones')")
     age_group: Optional[str] = Field(None, description="Target age group (e.g., 'bantam', '12-14')")
 
+    refresh: bool = Field(False, description="Re-fetch from the source even if the content is already saved")
+
 
 class UpdateMetadataRequest(BaseModel):
     """Request model for updating content metadata."""
@@ -82,4 +85,46 @@ class ContentListResponse(BaseModel):
     """Response model for content lists."""
 
     items: list[ContentItemResponse]
-    total: int
+    total: int = Field(..., description="Number of items in this page")
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page")
+    total_count: Optional[int] = Field(None, description="Total matches across all pages (only when include_total=true)")
+
+    @classmethod
+    def from_items(
+        cls,
+        items: list[ContentItem],
+        next_cursor: Optional[str] = None,
+        total_count: Optional[int] = None,
+        include_metadata: bool = True,
+    ) -> "ContentListResponse":
+        """Build a page from repository items in a single validation pass.
+
+        Args:
+            items: ContentItems loaded from the repository
+            next_cursor: Cursor for the following page
+            total_count: Total matches, if counted
+            include_metadata: If False, each item's source_metadata is None
+
+        Returns:
+            ContentListResponse ready to serialize with model_dump_json()
+        """
+        page = cls.model_validate(
+            {"items": items, "total": len(items), "next_cursor": next_cursor, "total_count": total_count},
+            from_attributes=True,
+        )
+        if not include_metadata:
+            for item in page.items:
+                item.source_metadata = None
+        return page
+
+
+class JobResponse(BaseModel):
+    """Response model for ingestion jobs."""
+
+    id: str
+    status: JobStatus
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = Field(None, description="Why the job failed (only when status is failed)")
+    content: Optional[ContentItemResponse] = Field(None, description="Saved content (only when status is succeeded)")
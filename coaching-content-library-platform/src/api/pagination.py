@@ -0,0 +1,45 @@
+"""Opaque cursor tokens for keyset-paginated list endpoints."""
+import base64
+import binascii
+import json
+
+
+def encode_cursor(key: tuple) -> str:
+    """Encode a repository pagination key as an opaque URL-safe token.
+
+    Args:
+        key: SearchPage.next_key
+
+    Returns:
+        Cursor string for the next_cursor response field
+    """
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode a cursor token back into a repository pagination key.
+
+    Args:
+        cursor: Token previously returned as next_cursor
+
+    Returns:
+        Pagination key tuple to pass as `after`
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Malformed cursor: {e}") from e
+
+    if (
+        not isinstance(key, list)
+        or len(key) not in (3, 4)
+        or not all(isinstance(part, (str, int, float)) for part in key)
+    ):
+        raise ValueError("Malformed cursor")
+
+    return tuple(key)
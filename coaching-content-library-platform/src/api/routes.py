@@ -1,15 +1,28 @@
 """API routes for content management."""
+import asyncio
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 
-from ..storage.sqlite import SQLiteRepository
-from ..models.content import ContentSource, ContentType
+from ..storage.sqlite import USER_COLUMNS, SQLiteRepository
+from ..models.content import ContentItem, ContentSource, ContentType
 from ..config import settings
 from ..ingestors.youtube import YouTubeIngestor
 from ..ingestors.reddit import RedditIngestor
 from ..ingestors.instagram import InstagramIngestor
+from ..ingestors.base import BaseIngestor
+from ..ingestors.quota import QuotaLedger
+from ..ingestors.resilience import UpstreamUnavailableError
+from ..ingestors.singleflight import SingleFlight
+from ..ingestors.urls import URLResolver
 from ..ingestors.tiktok import TikTokIngestor
+from ..refresh import MetadataRefresher
+from .pagination import encode_cursor, decode_cursor
 from .models import (
     SaveContentRequest,
     UpdateMetadataRequest,
@@ -17,46 +30,116 @@ from .models import (
     ContentListResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["content"])
 
 # Initialize repository
-repository = SQLiteRepository()
+repository = SQLiteRepository(
+    settings.database_path,
+    pool_size=settings.database_pool_size,
+    pragmas=settings.sqlite_pragmas,
+)
+
+# Short-link expansions are cached alongside the content
+url_resolver = URLResolver(db_path=settings.database_path, pragmas=settings.sqlite_pragmas)
+
+# YouTube quota usage, shared with the CLI through the same database
+youtube_quota = QuotaLedger(
+    settings.database_path,
+    daily_limit=settings.youtube_daily_quota,
+    pragmas=settings.sqlite_pragmas,
+)
 
 # Initialize ingestors with credentials from settings
 ingestors = {
-    ContentSource.YOUTUBE: YouTubeIngestor(api_key=settings.youtube_api_key),
+    ContentSource.YOUTUBE: YouTubeIngestor(api_key=settings.youtube_api_key, quota=youtube_quota),
     ContentSource.REDDIT: RedditIngestor(
         client_id=settings.reddit_client_id,
         client_secret=settings.reddit_client_secret,
         user_agent=settings.reddit_user_agent,
     ),
     ContentSource.INSTAGRAM: InstagramIngestor(),
-    ContentSource.TIKTOK: TikTokIngestor(),
+    ContentSource.TIKTOK: TikTokIngestor(url_resolver=url_resolver),
 }
 
+# Keeps saved items' view/like/comment counts current; run periodically by the app
+refresher = MetadataRefresher.from_settings(repository, ingestors)
 
-@router.post("/content", response_model=ContentItemResponse, status_code=201)
-async def save_content(request: SaveContentRequest):
-    """Save content from URL.
 
-    Fetches content metadata from the source platform and saves to the database.
-    Optionally accepts metadata overrides for drill-specific fields.
+# Ingestor clients (googleapiclient, PRAW, httpx) block on network I/O, so saves
+# run here instead of on the event loop. The pool size caps concurrent fetches.
+ingest_executor = ThreadPoolExecutor(
+    max_workers=settings.ingest_max_workers,
+    thread_name_prefix="ingest",
+)
+
+
+# Concurrent saves of the same content share one upstream fetch, and identical
+# saves (same overrides) also share one write
+fetch_flight = SingleFlight()
+save_flight = SingleFlight()
+
+
+def _fetch_and_save(ingestor: BaseIngestor, request: SaveContentRequest) -> Optional[ContentItem]:
+    """Fetch content, apply request overrides and save it. Blocking.
+
+    Duplicate concurrent requests for the same (source, id) are coalesced.
+
+    Args:
+        ingestor: Ingestor for the request's source
+        request: Save request with URL and optional metadata overrides
+
+    Returns:
+        Saved ContentItem, or None if the content could not be fetched
     """
-    # Get appropriate ingestor
-    ingestor = ingestors.get(request.source)
-    if not ingestor:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported content source: {request.source}"
-        )
+    content_id = ingestor.extract_id(request.url)
+    if content_id is None:
+        return _fetch_and_save_uncoalesced(ingestor, request, None)
 
-    # Fetch content from URL
-    content = ingestor.from_url(request.url)
-    if not content:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Could not fetch content from URL: {request.url}"
-        )
+    fetch_key = (request.source.value, content_id)
+    overrides = request.model_dump_json(exclude={"url"}, exclude_none=True)
+    return save_flight.do(
+        (*fetch_key, overrides), _fetch_and_save_uncoalesced, ingestor, request, fetch_key
+    )
+
+
+def _fetch_and_save_uncoalesced(
+    ingestor: BaseIngestor,
+    request: SaveContentRequest,
+    fetch_key: Optional[tuple[str, str]],
+) -> Optional[ContentItem]:
+    """Fetch (shared per fetch_key), apply overrides to a private copy, and save.
+
+    If the item is already saved and was fetched recently enough, the stored
+    copy is used instead of calling the upstream API (unless request.refresh).
+    A refetch only replaces upstream data: the stored copy's USER_COLUMNS
+    (tags, notes, drill metadata, saved_at, ...) are kept.
+    """
+    stored = None
+    if fetch_key is not None:
+        stored = repository.get_by_id(ContentSource(fetch_key[0]), fetch_key[1])
+
+    content = None
+    if stored is not None and not request.refresh and _is_fresh(stored):
+        logger.info(f"Using saved copy of {fetch_key[0]}/{fetch_key[1]}; skipping upstream fetch")
+        content = stored
+
+    fetched = content is None
+    if fetched:
+        if fetch_key is None:
+            content = ingestor.from_url(request.url)
+        else:
+            content = fetch_flight.do(fetch_key, ingestor.from_url, request.url)
+        if not content:
+            return None
+
+    # The fetched item may be shared with other in-flight saves
+    content = content.model_copy(deep=True)
+    if fetched and stored is not None:
+        for name in USER_COLUMNS:
+            setattr(content, name, getattr(stored, name))
+    overrides = request.model_dump(exclude={"url", "source", "refresh"}, exclude_none=True)
 
     # Apply basic metadata overrides if provided (especially useful for Instagram/TikTok)
     if request.title is not None:
@@ -78,24 +161,117 @@ async def save_content(request: SaveContentRequest):
     if request.age_group is not None:
         content.age_group = request.age_group
 
-    # Save to database
-    repository.save(content)
+    # Save to database; an already-saved item without new metadata needs no write
+    if fetched or overrides:
+        repository.save(content)
+    return content
+
+
+def _is_fresh(stored: ContentItem) -> bool:
+    """Whether a saved item was fetched within the refetch threshold.
+
+    Args:
+        stored: Saved ContentItem
+
+    Returns:
+        True if the saved copy can be used instead of refetching
+    """
+    max_age = settings.content_refetch_after_hours
+    if max_age <= 0:
+        return False
+
+    fetched_at = stored.fetched_at
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - fetched_at <= timedelta(hours=max_age)
+
+
+@router.post("/content", response_model=ContentItemResponse, status_code=201)
+async def save_content(request: SaveContentRequest):
+    """Save content from URL.
+
+    Fetches content metadata from the source platform and saves to the database.
+    Optionally accepts metadata overrides for drill-specific fields. The fetch
+    and save run on ingest_executor so slow upstream calls don't block other
+    requests. Content that is already saved is not fetched again unless
+    `refresh` is set or the saved copy is older than
+    CONTENT_REFETCH_AFTER_HOURS; any overrides are applied to the saved copy.
+    Returns 503 (with Retry-After when known) if the source's API is down.
+    """
+    # Get appropriate ingestor
+    ingestor = ingestors.get(request.source)
+    if not ingestor:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported content source: {request.source}"
+        )
+
+    loop = asyncio.get_running_loop()
+    try:
+        content = await loop.run_in_executor(ingest_executor, _fetch_and_save, ingestor, request)
+    except UpstreamUnavailableError as e:
+        # Transient: tell the client to come back rather than reporting "not found"
+        headers = None
+        if e.retry_after is not None:
+            headers = {"Retry-After": str(math.ceil(e.retry_after))}
+        raise HTTPException(status_code=503, detail=str(e), headers=headers)
+    if not content:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Could not fetch content from URL: {request.url}"
+        )
 
     return ContentItemResponse.model_validate(content)
 
 
-@router.get("/content", response_model=ContentListResponse)
-async def list_content(
+# The repository routes below are plain def: FastAPI runs them in its
+# threadpool, so blocking SQLite calls stay off the event loop.
+# Serialized here rather than through response_model, which would validate
+# the page a second time and encode it in Python. responses= keeps the
+# schema in the OpenAPI docs.
+@router.get("/content", response_model=None, responses={200: {"model": ContentListResponse}})
+def list_content(
     query: Optional[str] = Query(None, description="Search query"),
     source: Optional[ContentSource] = Query(None, description="Filter by source"),
     content_type: Optional[ContentType] = Query(None, description="Filter by type"),
     difficulty: Optional[str] = Query(None, description="Filter by difficulty"),
     limit: int = Query(10, ge=1, le=100, description="Maximum results"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Also count all matches (extra query)"),
+    include_metadata: bool = Query(True, description="Include source_metadata in each item"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated item fields to return, e.g. id,title,thumbnail_url"
+    ),
 ):
     """List and search content.
 
-    Supports filtering by various criteria and full-text search.
+    Supports filtering by various criteria and full-text search. Results are
+    paginated with an opaque cursor: pass a page's next_cursor back as
+    `cursor` (with the same filters) to get the following page. List views
+    that don't show source_metadata can pass include_metadata=false to skip
+    loading it; items then carry source_metadata: null.
+
+    With `fields`, only those columns are read from the database and each
+    item contains only the requested fields plus id.
     """
+    selected = None
+    if fields:
+        selected = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(selected) - set(ContentItemResponse.model_fields))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+        selected = list(dict.fromkeys(["id", *selected]))
+
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     # Build search criteria
     criteria = {}
     if source:
@@ -106,20 +282,47 @@ async def list_content(
         criteria["difficulty"] = difficulty
 
     # Search repository
-    if query:
-        results = repository.search(query, criteria=criteria, limit=limit)
-    else:
-        # Get all with filters
-        results = repository.search("", criteria=criteria, limit=limit)
-
-    return ContentListResponse(
-        items=[ContentItemResponse.model_validate(item) for item in results],
-        total=len(results)
+    try:
+        page = repository.search_page(
+            query or "",
+            criteria=criteria,
+            limit=limit,
+            after=after,
+            include_metadata=include_metadata,
+            fields=selected,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Cursor does not match this query")
+
+    total_count = None
+    if include_total:
+        total_count = repository.count(query or "", criteria=criteria)
+
+    next_cursor = encode_cursor(page.next_key) if page.next_key else None
+
+    if selected:
+        # Sparse items don't satisfy ContentItemResponse, so skip response_model
+        return JSONResponse(content=jsonable_encoder({
+            "items": [
+                {name: getattr(item, name) for name in selected}
+                for item in page.items
+            ],
+            "total": len(page.items),
+            "next_cursor": next_cursor,
+            "total_count": total_count,
+        }))
+
+    listing = ContentListResponse.from_items(
+        page.items,
+        next_cursor=next_cursor,
+        total_count=total_count,
+        include_metadata=include_metadata,
     )
+    return Response(content=listing.model_dump_json(), media_type="application/json")
 
 
 @router.get("/content/{content_id}", response_model=ContentItemResponse)
-async def get_content(content_id: str):
+def get_content(content_id: str):
     """Get a specific content item by ID."""
     content = repository.get(content_id)
     if not content:
@@ -132,39 +335,26 @@ async def get_content(content_id: str):
 
 
 @router.put("/content/{content_id}/metadata", response_model=ContentItemResponse)
-async def update_metadata(content_id: str, request: UpdateMetadataRequest):
+def update_metadata(content_id: str, request: UpdateMetadataRequest):
     """Update drill-specific metadata for a content item.
 
     Only updates fields that are explicitly provided (non-null).
     """
-    # Get existing content
-    content = repository.get(content_id)
+    fields = request.model_dump(exclude_none=True)
+
+    # Partial UPDATE ... RETURNING; no read-modify-write of the whole row
+    content = repository.update_metadata(content_id, fields)
     if not content:
         raise HTTPException(
             status_code=404,
             detail=f"Content not found: {content_id}"
         )
 
-    # Update metadata fields (only if provided)
-    if request.drill_tags is not None:
-        content.drill_tags = request.drill_tags
-    if request.drill_description is not None:
-        content.drill_description = request.drill_description
-    if request.difficulty is not None:
-        content.difficulty = request.difficulty
-    if request.equipment is not None:
-        content.equipment = request.equipment
-    if request.age_group is not None:
-        content.age_group = request.age_group
-
-    # Save updated content
-    repository.save(content)
-
     return ContentItemResponse.model_validate(content)
 
 
 @router.delete("/content/{content_id}", status_code=204)
-async def delete_content(content_id: str):
+def delete_content(content_id: str):
     """Delete a content item."""
     content = repository.get(content_id)
     if not content:
@@ -0,0 +1,414 @@
+"""Offline benchmarks: ingestors over recorded API responses, and content decoding.
+
+Record real YouTube/Reddit responses once (needs API credentials), then
+replay them as often as needed, with optional latency and failures:
+
+    python -m src.benchmark record data/fixtures --query "butterfly drill" \\
+        --youtube-url https://youtu.be/VIDEO_ID \\
+        --reddit-url https://www.reddit.com/r/hockeygoalies/comments/POST_ID/
+    python -m src.benchmark run data/fixtures --iterations 20 --concurrency 4 \\
+        --latency 0.1 --error-rate 0.05
+
+Decoding saved rows, serializing GET /content pages and timing the
+endpoint itself need no fixtures:
+
+    python -m src.benchmark decode --rows 10000
+    python -m src.benchmark listing --rows 10000 --requests 1000
+"""
+import json
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+import typer
+from pydantic import TypeAdapter
+from rich.console import Console
+from rich.table import Table
+
+from .api.models import ContentItemResponse, ContentListResponse
+from .config import settings
+from .ingestors.reddit import RedditIngestor
+from .ingestors.replay import FixtureStore, ReplayConditions, ReplayHttp, replay_session
+from .ingestors.youtube import YouTubeIngestor
+from .models.content import ContentItem, ContentSource, ContentType, Difficulty
+from .storage.sqlite import SQLiteRepository
+
+app = typer.Typer(help="Benchmark ingestors against recorded API responses, and content decoding")
+console = Console()
+
+# Written next to the fixtures: what was recorded, so runs replay the same calls
+MANIFEST_FILE = "benchmark.json"
+
+
+def build_ingestors(
+    store: FixtureStore,
+    mode: str,
+    conditions: Optional[ReplayConditions] = None,
+) -> dict:
+    """YouTube and Reddit ingestors whose HTTP goes through record/replay transports.
+
+    Returns:
+        Dict of source name -> (ingestor, transport)
+    """
+    youtube_http = ReplayHttp(store, mode, conditions)
+    reddit_session = replay_session(store, mode, conditions)
+    return {
+        "youtube": (
+            YouTubeIngestor(settings.youtube_api_key, http=youtube_http),
+            youtube_http,
+        ),
+        "reddit": (
+            RedditIngestor(
+                settings.reddit_client_id,
+                settings.reddit_client_secret,
+                settings.reddit_user_agent,
+                session=reddit_session,
+            ),
+            reddit_session.get_adapter("https://"),
+        ),
+    }
+
+
+def operations(ingestors: dict, manifest: dict) -> list[tuple[str, Callable[[], object]]]:
+    """The calls to record or benchmark: search, get_recent and from_url per source."""
+    max_results = manifest["max_results"]
+    calls = []
+    for name, (ingestor, _) in ingestors.items():
+        for query in manifest["queries"]:
+            calls.append((f"{name}.search", lambda i=ingestor, q=query: i.search(q, max_results=max_results)))
+        calls.append((f"{name}.get_recent", lambda i=ingestor: i.get_recent(max_results=max_results)))
+        for url in manifest["urls"].get(name, []):
+            calls.append((f"{name}.from_url", lambda i=ingestor, u=url: i.from_url(u)))
+    return calls
+
+
+def result_size(result) -> int:
+    """Items returned by an ingestor call."""
+    if result is None:
+        return 0
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+
+@app.command()
+def record(
+    fixtures: Path = typer.Argument(..., help="Fixture directory"),
+    query: list[str] = typer.Option(["goalie drills"], help="Search query (repeatable)"),
+    youtube_url: list[str] = typer.Option([], help="YouTube URL for from_url (repeatable)"),
+    reddit_url: list[str] = typer.Option([], help="Reddit URL for from_url (repeatable)"),
+    max_results: int = typer.Option(10, help="max_results for search and get_recent"),
+):
+    """
+    Call the real APIs once per operation and save every response.
+
+    Examples:
+        python -m src.benchmark record data/fixtures --query "butterfly drill"
+    """
+    manifest = {
+        "queries": query,
+        "urls": {"youtube": youtube_url, "reddit": reddit_url},
+        "max_results": max_results,
+        "youtube_discover_terms": settings.youtube_discover_terms,
+        "reddit_subreddits": settings.reddit_subreddits,
+    }
+    store = FixtureStore(fixtures)
+    ingestors = build_ingestors(store, "record")
+
+    # Caught up front: from_url returns None for these, which would record
+    # an empty operation instead of failing
+    unrecognized = [
+        url for name, (ingestor, _) in ingestors.items()
+        for url in manifest["urls"][name] if ingestor.extract_id(url) is None
+    ]
+    if unrecognized:
+        console.print(f"[red]Unrecognized URL(s): {', '.join(unrecognized)}[/red]")
+        raise typer.Exit(1)
+
+    for name, call in operations(ingestors, manifest):
+        try:
+            result = call()
+        except Exception as e:
+            console.print(f"[red]{name} failed: {e}[/red]")
+            continue
+        console.print(f"[green]{name}[/green]: {result_size(result)} items")
+
+    fixtures.mkdir(parents=True, exist_ok=True)
+    (fixtures / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    console.print(f"[dim]{len(store)} responses recorded in {fixtures}[/dim]")
+
+
+@app.command()
+def run(
+    fixtures: Path = typer.Argument(..., help="Fixture directory written by 'record'"),
+    iterations: int = typer.Option(10, help="Calls per operation"),
+    concurrency: int = typer.Option(1, help="Calls in flight at once"),
+    latency: float = typer.Option(0.0, help="Seconds added to each response"),
+    jitter: float = typer.Option(0.0, help="Up to this many extra seconds per response"),
+    error_rate: float = typer.Option(0.0, help="Fraction of responses that fail (0-1)"),
+    error_status: int = typer.Option(503, help="HTTP status of injected failures; 0 drops the connection"),
+    seed: Optional[int] = typer.Option(None, help="Random seed for jitter and failures"),
+    output: Optional[Path] = typer.Option(None, help="Also write results to this JSON file"),
+):
+    """
+    Replay recorded responses and measure ingestor throughput.
+
+    Examples:
+        python -m src.benchmark run data/fixtures --iterations 50 --concurrency 8
+        python -m src.benchmark run data/fixtures --latency 0.2 --error-rate 0.1 --seed 1
+    """
+    manifest_path = fixtures / MANIFEST_FILE
+    if not manifest_path.exists():
+        console.print(f"[red]No {MANIFEST_FILE} in {fixtures}. Run 'record' first.[/red]")
+        raise typer.Exit(1)
+    manifest = json.loads(manifest_path.read_text())
+
+    # Discover mode must make the same requests that were recorded
+    settings.youtube_discover_terms = manifest["youtube_discover_terms"]
+    settings.reddit_subreddits = manifest["reddit_subreddits"]
+
+    conditions = ReplayConditions(
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+        error_status=error_status or None,
+        seed=seed,
+    )
+    ingestors = build_ingestors(FixtureStore(fixtures), "replay", conditions)
+
+    calls_by_name: dict[str, list[Callable[[], object]]] = {}
+    for name, call in operations(ingestors, manifest):
+        calls_by_name.setdefault(name, []).append(call)
+
+    results = []
+    for name, calls in calls_by_name.items():
+        results.append(measure(name, calls, iterations, concurrency))
+
+    table = Table(title=f"Replay benchmark ({iterations} calls per operation, concurrency {concurrency})")
+    table.add_column("Operation", style="magenta")
+    table.add_column("Calls/s", justify="right", style="green")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("Items", justify="right", style="cyan")
+    table.add_column("Empty", justify="right", style="yellow")
+    table.add_column("Errors", justify="right", style="red")
+    for result in results:
+        table.add_row(
+            result["operation"],
+            f"{result['calls_per_second']:.1f}",
+            f"{result['p50_ms']:.1f}",
+            f"{result['p95_ms']:.1f}",
+            str(result["items"]),
+            str(result["empty"]),
+            str(result["errors"]),
+        )
+    console.print(table)
+
+    for name, (_, transport) in ingestors.items():
+        console.print(f"[dim]{name}: {transport.requests} HTTP requests, {transport.faults} injected failures[/dim]")
+
+    if output:
+        output.write_text(json.dumps(results, indent=2))
+
+
+def sample_items(count: int) -> list[ContentItem]:
+    """Saved-looking items with stats, tags and drill metadata filled in."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    difficulties = list(Difficulty)
+    return [
+        ContentItem(
+            id=f"vid{i:06d}",
+            source=ContentSource.YOUTUBE,
+            content_type=ContentType.VIDEO,
+            title=f"Butterfly slide drill {i}",
+            url=f"https://www.youtube.com/watch?v=vid{i:06d}",
+            description="Lateral push, seal the post, recover to the top of the crease. " * 3,
+            author="Goalie Coach",
+            published_at=start + timedelta(hours=i),
+            thumbnail_url=f"https://i.ytimg.com/vi/vid{i:06d}/hqdefault.jpg",
+            view_count=1000 + i,
+            like_count=50 + i % 100,
+            comment_count=i % 30,
+            source_metadata={"duration": "PT4M12S", "channel_id": "UC123", "tags": ["goalie", "drill"]},
+            tags=["butterfly", "lateral"],
+            drill_tags=["warmup", "post-to-post"],
+            drill_description="Three reps each side",
+            difficulty=difficulties[i % len(difficulties)],
+            equipment="pucks",
+            age_group="bantam",
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(iterations: int, call: Callable[[], object]) -> float:
+    """Fastest of `iterations` runs of `call`, in milliseconds."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+@app.command()
+def decode(
+    rows: int = typer.Option(10000, help="Rows to save and read back"),
+    page_size: int = typer.Option(100, help="Items per serialized GET /content page"),
+    iterations: int = typer.Option(5, help="Runs per measurement (the fastest is reported)"),
+):
+    """
+    Compare validated and trusted row decoding, and GET /content page serialization.
+
+    Examples:
+        python -m src.benchmark decode --rows 10000 --page-size 100
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        repo = SQLiteRepository(str(Path(directory) / "content.db"))
+        try:
+            repo.save_many(sample_items(rows))
+            with repo._pool.connection() as conn:
+                fetched = conn.execute("SELECT * FROM content").fetchall()
+        finally:
+            repo.close()
+
+    page = repo._decode_rows(fetched[:page_size])
+    adapter = TypeAdapter(ContentListResponse)
+
+    def response_model_page() -> bytes:
+        # A response_model route: the page is built, then FastAPI validates
+        # it again and encodes it in Python
+        listing = ContentListResponse(
+            items=[ContentItemResponse.model_validate(item) for item in page],
+            total=len(page),
+        )
+        return json.dumps(adapter.dump_python(adapter.validate_python(listing), mode="json")).encode()
+
+    def single_pass_page() -> bytes:
+        return ContentListResponse.from_items(page).model_dump_json().encode()
+
+    results = [
+        (f"decode {rows} rows (validated)",
+         best_of(iterations, lambda: [repo._row_to_content_item(row) for row in fetched])),
+        (f"decode {rows} rows (RowDecoder)", best_of(iterations, lambda: repo._decode_rows(fetched))),
+        (f"serialize {len(page)}-item page (response_model)", best_of(iterations * 10, response_model_page)),
+        (f"serialize {len(page)}-item page (single pass)", best_of(iterations * 10, single_pass_page)),
+    ]
+
+    table = Table(title=f"Decode benchmark (best of {iterations})")
+    table.add_column("Operation", style="magenta")
+    table.add_column("ms", justify="right", style="green")
+    for operation, ms in results:
+        table.add_row(operation, f"{ms:.2f}")
+    console.print(table)
+
+
+def percentile(durations: list[float], fraction: float) -> float:
+    """The `fraction` percentile of sorted `durations`, in milliseconds."""
+    if not durations:
+        return 0.0
+    return durations[min(int(len(durations) * fraction), len(durations) - 1)] * 1000
+
+
+@app.command()
+def listing(
+    rows: int = typer.Option(10000, help="Rows to save before listing"),
+    requests: int = typer.Option(500, help="GET /api/v1/content requests to time"),
+    limit: int = typer.Option(50, help="Page size requested (at most 100)"),
+    include_metadata: bool = typer.Option(True, help="Request source_metadata too"),
+):
+    """
+    Measure GET /api/v1/content latency end to end, through the ASGI app.
+
+    Requests page through the seeded rows by next_cursor, starting over at
+    the end, so deep pages are timed as well as the first.
+
+    Examples:
+        python -m src.benchmark listing --rows 10000 --requests 1000 --limit 100
+    """
+    # Imported here: the API modules open the configured database on import,
+    # which the replay benchmarks don't need
+    from fastapi.testclient import TestClient
+
+    from .api import routes
+    from .api.main import app as api_app
+
+    with tempfile.TemporaryDirectory() as directory:
+        repo = SQLiteRepository(str(Path(directory) / "content.db"))
+        configured = routes.repository
+        routes.repository = repo
+        try:
+            repo.save_many(sample_items(rows))
+            client = TestClient(api_app)
+            params = {"limit": limit, "include_metadata": include_metadata}
+            client.get("/api/v1/content", params=params).raise_for_status()  # Warm up
+
+            durations = []
+            wall_start = time.perf_counter()
+            cursor = None
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = client.get("/api/v1/content", params={**params, **({"cursor": cursor} if cursor else {})})
+                durations.append(time.perf_counter() - start)
+                response.raise_for_status()
+                cursor = response.json()["next_cursor"]
+            wall_time = time.perf_counter() - wall_start
+        finally:
+            routes.repository = configured
+            repo.close()
+
+    durations.sort()
+    table = Table(title=f"GET /api/v1/content ({requests} requests, limit {limit}, {rows} rows)")
+    table.add_column("p50 ms", justify="right", style="green")
+    table.add_column("p99 ms", justify="right", style="yellow")
+    table.add_column("max ms", justify="right", style="red")
+    table.add_column("Requests/s", justify="right", style="cyan")
+    table.add_row(
+        f"{percentile(durations, 0.50):.2f}",
+        f"{percentile(durations, 0.99):.2f}",
+        f"{durations[-1] * 1000:.2f}",
+        f"{requests / wall_time:.0f}",
+    )
+    console.print(table)
+
+
+def measure(name: str, calls: list[Callable[[], object]], iterations: int, concurrency: int) -> dict:
+    """Run `iterations` calls (cycling through `calls`) and summarize their latency.
+
+    Returns:
+        Dict with calls, errors, empty results, items, latency percentiles and calls per second
+    """
+    def timed(index: int) -> tuple[float, Optional[object], Optional[Exception]]:
+        start = time.perf_counter()
+        try:
+            result = calls[index % len(calls)]()
+        except Exception as e:
+            return time.perf_counter() - start, None, e
+        return time.perf_counter() - start, result, None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        outcomes = list(pool.map(timed, range(iterations)))
+    wall_time = time.perf_counter() - start
+
+    durations = sorted(duration for duration, _, _ in outcomes)
+    errors = sum(1 for _, _, error in outcomes if error is not None)
+    sizes = [result_size(result) for _, result, error in outcomes if error is None]
+    return {
+        "operation": name,
+        "calls": iterations,
+        "errors": errors,
+        "empty": sizes.count(0),
+        "items": sum(sizes),
+        "p50_ms": statistics.median(durations) * 1000 if durations else 0.0,
+        "p95_ms": durations[min(int(len(durations) * 0.95), len(durations) - 1)] * 1000 if durations else 0.0,
+        "calls_per_second": iterations / wall_time if wall_time > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    app()
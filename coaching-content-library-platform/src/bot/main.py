@@ -1,4 +1,5 @@
 """Discord bot for saving content to the library."""
+import asyncio
 import re
 import logging
 from typing import Optional
@@ -32,6 +33,14 @@ URL_PATTERNS = {
     ],
 }
 
+# How the bot waits on ingestion jobs (see POST /api/v1/jobs)
+JOB_POLL_INTERVAL = 1.0  # Seconds between status checks
+JOB_WAIT_TIMEOUT = 120.0  # Give up waiting (the job keeps running) after this many seconds
+
+
+class JobFailedError(Exception):
+    """Raised when an ingestion job finishes with status failed."""
+
 
 class ContentBot(commands.Bot):
     """Discord bot for content library management."""
@@ -46,6 +55,39 @@ class ContentBot(commands.Bot):
 
         self.api_base_url = settings.api_base_url
 
+    async def save_via_job(self, payload: dict) -> dict:
+        """Queue a save job and wait for it to finish.
+
+        Args:
+            payload: SaveContentRequest body
+
+        Returns:
+            The saved content
+
+        Raises:
+            JobFailedError: If the job failed
+            TimeoutError: If the job is still running after JOB_WAIT_TIMEOUT
+            httpx.HTTPStatusError: If the API rejects the request
+        """
+        async with httpx.AsyncClient(base_url=self.api_base_url, timeout=10.0) as client:
+            response = await client.post("/api/v1/jobs", json=payload)
+            response.raise_for_status()
+            job = response.json()
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + JOB_WAIT_TIMEOUT
+            while job["status"] in ("queued", "running"):
+                if loop.time() >= deadline:
+                    raise TimeoutError(f"Job {job['id']} is still {job['status']}")
+                await asyncio.sleep(JOB_POLL_INTERVAL)
+                response = await client.get(f"/api/v1/jobs/{job['id']}")
+                response.raise_for_status()
+                job = response.json()
+
+        if job["status"] == "failed":
+            raise JobFailedError(job.get("error") or "Unknown error")
+        return job["content"] or {}
+
     async def setup_hook(self):
         """Setup hook called before bot connects to Discord."""
         # Sync commands with Discord
@@ -285,16 +327,9 @@ class MetadataModal(discord.ui.Modal, title="Add Drill Metadata"):
         if self.age_group.value:
             payload["age_group"] = self.age_group.value
 
-        # Call API to save content
+        # Queue the save and wait for the job; bursts of links queue up on the API
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.bot.api_base_url}/api/v1/content",
-                    json=payload,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                content_data = response.json()
+            content_data = await self.bot.save_via_job(payload)
 
             # Create success embed
             embed = discord.Embed(
@@ -320,6 +355,18 @@ class MetadataModal(discord.ui.Modal, title="Add Drill Metadata"):
             await self.message.edit(view=self.view)
             self.view.stop()
 
+        except JobFailedError as e:
+            await interaction.followup.send(
+                f"❌ Failed to save content: {e}",
+                ephemeral=True
+            )
+
+        except TimeoutError:
+            await interaction.followup.send(
+                "⏳ Still saving - it will show up in the library when the fetch finishes.",
+                ephemeral=True
+            )
+
         except httpx.HTTPStatusError as e:
             error_msg = f"Failed to save content: {e.response.status_code}"
             try:
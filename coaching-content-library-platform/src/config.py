@@ -16,6 +16,49 @@ class Settings(BaseSettings):
     api_base_url: str = "http://localhost:8000"
 
     database_path: str = "data/content.db"
+    database_pool_size: int = 5
+
+    # Worker threads for blocking ingestor fetches in the API; caps concurrent saves
+    ingest_max_workers: int = 4
+    # Background ingestion jobs get their own worker threads, so a burst of
+    # queued jobs can't starve POST /content saves
+    job_max_workers: int = 2
+    # A job interrupted this many times (e.g. it keeps crashing the server) is failed
+    job_max_attempts: int = 3
+    # Re-saving content fetched within this many hours reuses the saved copy
+    # instead of calling the source API; 0 always re-fetches
+    content_refetch_after_hours: float = 168
+
+    # On-disk cache of YouTube/Reddit search responses (safe to delete)
+    response_cache_path: str = "data/cache.db"
+    response_cache_max_bytes: int = 50_000_000
+    # Endpoint -> seconds; see ingestors/cache.py for the endpoints and defaults
+    response_cache_ttls: dict[str, float] = Field(default={})
+
+    # Retries and circuit breaking for YouTube/Reddit API calls
+    upstream_max_attempts: int = 3  # Tries per call, including the first
+    upstream_backoff_base: float = 0.5  # Seconds; doubles per retry, with full jitter
+    upstream_backoff_max: float = 8.0
+    upstream_retry_deadline: float = 20.0  # Max seconds one call spends backing off
+    upstream_circuit_failure_threshold: int = 5  # Consecutive failures that open the circuit
+    upstream_circuit_reset_timeout: float = 30.0  # Seconds before a trial call
+
+    # Background refresh of view/like/comment counts for saved YouTube/Reddit items
+    refresh_interval: int = 21600  # Seconds between runs in the API server, 0 disables
+    refresh_max_age_hours: float = 24  # Items fetched more recently are left alone
+    refresh_max_items: int = 1000  # Items per run, most popular and stalest first
+    # Source -> batch lookups per minute / per run
+    refresh_calls_per_minute: dict[str, float] = Field(default={"youtube": 30, "reddit": 30})
+    refresh_max_calls: dict[str, int] = Field(default={"youtube": 20, "reddit": 20})
+
+    # SQLite PRAGMA profile applied to every pooled connection
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size: int = -20000  # Negative values are KiB (~20 MB)
+    sqlite_mmap_size: int = 268435456  # 256 MB
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_busy_timeout: int = 5000  # Milliseconds
+    sqlite_wal_checkpoint_interval: int = 300  # Seconds, 0 disables
     
     youtube_discover_terms: list[str] = Field(default=[
         "goalie drills",
@@ -24,6 +67,14 @@ class Settings(BaseSettings):
         "nhl goalie drills",
         "hockey goalie coaching"
     ])
+    # Discover term searches in flight at once. Each costs 100 quota units and
+    # searches stop once enough videos are found, so keep this below the
+    # number of terms or every term is searched.
+    youtube_discover_concurrency: int = 2
+    youtube_discover_term_timeout: float = 10.0  # Seconds per term search, retries included
+    youtube_daily_quota: int = 10000  # Data API units per day (resets midnight Pacific)
+    # Units discover searches leave untouched, so saves and manual searches still work
+    youtube_quota_discover_reserve: int = 2000
     
     reddit_subreddits: list[str] = Field(default=[
         "hockeygoalies",
@@ -54,6 +105,18 @@ class Settings(BaseSettings):
     
     prefetch_multiplier: int = 5
 
+    @property
+    def sqlite_pragmas(self) -> dict:
+        """PRAGMA name -> value for SQLiteRepository connections."""
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "cache_size": self.sqlite_cache_size,
+            "mmap_size": self.sqlite_mmap_size,
+            "temp_store": self.sqlite_temp_store,
+            "busy_timeout": self.sqlite_busy_timeout,
+        }
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
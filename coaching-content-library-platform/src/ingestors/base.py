@@ -1,6 +1,26 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Optional
 from ..models.content import ContentItem, ContentSource
+from .resilience import Resilience, resilience_for
+
+
+@dataclass(frozen=True)
+class Tombstone:
+    """An item that can no longer be fetched as content.
+
+    Returned by lookup_many() for items the source reports gone.
+
+    Attributes:
+        id: Content ID
+        reason: "deleted" (by its author), "removed" (by moderators or
+            the platform) or "not_found" (the source returned nothing for the ID)
+        detail: The source's own reason, when it gave one
+    """
+    id: str
+    reason: str
+    detail: Optional[str] = None
+
 
 class BaseIngestor(ABC):
     """
@@ -17,6 +37,20 @@ class BaseIngestor(ABC):
     def source(self) -> ContentSource:
         """Return the ContentSource enum for this ingestor."""
         pass
+
+    @property
+    def resilience(self) -> Resilience:
+        """
+        Retry and circuit-breaker policy for this source's API calls.
+        Shared by every ingestor of the same source unless one is assigned.
+        """
+        if getattr(self, "_resilience", None) is None:
+            self._resilience = resilience_for(self.source)
+        return self._resilience
+
+    @resilience.setter
+    def resilience(self, value: Resilience) -> None:
+        self._resilience = value
     
     @abstractmethod
     def search(
@@ -46,6 +80,27 @@ class BaseIngestor(ABC):
         """
         pass
     
+    def get_many(self, content_ids: list[str]) -> dict[str, ContentItem]:
+        """
+        Fetch several pieces of content by source ID.
+        Default: one get_by_id() per ID. Override when the source has a batch endpoint.
+        Returns a dict of ID -> ContentItem; IDs that weren't found are omitted.
+        """
+        items = {}
+        for content_id in dict.fromkeys(content_ids):
+            item = self.get_by_id(content_id)
+            if item:
+                items[content_id] = item
+        return items
+
+    def extract_id(self, url: str) -> Optional[str]:
+        """
+        Get the source ID a URL refers to, without any network calls.
+        Used to recognize duplicate requests for the same content.
+        Returns None if the ID can't be determined from the URL alone.
+        """
+        return None
+
     @abstractmethod
     def get_recent(
         self, 
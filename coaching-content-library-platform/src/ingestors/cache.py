@@ -0,0 +1,214 @@
+"""On-disk TTL cache for upstream API responses."""
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ..storage.pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays valid, per endpoint
+DEFAULT_TTLS = {
+    "youtube.search": 3600,
+    "youtube.videos": 6 * 3600,
+    "reddit.search": 1800,
+}
+
+
+class ResponseCache:
+    """Content-addressed cache of JSON API responses in SQLite.
+
+    Entries are keyed on a hash of the endpoint name and its normalized
+    request parameters, expire after a per-endpoint TTL, and are evicted
+    least-recently-used first once the cache grows past `max_bytes`.
+    Only successful responses should be stored. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/cache.db",
+        ttls: Optional[dict[str, float]] = None,
+        default_ttl: float = 3600,
+        max_bytes: int = 50_000_000,
+        pragmas: Optional[dict] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file for cached responses (safe to delete)
+            ttls: Endpoint -> TTL in seconds, overriding DEFAULT_TTLS
+            default_ttl: TTL for endpoints not in `ttls`
+            max_bytes: Total size of stored responses to keep
+            pragmas: PRAGMA profile applied to each connection
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = ConnectionPool(db_path, size=2, pragmas=pragmas)
+        with self._pool.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict) -> str:
+        """Hash an endpoint and its parameters into a cache key.
+
+        Parameter order and runs of whitespace in string values don't
+        change the key. Callers normalize anything else (e.g. casefolding
+        case-insensitive queries) before calling.
+
+        Args:
+            endpoint: Logical endpoint name, e.g. "youtube.search"
+            params: JSON-serializable request parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        def normalize(value):
+            if isinstance(value, str):
+                return " ".join(value.split())
+            if isinstance(value, (list, tuple)):
+                return [normalize(v) for v in value]
+            if isinstance(value, dict):
+                return {k: normalize(v) for k, v in value.items()}
+            return value
+
+        canonical = json.dumps(
+            {"endpoint": endpoint, "params": normalize(params)},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, endpoint: str, params: dict) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            endpoint: Logical endpoint name
+            params: Request parameters
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        with self._pool.transaction() as conn:
+            rows = conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ? AND expires_at > ? RETURNING value",
+                (now, key, now),
+            ).fetchall()
+
+        with self._stats_lock:
+            if rows:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return json.loads(rows[0]["value"]) if rows else None
+
+    def set(self, endpoint: str, params: dict, value: Any) -> None:
+        """Store a response and evict entries beyond the size budget.
+
+        Args:
+            endpoint: Logical endpoint name
+            params: Request parameters
+            value: JSON-serializable response
+        """
+        key = self.make_key(endpoint, params)
+        encoded = json.dumps(value, separators=(",", ":"))
+        now = time.time()
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+
+        with self._pool.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, encoded, len(encoded), now + ttl, now),
+            )
+            expired = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,)).rowcount
+            # Keep the most recently used entries that fit in max_bytes
+            evicted = conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running
+                        FROM responses
+                    ) WHERE running > ?
+                )
+                """,
+                (self.max_bytes,),
+            ).rowcount
+
+        if expired or evicted:
+            with self._stats_lock:
+                self.evictions += evicted
+            logger.debug(f"Response cache dropped {expired} expired and evicted {evicted} entries")
+
+    def get_or_fetch(self, endpoint: str, params: dict, fetch: Callable[[], Any]) -> Any:
+        """Return the cached response, or call `fetch` and cache its result.
+
+        Exceptions from `fetch` propagate and nothing is cached.
+
+        Args:
+            endpoint: Logical endpoint name
+            params: Request parameters
+            fetch: Performs the real request
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        cached = self.get(endpoint, params)
+        if cached is not None:
+            return cached
+
+        value = fetch()
+        self.set(endpoint, params, value)
+        return value
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters and current size.
+
+        Returns:
+            Dict with hits, misses, evictions, entries and bytes
+        """
+        with self._pool.connection() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        with self._stats_lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._pool.transaction() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._pool.close()
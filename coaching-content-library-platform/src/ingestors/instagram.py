@@ -4,11 +4,11 @@ Creates minimal ContentItem from Instagram URLs.
 Metadata should be provided by the user when saving.
 """
 import logging
-import re
 from typing import Optional
 
 from ..models.content import ContentItem, ContentSource, ContentType
 from .base import BaseIngestor
+from .urls import canonicalize
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +115,17 @@ class InstagramIngestor(BaseIngestor):
             },
         )
 
+    def extract_id(self, url: str) -> Optional[str]:
+        """Get the post ID from a URL without fetching it.
+
+        Args:
+            url: Content URL
+
+        Returns:
+            ID if the URL is recognized, None otherwise
+        """
+        return self._extract_shortcode(url)
+
     def _extract_shortcode(self, url: str) -> Optional[str]:
         """Extract shortcode from Instagram URL.
 
@@ -124,14 +135,8 @@ class InstagramIngestor(BaseIngestor):
         Returns:
             Shortcode if found, None otherwise
         """
-        # Match patterns like:
-        # https://www.instagram.com/p/SHORTCODE/
-        # https://www.instagram.com/reel/SHORTCODE/
-        # https://instagram.com/p/SHORTCODE/
-        match = re.search(r'instagram\.com/(?:p|reel)/([A-Za-z0-9_-]+)', url)
-        if match:
-            return match.group(1)
-        return None
+        ref = canonicalize(ContentSource.INSTAGRAM, url)
+        return ref.id if ref else None
 
     def _determine_content_type(self, url: str) -> ContentType:
         """Determine content type based on URL.
@@ -0,0 +1,196 @@
+"""Daily API quota accounting shared across processes."""
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from ..storage.pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# YouTube Data API v3 cost per call, in quota units
+YOUTUBE_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+}
+
+# YouTube quotas reset at midnight Pacific time
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# Recorded against the day when the API reports the quota is used up
+_EXHAUSTED = "exhausted"
+
+
+class QuotaExhaustedError(RuntimeError):
+    """Raised instead of making a call the remaining quota can't cover."""
+
+
+class QuotaLedger:
+    """Track quota units spent per call type per day in SQLite.
+
+    The API server, CLI and bot can share one database file, so every
+    process sees the same remaining budget. Units are charged when a call
+    is made, whether or not it succeeds, since the API bills failed
+    requests too.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/content.db",
+        daily_limit: int = 10000,
+        costs: Optional[dict[str, int]] = None,
+        api: str = "youtube",
+        pragmas: Optional[dict] = None,
+    ):
+        """Initialize the ledger.
+
+        Args:
+            db_path: Path to SQLite database file
+            daily_limit: Units available per day
+            costs: Call type -> units; defaults to YOUTUBE_COSTS
+            api: Name the usage is recorded under
+            pragmas: PRAGMA profile applied to each connection
+        """
+        self.daily_limit = daily_limit
+        self.costs = dict(costs or YOUTUBE_COSTS)
+        self.api = api
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = ConnectionPool(db_path, size=2, pragmas=pragmas)
+        with self._pool.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS quota_usage (
+                    api TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    call TEXT NOT NULL,
+                    calls INTEGER NOT NULL DEFAULT 0,
+                    units INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (api, day, call)
+                )
+            """)
+
+    @staticmethod
+    def today() -> str:
+        """Current quota day (Pacific time) as YYYY-MM-DD."""
+        return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+    @staticmethod
+    def seconds_until_reset() -> float:
+        """Seconds until the quota day rolls over at midnight Pacific time."""
+        now = datetime.now(QUOTA_TIMEZONE)
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), QUOTA_TIMEZONE)
+        return (midnight - now).total_seconds()
+
+    def cost(self, call: str) -> int:
+        """Units one call of this type costs (1 for unknown calls)."""
+        return self.costs.get(call, 1)
+
+    def charge(self, call: str, count: int = 1) -> None:
+        """Record calls against today's budget unconditionally.
+
+        Args:
+            call: Call type, e.g. "search.list"
+            count: Number of calls made
+        """
+        with self._pool.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO quota_usage (api, day, call, calls, units) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (api, day, call) DO UPDATE SET
+                    calls = calls + excluded.calls,
+                    units = units + excluded.units
+                """,
+                (self.api, self.today(), call, count, self.cost(call) * count),
+            )
+
+    def try_charge(self, call: str, reserve: int = 0) -> bool:
+        """Charge one call only if it leaves at least `reserve` units unspent.
+
+        The check and the charge are one statement, so concurrent callers
+        (threads or processes) can't overspend the budget between them.
+
+        Args:
+            call: Call type, e.g. "search.list"
+            reserve: Units to hold back for more important work
+
+        Returns:
+            True if the call was charged and may be made
+        """
+        day = self.today()
+        cost = self.cost(call)
+        with self._pool.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO quota_usage (api, day, call, calls, units)
+                SELECT ?, ?, ?, 1, ?
+                WHERE (SELECT COALESCE(SUM(units), 0) FROM quota_usage WHERE api = ? AND day = ?)
+                      + ? <= ? - ?
+                ON CONFLICT (api, day, call) DO UPDATE SET
+                    calls = calls + 1,
+                    units = units + excluded.units
+                """,
+                (self.api, day, call, cost, self.api, day, cost, self.daily_limit, reserve),
+            )
+            return cursor.rowcount > 0
+
+    def mark_exhausted(self) -> None:
+        """Record that the API rejected a call for quota, so remaining() is 0 until reset.
+
+        Covers quota spent outside this ledger (other keys' projects, the
+        API console, clock skew around the reset).
+        """
+        shortfall = self.remaining()
+        if shortfall <= 0:
+            return
+        with self._pool.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO quota_usage (api, day, call, calls, units) VALUES (?, ?, ?, 0, ?)
+                ON CONFLICT (api, day, call) DO UPDATE SET units = units + excluded.units
+                """,
+                (self.api, self.today(), _EXHAUSTED, shortfall),
+            )
+        logger.warning(f"{self.api} quota exhausted for {self.today()}")
+
+    def used(self) -> int:
+        """Units spent today."""
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(units), 0) FROM quota_usage WHERE api = ? AND day = ?",
+                (self.api, self.today()),
+            ).fetchone()
+        return row[0]
+
+    def remaining(self) -> int:
+        """Units left today (never negative)."""
+        return max(0, self.daily_limit - self.used())
+
+    def can_afford(self, call: str, count: int = 1, reserve: int = 0) -> bool:
+        """Whether calls fit in today's budget while keeping `reserve` units unspent.
+
+        Args:
+            call: Call type
+            count: Number of calls
+            reserve: Units to hold back for more important work
+
+        Returns:
+            True if the calls can be made
+        """
+        return self.remaining() - self.cost(call) * count >= reserve
+
+    def usage(self) -> dict[str, dict[str, int]]:
+        """Today's calls and units per call type.
+
+        Returns:
+            Call type -> {"calls": n, "units": n}
+        """
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT call, calls, units FROM quota_usage WHERE api = ? AND day = ? ORDER BY units DESC",
+                (self.api, self.today()),
+            ).fetchall()
+        return {row["call"]: {"calls": row["calls"], "units": row["units"]} for row in rows}
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._pool.close()
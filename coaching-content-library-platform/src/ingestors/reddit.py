@@ -1,32 +1,50 @@
 """Reddit content ingestor."""
 import logging
-import re
-from typing import Optional
+from typing import Optional, Union
 from datetime import datetime
 import praw
+import requests
 from prawcore.exceptions import NotFound, Forbidden
 
 from ..models.content import ContentItem, ContentSource, ContentType
 from ..config import settings
-from .base import BaseIngestor
+from .base import BaseIngestor, Tombstone
+from .cache import ResponseCache
+from .resilience import CircuitOpenError, UpstreamUnavailableError
+from .urls import canonicalize
 
 logger = logging.getLogger(__name__)
 
+# Reddit's /api/info accepts at most this many fullnames per request
+INFO_BATCH_SIZE = 100
+
 
 class RedditIngestor(BaseIngestor):
     """Ingestor for Reddit posts using PRAW."""
 
-    def __init__(self, client_id: str, client_secret: str, user_agent: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        user_agent: str,
+        cache: Optional[ResponseCache] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """Initialize Reddit ingestor.
 
         Args:
             client_id: Reddit API client ID
             client_secret: Reddit API client secret
             user_agent: User agent string
+            cache: Optional response cache for searches
+            session: requests session for PRAW's HTTP calls
+                (e.g. replay.replay_session()); PRAW's own if None
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_agent = user_agent
+        self.cache = cache
+        self.session = session
         self._reddit = None
 
     @property
@@ -38,10 +56,12 @@ class RedditIngestor(BaseIngestor):
     def reddit(self):
         """Lazy-load the Reddit API client."""
         if self._reddit is None:
+            requestor_kwargs = {"session": self.session} if self.session is not None else None
             self._reddit = praw.Reddit(
                 client_id=self.client_id,
                 client_secret=self.client_secret,
                 user_agent=self.user_agent,
+                requestor_kwargs=requestor_kwargs,
             )
         return self._reddit
 
@@ -52,6 +72,7 @@ class RedditIngestor(BaseIngestor):
         subreddits: Optional[list[str]] = None,
         sort: str = "relevance",
         time_filter: str = "all",
+        raise_errors: bool = False,
         **kwargs
     ) -> list[ContentItem]:
         """Search for Reddit posts matching the query.
@@ -62,47 +83,99 @@ class RedditIngestor(BaseIngestor):
             subreddits: Optional list of subreddit names to search within
             sort: Sort order - "relevance", "hot", "new", "top" (default: "relevance")
             time_filter: Time filter - "all", "day", "week", "month", "year" (default: "all")
+            raise_errors: Raise API and outage errors instead of logging them
+                and returning [], for callers that report them
             **kwargs: Additional Reddit-specific parameters
 
         Returns:
             List of ContentItem objects
         """
         try:
-            # Determine which subreddit(s) to search
-            if subreddits:
-                # Join multiple subreddits with '+'
-                subreddit_str = '+'.join(subreddits)
-            else:
-                subreddit_str = "all"
-
-            subreddit = self.reddit.subreddit(subreddit_str)
-
-            # Perform the search
-            search_results = subreddit.search(
-                query=query,
-                sort=sort,
-                time_filter=time_filter,
-                limit=max_results,
-                **kwargs
+            if self.cache is None:
+                return self.resilience.call(
+                    self._search, query, max_results, subreddits, sort, time_filter, **kwargs
+                )
+
+            # Reddit search is case-insensitive; subreddit order doesn't matter
+            params = {
+                "query": query.casefold(),
+                "max_results": max_results,
+                "subreddits": sorted(s.casefold() for s in subreddits or []),
+                "sort": sort,
+                "time_filter": time_filter,
+                **kwargs,
+            }
+            cached = self.cache.get_or_fetch(
+                "reddit.search",
+                params,
+                lambda: [
+                    item.model_dump(mode="json")
+                    for item in self.resilience.call(
+                        self._search, query, max_results, subreddits, sort, time_filter, **kwargs
+                    )
+                ],
             )
+            return [ContentItem.model_validate(item) for item in cached]
 
-            # Map results to ContentItem objects
-            content_items = []
-            for submission in search_results:
-                try:
-                    content_item = self._map_to_content_item(submission)
-                    if content_item:  # Only add if not deleted/removed
-                        content_items.append(content_item)
-                except Exception as e:
-                    logger.error(f"Error mapping submission {submission.id}: {e}")
-                    continue
-
-            return content_items
-
+        except UpstreamUnavailableError as e:
+            if raise_errors:
+                raise
+            logger.warning(f"Skipping Reddit search: {e}")
+            return []
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"Reddit API error during search: {e}")
             return []
 
+    def _search(
+        self,
+        query: str,
+        max_results: int,
+        subreddits: Optional[list[str]],
+        sort: str,
+        time_filter: str,
+        **kwargs
+    ) -> list[ContentItem]:
+        """Run a search against the Reddit API.
+
+        Raises on API errors (so failed searches are never cached);
+        submissions that fail to map are skipped.
+
+        Returns:
+            List of ContentItem objects
+        """
+        # Determine which subreddit(s) to search
+        if subreddits:
+            # Join multiple subreddits with '+'
+            subreddit_str = '+'.join(subreddits)
+        else:
+            subreddit_str = "all"
+
+        subreddit = self.reddit.subreddit(subreddit_str)
+
+        # Perform the search
+        search_results = subreddit.search(
+            query=query,
+            sort=sort,
+            time_filter=time_filter,
+            limit=max_results,
+            **kwargs
+        )
+
+        # Map results to ContentItem objects
+        content_items = []
+        for submission in search_results:
+            try:
+                content_item = self._map_to_content_item(submission)
+                if content_item:  # Only add if not deleted/removed
+                    content_items.append(content_item)
+            except Exception as e:
+                logger.error(f"Error mapping submission {submission.id}: {e}")
+                continue
+
+        return content_items
+
     def get_by_id(self, content_id: str) -> Optional[ContentItem]:
         """Fetch a specific Reddit post by its submission ID.
 
@@ -111,13 +184,16 @@ class RedditIngestor(BaseIngestor):
 
         Returns:
             ContentItem if found and accessible, None otherwise
+
+        Raises:
+            UpstreamUnavailableError: If Reddit is down or keeps failing
         """
         try:
-            submission = self.reddit.submission(id=content_id)
-            # Access an attribute to trigger the fetch
-            _ = submission.title
+            submission = self.resilience.call(self._fetch_submission, content_id)
             return self._map_to_content_item(submission)
 
+        except UpstreamUnavailableError:
+            raise
         except NotFound:
             logger.warning(f"Submission not found with ID: {content_id}")
             return None
@@ -128,6 +204,89 @@ class RedditIngestor(BaseIngestor):
             logger.error(f"Error fetching submission {content_id}: {e}")
             return None
 
+    def get_many(self, content_ids: list[str]) -> dict[str, ContentItem]:
+        """Fetch many submissions, INFO_BATCH_SIZE per API call.
+
+        Args:
+            content_ids: Reddit submission IDs (duplicates are fetched once)
+
+        Returns:
+            Dict of submission ID -> ContentItem, in request order. Deleted,
+            removed and missing posts are omitted; use lookup_many() to see why.
+        """
+        return {
+            content_id: result
+            for content_id, result in self.lookup_many(content_ids).items()
+            if isinstance(result, ContentItem)
+        }
+
+    def lookup_many(self, content_ids: list[str]) -> dict[str, Union[ContentItem, Tombstone]]:
+        """Look up many submissions through Reddit's info endpoint.
+
+        Submissions are requested INFO_BATCH_SIZE fullnames at a time, so
+        refreshing a few thousand saved posts takes a few dozen calls.
+
+        Args:
+            content_ids: Reddit submission IDs (duplicates are fetched once)
+
+        Returns:
+            Dict of submission ID -> ContentItem, or Tombstone for posts
+            that were deleted, removed or not found, in request order. IDs
+            in a batch whose API call failed are omitted (their state is
+            unknown, not gone).
+        """
+        unique_ids = list(dict.fromkeys(content_ids))
+        results: dict[str, Union[ContentItem, Tombstone]] = {}
+
+        for start in range(0, len(unique_ids), INFO_BATCH_SIZE):
+            chunk = unique_ids[start:start + INFO_BATCH_SIZE]
+            fullnames = [f"t3_{content_id}" for content_id in chunk]
+            try:
+                submissions = self.resilience.call(
+                    lambda: list(self.reddit.info(fullnames=fullnames))
+                )
+            except CircuitOpenError as e:
+                logger.warning(f"Not looking up {len(unique_ids) - start} submissions: {e}")
+                break
+            except Exception as e:
+                logger.error(f"Reddit API error looking up {len(chunk)} submissions: {e}")
+                continue
+
+            returned = set()
+            for submission in submissions:
+                returned.add(submission.id)
+                tombstone = self._tombstone(submission)
+                if tombstone:
+                    results[submission.id] = tombstone
+                    continue
+                try:
+                    results[submission.id] = self._map_to_content_item(submission)
+                except Exception as e:
+                    logger.error(f"Error mapping submission {submission.id}: {e}")
+
+            # info() silently skips IDs that don't exist
+            for content_id in chunk:
+                if content_id not in returned:
+                    results[content_id] = Tombstone(content_id, "not_found")
+
+        return {content_id: results[content_id] for content_id in unique_ids if content_id in results}
+
+    def _tombstone(self, submission) -> Optional[Tombstone]:
+        """Tombstone for a deleted or removed submission, None if it's live."""
+        category = submission.removed_by_category
+        if category == "deleted" or (category is None and submission.author is None):
+            return Tombstone(submission.id, "deleted", category)
+        if category is not None:
+            return Tombstone(submission.id, "removed", category)
+        return None
+
+    def _fetch_submission(self, content_id: str):
+        """Load a submission from the API (PRAW objects are lazy)."""
+        submission = self.reddit.submission(id=content_id)
+        # Access an attribute to trigger the fetch
+        _ = submission.title
+        return submission
+
     def from_url(self, url: str) -> Optional[ContentItem]:
         """Fetch a Reddit post from its URL.
 
@@ -144,6 +303,17 @@ class RedditIngestor(BaseIngestor):
 
         return self.get_by_id(submission_id)
 
+    def extract_id(self, url: str) -> Optional[str]:
+        """Get the submission ID from a URL without fetching it.
+
+        Args:
+            url: Content URL
+
+        Returns:
+            ID if the URL is recognized, None otherwise
+        """
+        return self._extract_submission_id(url)
+
     def _extract_submission_id(self, url: str) -> Optional[str]:
         """Extract submission ID from Reddit URL.
 
@@ -156,12 +326,8 @@ class RedditIngestor(BaseIngestor):
         Returns:
             Submission ID if found, None otherwise
         """
-        # Reddit URL pattern: reddit.com/r/subreddit/comments/ID/...
-        match = re.search(r'reddit\.com/r/\w+/comments/([A-Za-z0-9]+)', url)
-        if match:
-            return match.group(1)
-
-        return None
+        ref = canonicalize(ContentSource.REDDIT, url)
+        return ref.id if ref else None
 
     def get_recent(self, max_results: int = 10, sort: str = "hot") -> list[ContentItem]:
         """Get recent posts from configured subreddits.
@@ -184,11 +350,12 @@ class RedditIngestor(BaseIngestor):
             subreddit_str = '+'.join(settings.reddit_subreddits)
             subreddit = self.reddit.subreddit(subreddit_str)
 
-            # Fetch posts based on sort method
+            # Fetch posts based on sort method (listings are lazy; list() makes the calls)
             if sort == "new":
-                submissions = subreddit.new(limit=max_results)
+                listing = subreddit.new
             else:  # Default to "hot"
-                submissions = subreddit.hot(limit=max_results)
+                listing = subreddit.hot
+            submissions = self.resilience.call(lambda: list(listing(limit=max_results)))
 
             # Map submissions to ContentItem objects
             content_items = []
@@ -0,0 +1,273 @@
+"""Async Reddit ingestion over httpx.
+
+PRAW is synchronous and pages lazily, so every listing page is a blocking
+round trip. AsyncRedditIngestor talks to Reddit's JSON API directly with
+an httpx.AsyncClient, fetching subreddits concurrently, and maps results
+with RedditIngestor's _map_to_content_item so items are identical to the
+PRAW path. It is still a RedditIngestor, so the sync methods keep working.
+"""
+import asyncio
+import heapq
+import logging
+import time
+from itertools import chain, zip_longest
+from typing import Any, Optional
+
+import httpx
+
+from ..config import settings
+from ..models.content import ContentItem
+from .reddit import RedditIngestor
+
+logger = logging.getLogger(__name__)
+
+REDDIT_AUTH_URL = "https://www.reddit.com/api/v1/access_token"
+REDDIT_API_URL = "https://oauth.reddit.com"
+
+# Reddit returns at most this many items per listing page
+LISTING_PAGE_SIZE = 100
+
+# Refresh the app token this many seconds before Reddit expires it
+TOKEN_EXPIRY_MARGIN = 60
+
+
+class ListingSubmission:
+    """Attribute view of a submission from listing JSON.
+
+    Looks enough like a PRAW Submission for RedditIngestor._map_to_content_item:
+    missing fields raise AttributeError (so hasattr/getattr defaults work)
+    and deleted authors read as None, as in PRAW.
+    """
+
+    def __init__(self, data: dict):
+        """Wrap the "data" object of a t3 listing child."""
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            value = self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        if name == "author" and value == "[deleted]":
+            return None
+        return value
+
+
+class AsyncRedditIngestor(RedditIngestor):
+    """RedditIngestor with async, concurrent search and discover.
+
+    Use from async code (FastAPI handlers, the Discord bot) without
+    offloading to threads. Call aclose() when done to release connections.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        user_agent: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        api_url: str = REDDIT_API_URL,
+        auth_url: str = REDDIT_AUTH_URL,
+        timeout: float = 10.0,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            client_id: Reddit API client ID
+            client_secret: Reddit API client secret
+            user_agent: User agent string
+            transport: httpx transport override (e.g. httpx.MockTransport in tests)
+            api_url: Base URL for API calls
+            auth_url: Token endpoint for app-only OAuth
+            timeout: Seconds per HTTP request
+        """
+        super().__init__(client_id, client_secret, user_agent)
+        self.api_url = api_url.rstrip("/")
+        self.auth_url = auth_url
+        self.timeout = timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Lazy-load the HTTP client (must be first used inside an event loop)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent},
+            )
+            self._token_lock = asyncio.Lock()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def asearch(
+        self,
+        query: str,
+        max_results: int = 10,
+        subreddits: Optional[list[str]] = None,
+        sort: str = "relevance",
+        time_filter: str = "all",
+    ) -> list[ContentItem]:
+        """Search Reddit, querying each subreddit concurrently.
+
+        Args:
+            query: Search terms (e.g., "goalie drills")
+            max_results: Maximum number of results to return
+            subreddits: Optional list of subreddit names to search within
+            sort: Sort order - "relevance", "hot", "new", "top" (default: "relevance")
+            time_filter: Time filter - "all", "day", "week", "month", "year" (default: "all")
+
+        Returns:
+            List of ContentItem objects; empty if Reddit is unavailable
+        """
+        params = {"q": query, "sort": sort, "t": time_filter, "restrict_sr": "1"}
+        try:
+            listings = await asyncio.gather(*(
+                self._listing(f"/r/{subreddit}/search", max_results, params)
+                for subreddit in subreddits or ["all"]
+            ))
+        except Exception as e:
+            logger.error(f"Reddit API error during search: {e}")
+            return []
+        return self._merge(listings, sort, max_results)
+
+    async def aget_recent(self, max_results: int = 10, sort: str = "hot") -> list[ContentItem]:
+        """Get hot or new posts from settings.reddit_subreddits, fetched concurrently.
+
+        Args:
+            max_results: Maximum number of results to return
+            sort: Sorting method - "hot" (default) or "new"
+
+        Returns:
+            List of ContentItem objects; empty if Reddit is unavailable
+        """
+        if not settings.reddit_subreddits:
+            logger.warning("No subreddits configured in settings.reddit_subreddits")
+            return []
+
+        listing = "new" if sort == "new" else "hot"
+        try:
+            listings = await asyncio.gather(*(
+                self._listing(f"/r/{subreddit}/{listing}", max_results)
+                for subreddit in settings.reddit_subreddits
+            ))
+        except Exception as e:
+            logger.error(f"Reddit API error in get_recent: {e}")
+            return []
+
+        items = self._merge(listings, listing, max_results)
+        logger.info(f"Retrieved {len(items)} {listing} posts from {len(settings.reddit_subreddits)} subreddits")
+        return items
+
+    async def _listing(
+        self,
+        path: str,
+        max_results: int,
+        params: Optional[dict] = None,
+    ) -> list[ContentItem]:
+        """Page through one listing until max_results items or the end.
+
+        Pages of one listing are sequential (each needs the previous
+        page's cursor); different listings run concurrently.
+
+        Returns:
+            Mapped items, deleted/removed posts skipped
+        """
+        items: list[ContentItem] = []
+        after = None
+        while len(items) < max_results:
+            page_params = {
+                **(params or {}),
+                "limit": min(LISTING_PAGE_SIZE, max_results - len(items)),
+                "raw_json": 1,
+            }
+            if after:
+                page_params["after"] = after
+
+            listing = await self.resilience.acall(self._get_json, path, page_params)
+            data = listing.get("data", {})
+            for child in data.get("children", []):
+                if child.get("kind") != "t3":
+                    continue
+                submission = ListingSubmission(child["data"])
+                try:
+                    item = self._map_to_content_item(submission)
+                except Exception as e:
+                    logger.error(f"Error mapping submission {child['data'].get('id')}: {e}")
+                    continue
+                if item:  # Only add if not deleted/removed
+                    items.append(item)
+
+            after = data.get("after")
+            if not after or not data.get("children"):
+                break
+        return items[:max_results]
+
+    async def _get_json(self, path: str, params: dict) -> dict:
+        """GET an API path with the app token, refreshing it once on 401."""
+        response = await self.client.get(
+            self.api_url + path,
+            params=params,
+            headers={"Authorization": f"Bearer {await self._access_token()}"},
+        )
+        if response.status_code == 401:
+            self._token = None
+            response = await self.client.get(
+                self.api_url + path,
+                params=params,
+                headers={"Authorization": f"Bearer {await self._access_token()}"},
+            )
+        response.raise_for_status()
+        return response.json()
+
+    async def _access_token(self) -> str:
+        """App-only OAuth token (client credentials grant), cached until near expiry."""
+        client = self.client
+        async with self._token_lock:
+            if self._token is None or time.monotonic() >= self._token_expires_at:
+                response = await client.post(
+                    self.auth_url,
+                    data={"grant_type": "client_credentials"},
+                    auth=(self.client_id, self.client_secret),
+                )
+                response.raise_for_status()
+                token = response.json()
+                self._token = token["access_token"]
+                self._token_expires_at = (
+                    time.monotonic() + token.get("expires_in", 3600) - TOKEN_EXPIRY_MARGIN
+                )
+            return self._token
+
+    @staticmethod
+    def _merge(listings: list[list[ContentItem]], sort: str, max_results: int) -> list[ContentItem]:
+        """Combine per-subreddit results into one list.
+
+        "new" and "top" have a global order (time, score); other sorts
+        are ranked per subreddit, so those results are interleaved by rank.
+        Duplicates (crossposts in the same thread) keep their first position.
+        """
+        if sort == "new":
+            merged = heapq.merge(
+                *listings, key=lambda item: item.published_at.timestamp() if item.published_at else 0,
+                reverse=True,
+            )
+        elif sort == "top":
+            merged = sorted(chain(*listings), key=lambda item: item.like_count or 0, reverse=True)
+        else:
+            merged = (item for rank in zip_longest(*listings) for item in rank if item is not None)
+
+        items: dict[str, ContentItem] = {}
+        for item in merged:
+            items.setdefault(item.id, item)
+            if len(items) >= max_results:
+                break
+        return list(items.values())
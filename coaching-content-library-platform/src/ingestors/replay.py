@@ -0,0 +1,481 @@
+"""Record/replay HTTP transports for offline ingestor runs.
+
+Each ingestor's API client can be given a transport that either records
+real responses to a fixture directory or serves them back from it:
+
+- ReplayHttp: httplib2.Http stand-in for googleapiclient (YouTubeIngestor(http=...))
+- ReplayAdapter / replay_session(): requests adapter for PRAW (RedditIngestor(session=...))
+- ReplayTransport: httpx transport (AsyncRedditIngestor(transport=...))
+
+Replays can add latency and inject failures (an HTTP error status or a
+dropped connection), so ingestors can be benchmarked and their retry
+paths exercised without network access. Recording needs real API
+credentials; nothing secret (API keys, tokens, request headers) is
+written to fixtures. OAuth tokens in recorded JSON bodies are replaced by
+a placeholder, which is what replays serve.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httplib2
+import httpx
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+REPLAY_MODES = ("replay", "record")
+
+# Query parameters that carry credentials; left out of fixture keys and files
+SECRET_PARAMS = frozenset({"key", "access_token"})
+
+# JSON body fields that carry credentials (OAuth token responses); recorded
+# as REDACTED_TOKEN
+SECRET_BODY_FIELDS = frozenset({"access_token", "refresh_token", "id_token"})
+REDACTED_TOKEN = "redacted"
+
+# Response headers not stored: bodies are saved decoded, cookies are
+# credentials, and recorded rate-limit headers would make PRAW throttle replays
+DROPPED_HEADERS = frozenset({
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "set-cookie",
+    "x-ratelimit-remaining",
+    "x-ratelimit-reset",
+    "x-ratelimit-used",
+})
+
+
+class FixtureNotFoundError(LookupError):
+    """A replayed request has no recorded response."""
+
+
+@dataclass
+class Fixture:
+    """One recorded HTTP response."""
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+
+class FixtureStore:
+    """Directory of recorded responses, one JSON file per request.
+
+    Requests are keyed by method, URL (credentials removed, query sorted)
+    and a hash of the body, so the same call made by a different client
+    run finds the same fixture. Files are grouped by host.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the store.
+
+        Args:
+            path: Fixture directory (created when the first fixture is saved)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """URL with credential parameters removed and the query sorted."""
+        parts = urlsplit(url)
+        query = sorted(
+            (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if name not in SECRET_PARAMS
+        )
+        return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+    def key(self, method: str, url: str, body: Optional[Union[bytes, str]] = None) -> str:
+        """Stable key of a request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            body: Request body, if any
+
+        Returns:
+            Key string
+        """
+        key = f"{method.upper()} {self.normalize_url(url)}"
+        if body:
+            if isinstance(body, str):
+                body = body.encode()
+            key += f" {hashlib.sha256(body).hexdigest()}"
+        return key
+
+    def _file(self, key: str, url: str) -> Path:
+        host = urlsplit(url).netloc.lower() or "_"
+        return self.path / host / f"{hashlib.sha256(key.encode()).hexdigest()[:24]}.json"
+
+    def load(self, method: str, url: str, body: Optional[Union[bytes, str]] = None) -> Fixture:
+        """Look up the recorded response for a request.
+
+        Raises:
+            FixtureNotFoundError: If the request was never recorded
+        """
+        key = self.key(method, url, body)
+        try:
+            data = json.loads(self._file(key, url).read_text())
+        except FileNotFoundError:
+            raise FixtureNotFoundError(f"No fixture for {key}") from None
+
+        response = data["response"]
+        if response.get("encoding") == "base64":
+            payload = base64.b64decode(response["body"])
+        else:
+            payload = response["body"].encode()
+        return Fixture(response["status"], response["headers"], payload)
+
+    @staticmethod
+    def redact(body: bytes) -> bytes:
+        """Body with OAuth token fields of a JSON object replaced by REDACTED_TOKEN.
+
+        Other bodies are returned unchanged.
+        """
+        try:
+            data = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            return body
+        if not isinstance(data, dict) or not SECRET_BODY_FIELDS & data.keys():
+            return body
+        for name in SECRET_BODY_FIELDS & data.keys():
+            data[name] = REDACTED_TOKEN
+        return json.dumps(data).encode()
+
+    def save(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Union[bytes, str]],
+        fixture: Fixture,
+    ) -> Path:
+        """Record the response to a request, replacing any earlier recording.
+
+        Token fields in JSON bodies are redacted (see redact()).
+
+        Returns:
+            Path of the fixture file
+        """
+        key = self.key(method, url, body)
+        response = {
+            "status": fixture.status,
+            "headers": {
+                name.lower(): value for name, value in fixture.headers.items()
+                if name.lower() not in DROPPED_HEADERS
+            },
+        }
+        content = self.redact(fixture.body)
+        try:
+            response["body"] = content.decode()
+        except UnicodeDecodeError:
+            response["body"] = base64.b64encode(content).decode()
+            response["encoding"] = "base64"
+
+        path = self._file(key, url)
+        payload = json.dumps(
+            {"request": {"method": method.upper(), "url": self.normalize_url(url)}, "response": response},
+            indent=2,
+        )
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(payload)
+        return path
+
+    def __len__(self) -> int:
+        """Number of recorded responses."""
+        return sum(1 for _ in self.path.glob("*/*.json"))
+
+
+class ReplayConditions:
+    """Latency and failures applied to replayed responses.
+
+    Failures are chosen at random (seed for repeatable runs). With an
+    error_status they are HTTP errors (503 by default, which the ingestors
+    retry); with error_status=None the connection is dropped instead.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: Optional[int] = 503,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the conditions.
+
+        Args:
+            latency: Seconds added to every response
+            jitter: Up to this many more seconds, uniformly random
+            error_rate: Fraction of requests (0-1) that fail
+            error_status: HTTP status of injected failures; None drops the connection
+            seed: Random seed
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> tuple[float, bool]:
+        """Pick the delay and whether to fail for one request."""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        return delay, fail
+
+    def error_fixture(self) -> Fixture:
+        """Response served for an injected HTTP error."""
+        body = json.dumps({"error": {"code": self.error_status, "message": "Injected replay failure"}})
+        return Fixture(
+            self.error_status,
+            {"content-type": "application/json", "retry-after": "1"},
+            body.encode(),
+        )
+
+
+class _Replayer:
+    """Record/replay logic shared by the client-specific transports."""
+
+    # Raised for injected dropped connections; what the real client would raise
+    connection_error: Callable[[str], Exception] = ConnectionError
+
+    def __init__(
+        self,
+        store: Union[FixtureStore, str, Path],
+        mode: str = "replay",
+        conditions: Optional[ReplayConditions] = None,
+    ):
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Invalid replay mode: {mode}")
+        self.store = store if isinstance(store, FixtureStore) else FixtureStore(store)
+        self.mode = mode
+        self.conditions = conditions or ReplayConditions()
+        self.requests = 0
+        self.faults = 0
+        self._counter_lock = threading.Lock()
+
+    def _count(self, fault: bool) -> None:
+        with self._counter_lock:
+            self.requests += 1
+            self.faults += fault
+
+    def _record(self, method: str, url: str, body, send: Callable[[], Fixture]) -> Fixture:
+        """Make the real request and save its response."""
+        fixture = send()
+        self.store.save(method, url, body, fixture)
+        self._count(False)
+        return fixture
+
+    def _replay(self, method: str, url: str, body, fail: bool) -> Fixture:
+        """Recorded (or injected error) response, after the delay has been served."""
+        self._count(fail)
+        if fail:
+            if self.conditions.error_status is None:
+                raise self.connection_error(f"Injected connection failure for {method} {url}")
+            return self.conditions.error_fixture()
+        return self.store.load(method, url, body)
+
+    def _exchange(self, method: str, url: str, body, send: Callable[[], Fixture]) -> Fixture:
+        """Blocking record or replay of one request."""
+        if self.mode == "record":
+            return self._record(method, url, body, send)
+        delay, fail = self.conditions.draw()
+        if delay:
+            time.sleep(delay)
+        return self._replay(method, url, body, fail)
+
+
+class ReplayHttp(_Replayer):
+    """httplib2.Http stand-in for googleapiclient.
+
+    Safe to share between threads, so YouTubeIngestor can use one for
+    its concurrent discover searches.
+    """
+
+    connection_error = TimeoutError
+
+    def __init__(
+        self,
+        store: Union[FixtureStore, str, Path],
+        mode: str = "replay",
+        conditions: Optional[ReplayConditions] = None,
+        http: Optional[httplib2.Http] = None,
+        timeout: float = 10.0,
+    ):
+        """Initialize the transport.
+
+        Args:
+            store: Fixture store or directory
+            mode: "replay" to serve fixtures, "record" to call the API and save them
+            conditions: Latency and failures for replays
+            http: Real transport used when recording
+            timeout: Socket timeout of the default recording transport
+        """
+        super().__init__(store, mode, conditions)
+        self._http = http
+        self._timeout = timeout
+        self._http_lock = threading.Lock()
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body=None,
+        headers: Optional[dict] = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type=None,
+    ) -> tuple[httplib2.Response, bytes]:
+        """Same signature and return value as httplib2.Http.request."""
+        def send() -> Fixture:
+            # httplib2.Http is not thread-safe
+            with self._http_lock:
+                if self._http is None:
+                    self._http = httplib2.Http(timeout=self._timeout)
+                response, content = self._http.request(
+                    uri, method, body=body, headers=headers, redirections=redirections,
+                )
+            return Fixture(response.status, {name: value for name, value in response.items() if name != "status"}, content)
+
+        fixture = self._exchange(method, uri, body, send)
+        return httplib2.Response({**fixture.headers, "status": str(fixture.status)}), fixture.body
+
+
+class ReplayAdapter(_Replayer, BaseAdapter):
+    """requests transport adapter; mount it on the session PRAW uses."""
+
+    connection_error = requests.ConnectionError
+
+    def __init__(
+        self,
+        store: Union[FixtureStore, str, Path],
+        mode: str = "replay",
+        conditions: Optional[ReplayConditions] = None,
+        adapter: Optional[BaseAdapter] = None,
+    ):
+        """Initialize the adapter.
+
+        Args:
+            store: Fixture store or directory
+            mode: "replay" to serve fixtures, "record" to call the API and save them
+            conditions: Latency and failures for replays
+            adapter: Real adapter used when recording
+        """
+        BaseAdapter.__init__(self)
+        _Replayer.__init__(self, store, mode, conditions)
+        self._adapter = adapter or HTTPAdapter()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Record or replay a prepared request."""
+        def send() -> Fixture:
+            response = self._adapter.send(
+                request, stream=False, timeout=timeout, verify=verify, cert=cert, proxies=proxies,
+            )
+            return Fixture(response.status_code, dict(response.headers), response.content)
+
+        fixture = self._exchange(request.method, request.url, request.body, send)
+
+        response = requests.Response()
+        response.status_code = fixture.status
+        response.headers = CaseInsensitiveDict(fixture.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = fixture.body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        """Close the recording adapter."""
+        self._adapter.close()
+
+
+def replay_session(
+    store: Union[FixtureStore, str, Path],
+    mode: str = "replay",
+    conditions: Optional[ReplayConditions] = None,
+) -> requests.Session:
+    """requests.Session whose HTTP(S) traffic goes through a ReplayAdapter."""
+    session = requests.Session()
+    adapter = ReplayAdapter(store, mode, conditions)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class ReplayTransport(_Replayer, httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport for both Client and AsyncClient."""
+
+    connection_error = httpx.ConnectError
+
+    def __init__(
+        self,
+        store: Union[FixtureStore, str, Path],
+        mode: str = "replay",
+        conditions: Optional[ReplayConditions] = None,
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            store: Fixture store or directory
+            mode: "replay" to serve fixtures, "record" to call the API and save them
+            conditions: Latency and failures for replays
+            transport: Real transport used when recording (sync or async,
+                matching the client; a default HTTP transport if None)
+        """
+        super().__init__(store, mode, conditions)
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Record or replay a request from httpx.Client."""
+        body = request.read()
+
+        def send() -> Fixture:
+            if self._transport is None:
+                self._transport = httpx.HTTPTransport()
+            response = self._transport.handle_request(request)
+            try:
+                return Fixture(response.status_code, dict(response.headers), response.read())
+            finally:
+                response.close()
+
+        return self._response(self._exchange(request.method, str(request.url), body, send))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Record or replay a request from httpx.AsyncClient, without blocking the loop."""
+        method, url = request.method, str(request.url)
+        body = await request.aread()
+
+        if self.mode == "record":
+            if self._transport is None:
+                self._transport = httpx.AsyncHTTPTransport()
+            response = await self._transport.handle_async_request(request)
+            try:
+                fixture = Fixture(response.status_code, dict(response.headers), await response.aread())
+            finally:
+                await response.aclose()
+            return self._response(self._record(method, url, body, lambda: fixture))
+
+        delay, fail = self.conditions.draw()
+        if delay:
+            await asyncio.sleep(delay)
+        return self._response(self._replay(method, url, body, fail))
+
+    @staticmethod
+    def _response(fixture: Fixture) -> httpx.Response:
+        return httpx.Response(fixture.status, headers=fixture.headers, content=fixture.body)
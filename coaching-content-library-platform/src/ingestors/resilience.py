@@ -0,0 +1,440 @@
+"""Retries, backoff and circuit breaking for upstream API calls.
+
+Every network call an ingestor makes goes through its source's Resilience:
+transient failures (timeouts, connection errors, 429 and 5xx responses)
+are retried with jittered exponential backoff, honoring Retry-After, and
+repeated failures open a per-source circuit so a struggling upstream is
+left alone for a while instead of being hammered. When a call can't be
+completed, UpstreamUnavailableError is raised instead of the ingestor
+quietly returning nothing.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional
+
+import httplib2
+import httpx
+from prawcore.exceptions import RequestException
+
+from ..config import settings
+from ..models.content import ContentSource
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying
+TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# 403 reasons YouTube uses for per-second rate limits (as opposed to daily quota)
+RATE_LIMIT_REASONS = (b"rateLimitExceeded", b"userRateLimitExceeded")
+
+# Network-level failures: nothing reached the upstream, or no reply came back
+NETWORK_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    httplib2.HttpLib2Error,
+    httpx.TransportError,
+    RequestException,
+)
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """Raised when an upstream API can't serve a call right now.
+
+    Attributes:
+        source: Source whose API failed
+        retry_after: Seconds the caller should wait before trying again, if known
+    """
+
+    def __init__(
+        self,
+        message: str,
+        source: Optional[ContentSource] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.source = source
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """Raised without calling the upstream because its circuit is open."""
+
+
+def _response_of(exc: BaseException):
+    """HTTP response attached to a client library exception, if any."""
+    # googleapiclient HttpError has .resp; httpx and prawcore errors have .response
+    response = getattr(exc, "resp", None)
+    return response if response is not None else getattr(exc, "response", None)
+
+
+def _status_of(response) -> Optional[int]:
+    """Status code of an httplib2, httpx or requests response."""
+    status = getattr(response, "status", None) or getattr(response, "status_code", None)
+    return int(status) if status is not None else None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait (never negative), or None if missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def classify_error(exc: BaseException) -> tuple[bool, Optional[float]]:
+    """Decide whether a failed call is worth retrying.
+
+    Args:
+        exc: Exception raised by the call
+
+    Returns:
+        (transient, retry_after): whether to retry, and the upstream's
+        Retry-After in seconds if it sent one
+    """
+    if isinstance(exc, NETWORK_ERRORS):
+        return True, None
+
+    response = _response_of(exc)
+    status = _status_of(response)
+    if status is None:
+        return False, None
+
+    headers = getattr(response, "headers", response)
+    retry_after = parse_retry_after(headers.get("retry-after")) if headers is not None else None
+
+    if status in TRANSIENT_STATUSES:
+        return True, retry_after
+    content = getattr(exc, "content", None) or b""
+    if status == 403 and any(reason in content for reason in RATE_LIMIT_REASONS):
+        return True, retry_after
+    return False, None
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Closed: calls go through. After `failure_threshold` consecutive
+    failures it opens and rejects calls for `reset_timeout` seconds, then
+    lets a single trial call through (half-open): success closes it,
+    failure opens it again. Thread-safe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before a trial call
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open -> half-open once the timeout has passed."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit will allow a trial call."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Whether a call may go through now. Claims the trial slot when half-open."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back a half-open trial slot without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or after a failed trial."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self._failures} consecutive failure(s)")
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+
+class Resilience:
+    """Retry policy, circuit breaker and counters for one upstream."""
+
+    def __init__(
+        self,
+        source: ContentSource,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        deadline: float = 20.0,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """Initialize the policy.
+
+        Args:
+            source: Upstream this policy protects
+            max_attempts: Tries per call, including the first
+            backoff_base: Backoff ceiling for the first retry, doubled each retry
+            backoff_max: Largest backoff ceiling
+            deadline: Total seconds a call may spend waiting between retries;
+                a Retry-After past it fails the call instead of blocking
+            breaker: Circuit breaker; a default one if None
+            sleep: Sleep function (injectable for tests)
+            async_sleep: Sleep coroutine used by acall() (injectable for tests)
+        """
+        self.source = source
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._lock = threading.Lock()
+        self.metrics = {
+            "calls": 0,
+            "successes": 0,
+            "retries": 0,
+            "failures": 0,  # Calls that gave up on a transient error
+            "short_circuits": 0,  # Calls rejected by the open circuit
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.metrics[name] += 1
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (1-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call fn(*args, **kwargs) with retries behind the circuit breaker.
+
+        Non-transient errors (404, 403 quota, bad requests, local errors)
+        are raised unchanged on the first attempt and don't count against
+        the circuit.
+
+        Returns:
+            fn's return value
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            UpstreamUnavailableError: If every attempt failed transiently
+        """
+        self._count("calls")
+        waited = 0.0
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self._admit()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, waited)
+                if delay is None:
+                    raise
+                self._sleep(delay)
+                waited += delay
+                continue
+
+            self._succeeded()
+            return result
+
+    async def acall(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Async version of call(): await fn(*args, **kwargs) with retries.
+
+        Backoff waits with asyncio.sleep, so other tasks keep running.
+
+        Returns:
+            fn's result
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            UpstreamUnavailableError: If every attempt failed transiently
+        """
+        self._count("calls")
+        waited = 0.0
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self._admit()
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, waited)
+                if delay is None:
+                    raise
+                await self._async_sleep(delay)
+                waited += delay
+                continue
+
+            self._succeeded()
+            return result
+
+    def _admit(self) -> None:
+        """Raise CircuitOpenError unless the breaker lets an attempt through."""
+        if not self.breaker.allow():
+            self._count("short_circuits")
+            raise CircuitOpenError(
+                f"{self.source.value} is unavailable (circuit open)",
+                source=self.source,
+                retry_after=self.breaker.retry_after(),
+            )
+
+    def _succeeded(self) -> None:
+        self.breaker.record_success()
+        self._count("successes")
+
+    def _retry_delay(self, exc: Exception, attempt: int, waited: float) -> Optional[float]:
+        """Record a failed attempt and decide what happens next.
+
+        Args:
+            exc: Exception the attempt raised
+            attempt: 1-based attempt number
+            waited: Seconds already spent backing off for this call
+
+        Returns:
+            Seconds to wait before retrying, or None if `exc` isn't
+            transient and should be raised as-is
+
+        Raises:
+            UpstreamUnavailableError: If the call should give up
+        """
+        transient, retry_after = classify_error(exc)
+        if not transient:
+            if _status_of(_response_of(exc)) is not None:
+                # The upstream answered; it's healthy even if the answer is an error
+                self.breaker.record_success()
+            else:
+                # Failed before reaching the upstream; says nothing about its health
+                self.breaker.release()
+            return None
+        self.breaker.record_failure()
+
+        delay = max(retry_after or 0.0, self.backoff(attempt))
+        if (
+            attempt >= self.max_attempts
+            or waited + delay > self.deadline
+            or self.breaker.state == CircuitBreaker.OPEN
+        ):
+            self._count("failures")
+            raise UpstreamUnavailableError(
+                f"{self.source.value} is unavailable after {attempt} attempt(s): {exc}",
+                source=self.source,
+                retry_after=retry_after,
+            ) from exc
+
+        self._count("retries")
+        logger.warning(
+            f"{self.source.value} call failed ({exc}); retry {attempt} in {delay:.2f}s"
+        )
+        return delay
+
+    def snapshot(self) -> dict:
+        """Counters and circuit state, for health checks and logs."""
+        with self._lock:
+            return {**self.metrics, "circuit": self.breaker.state}
+
+
+_registry: dict[ContentSource, Resilience] = {}
+_registry_lock = threading.Lock()
+
+
+def resilience_for(source: ContentSource) -> Resilience:
+    """Shared Resilience for a source, so all its ingestors share one circuit.
+
+    Args:
+        source: Upstream source
+
+    Returns:
+        The source's Resilience, created from settings on first use
+    """
+    with _registry_lock:
+        if source not in _registry:
+            _registry[source] = Resilience(
+                source,
+                max_attempts=settings.upstream_max_attempts,
+                backoff_base=settings.upstream_backoff_base,
+                backoff_max=settings.upstream_backoff_max,
+                deadline=settings.upstream_retry_deadline,
+                breaker=CircuitBreaker(
+                    failure_threshold=settings.upstream_circuit_failure_threshold,
+                    reset_timeout=settings.upstream_circuit_reset_timeout,
+                ),
+            )
+        return _registry[source]
+
+
+def upstream_status() -> dict[str, dict]:
+    """Snapshot of every source's counters and circuit state."""
+    with _registry_lock:
+        resiliences = list(_registry.values())
+    return {resilience.source.value: resilience.snapshot() for resilience in resiliences}
@@ -0,0 +1,74 @@
+"""Coalesce concurrent calls for the same key into one execution."""
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+
+class _Call:
+    """An in-flight call that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result.
+
+    Used to collapse duplicate saves of the same (source, id): when several
+    people save a link at once, only the first caller hits the upstream API
+    and the database, and the rest wait for its result. Results are not
+    cached: once a call finishes, the next call for the key runs again.
+
+    Thread-safe. Callers block, so use it from worker threads, not the
+    event loop.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.coalesced = 0  # Calls answered by another caller's execution
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call fn(*args, **kwargs), or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identifies duplicate work
+            fn: Function to run if no call for `key` is in flight
+
+        Returns:
+            fn's return value, from this caller's or the in-flight execution
+
+        Raises:
+            Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of keys with a call currently running."""
+        with self._lock:
+            return len(self._calls)
@@ -4,11 +4,11 @@ Creates minimal ContentItem from TikTok URLs.
 Metadata should be provided by the user when saving.
 """
 import logging
-import re
 from typing import Optional
 
 from ..models.content import ContentItem, ContentSource, ContentType
 from .base import BaseIngestor
+from .urls import URLResolver, canonicalize
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +20,17 @@ class TikTokIngestor(BaseIngestor):
     Provide title, description, and metadata when saving content.
     """
 
-    def __init__(self):
+    def __init__(self, url_resolver: Optional[URLResolver] = None):
         """Initialize TikTok ingestor.
 
         No authentication required for oEmbed API.
+
+        Args:
+            url_resolver: Expands vm.tiktok.com share links so items are
+                stored under their numeric video ID. Without one, the share
+                code is used as the ID.
         """
-        pass
+        self.url_resolver = url_resolver
 
     @property
     def source(self) -> ContentSource:
@@ -103,6 +108,12 @@ class TikTokIngestor(BaseIngestor):
         Returns:
             ContentItem with URL and ID, None if URL is invalid
         """
+        # Expand share links to the canonical video URL when possible
+        if self.url_resolver:
+            ref = self.url_resolver.resolve(ContentSource.TIKTOK, url)
+            if ref and not ref.short_link:
+                url = ref.url
+
         # Extract video ID from URL
         video_id = self._extract_video_id(url)
         if not video_id:
@@ -128,6 +139,21 @@ class TikTokIngestor(BaseIngestor):
             },
         )
 
+    def extract_id(self, url: str) -> Optional[str]:
+        """Get the video ID from a URL without fetching it.
+
+        Args:
+            url: Content URL
+
+        Returns:
+            ID if the URL is recognized, None otherwise. Share links give the
+            numeric ID only if their expansion is already cached.
+        """
+        if self.url_resolver:
+            ref = self.url_resolver.resolve(ContentSource.TIKTOK, url, allow_network=False)
+            return ref.id if ref else None
+        return self._extract_video_id(url)
+
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from TikTok URL.
 
@@ -137,20 +163,5 @@ class TikTokIngestor(BaseIngestor):
         Returns:
             Video ID if found, None otherwise
         """
-        # Match patterns like:
-        # https://www.tiktok.com/@username/video/1234567890
-        # https://tiktok.com/@user/video/123
-        # https://vm.tiktok.com/ZMabcdef/ (short URL)
-
-        # Standard URL pattern
-        match = re.search(r'tiktok\.com/@[\w.-]+/video/(\d+)', url)
-        if match:
-            return match.group(1)
-
-        # Short URL pattern (vm.tiktok.com)
-        # These don't have numeric IDs in the URL, use the short code as ID
-        match = re.search(r'vm\.tiktok\.com/([A-Za-z0-9]+)', url)
-        if match:
-            return match.group(1)
-
-        return None
+        ref = canonicalize(ContentSource.TIKTOK, url)
+        return ref.id if ref else None
@@ -0,0 +1,244 @@
+"""Canonical content URLs and cached short-link resolution.
+
+Every supported URL shape maps to a ContentRef: the source, the source's
+content ID and one canonical URL. Parsing is pure and LRU-cached, so the
+same pasted link resolves in O(1) after the first time. Share links that
+hide the real ID (vm.tiktok.com) are expanded through a pluggable
+resolver, and the expansions are kept in SQLite so they survive restarts.
+"""
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+
+from ..models.content import ContentSource
+from ..storage.pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ContentRef:
+    """What a URL points at.
+
+    Attributes:
+        source: Platform the URL belongs to
+        id: Source content ID (for short links, the share code)
+        url: Canonical URL for the content
+        short_link: True if `id` is a share-link code that still needs expanding
+    """
+    source: ContentSource
+    id: str
+    url: str
+    short_link: bool = False
+
+
+# One pattern per source; group "id" is the content ID, other named groups feed the canonical URL
+_YOUTUBE = re.compile(
+    r'(?:[?&]v=|youtube\.com/shorts/|youtu\.be/)(?P<id>[A-Za-z0-9_-]{11})'
+)
+_REDDIT = re.compile(r'reddit\.com/r/(?P<subreddit>\w+)/comments/(?P<id>[A-Za-z0-9]+)')
+_INSTAGRAM = re.compile(r'instagram\.com/(?P<kind>p|reel)/(?P<id>[A-Za-z0-9_-]+)')
+_TIKTOK = re.compile(r'tiktok\.com/@(?P<user>[\w.-]+)/video/(?P<id>\d+)')
+_TIKTOK_SHORT = re.compile(r'vm\.tiktok\.com/(?P<id>[A-Za-z0-9]+)')
+
+_PARSERS: dict[ContentSource, list[tuple[re.Pattern, Callable[[re.Match], str], bool]]] = {
+    ContentSource.YOUTUBE: [
+        (_YOUTUBE, lambda m: f"https://www.youtube.com/watch?v={m['id']}", False),
+    ],
+    ContentSource.REDDIT: [
+        (_REDDIT, lambda m: f"https://www.reddit.com/r/{m['subreddit']}/comments/{m['id']}/", False),
+    ],
+    ContentSource.INSTAGRAM: [
+        (_INSTAGRAM, lambda m: f"https://www.instagram.com/{m['kind']}/{m['id']}/", False),
+    ],
+    ContentSource.TIKTOK: [
+        (_TIKTOK, lambda m: f"https://www.tiktok.com/@{m['user']}/video/{m['id']}", False),
+        (_TIKTOK_SHORT, lambda m: f"https://vm.tiktok.com/{m['id']}/", True),
+    ],
+}
+
+
+@lru_cache(maxsize=4096)
+def canonicalize(source: ContentSource, url: str) -> Optional[ContentRef]:
+    """Parse a URL for one source without any network calls.
+
+    Args:
+        source: Platform the URL is expected to belong to
+        url: URL as pasted by a user
+
+    Returns:
+        ContentRef, or None if the URL isn't a recognized content URL
+    """
+    for pattern, build_url, short_link in _PARSERS[source]:
+        match = pattern.search(url)
+        if match:
+            return ContentRef(source, match["id"], build_url(match), short_link)
+    return None
+
+
+def detect(url: str) -> Optional[ContentRef]:
+    """Parse a URL from any supported source.
+
+    Args:
+        url: URL as pasted by a user
+
+    Returns:
+        ContentRef, or None if no source recognizes the URL
+    """
+    for source in _PARSERS:
+        ref = canonicalize(source, url)
+        if ref:
+            return ref
+    return None
+
+
+def expand_redirects(url: str, timeout: float = 5.0) -> Optional[str]:
+    """Default short-link expander: follow HTTP redirects to the final URL.
+
+    Args:
+        url: Short link
+        timeout: Seconds to wait for the redirect chain
+
+    Returns:
+        Final URL, or None if the request failed
+    """
+    try:
+        response = httpx.head(url, follow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+        return str(response.url)
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not expand short link {url}: {e}")
+        return None
+
+
+class URLResolver:
+    """Resolve URLs to ContentRefs, expanding short links at most once.
+
+    Expansions are cached in a bounded in-memory LRU backed by a
+    url_resolutions table, so a short link costs one network round trip
+    for the lifetime of the database.
+    """
+
+    def __init__(
+        self,
+        expander: Optional[Callable[[str], Optional[str]]] = expand_redirects,
+        db_path: Optional[str] = None,
+        cache_size: int = 1024,
+        pragmas: Optional[dict] = None,
+    ):
+        """Initialize the resolver.
+
+        Args:
+            expander: Maps a short link to the URL it redirects to (None to
+                never touch the network)
+            db_path: SQLite database for the persistent cache; memory only if None
+            cache_size: Maximum in-memory entries
+            pragmas: PRAGMA profile for the cache's connection
+        """
+        self.expander = expander
+        self.cache_size = cache_size
+        self._memory: OrderedDict[str, ContentRef] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._pool = ConnectionPool(db_path, size=1, pragmas=pragmas)
+            with self._pool.transaction() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS url_resolutions (
+                        short_url TEXT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        resolved_at TEXT NOT NULL
+                    )
+                """)
+
+    def resolve(
+        self,
+        source: ContentSource,
+        url: str,
+        allow_network: bool = True,
+    ) -> Optional[ContentRef]:
+        """Resolve a URL to the content it points at.
+
+        Args:
+            source: Platform the URL is expected to belong to
+            url: URL as pasted by a user
+            allow_network: Whether an uncached short link may be expanded now
+
+        Returns:
+            ContentRef with the real content ID when known. A short link
+            that can't be expanded (no expander, network disabled, or the
+            expansion failed) is returned as-is with short_link=True.
+            None if the URL isn't recognized.
+        """
+        ref = canonicalize(source, url)
+        if ref is None or not ref.short_link:
+            return ref
+
+        cached = self._lookup(source, ref.url)
+        if cached:
+            return cached
+        if not allow_network or self.expander is None:
+            return ref
+
+        expanded_url = self.expander(ref.url)
+        expanded = canonicalize(source, expanded_url) if expanded_url else None
+        if expanded is None or expanded.short_link:
+            return ref
+
+        self._store(ref.url, expanded)
+        return expanded
+
+    def _lookup(self, source: ContentSource, short_url: str) -> Optional[ContentRef]:
+        """Find a cached expansion in memory, then in SQLite."""
+        with self._lock:
+            ref = self._memory.get(short_url)
+            if ref:
+                self._memory.move_to_end(short_url)
+                return ref
+
+        if self._pool is None:
+            return None
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT url FROM url_resolutions WHERE short_url = ?", (short_url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        ref = canonicalize(source, row["url"])
+        if ref:
+            self._remember(short_url, ref)
+        return ref
+
+    def _store(self, short_url: str, ref: ContentRef) -> None:
+        """Cache an expansion in memory and SQLite."""
+        self._remember(short_url, ref)
+        if self._pool is None:
+            return
+        with self._pool.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO url_resolutions (short_url, url, resolved_at) VALUES (?, ?, ?)",
+                (short_url, ref.url, datetime.now(timezone.utc).isoformat()),
+            )
+
+    def _remember(self, short_url: str, ref: ContentRef) -> None:
+        """Add to the in-memory LRU, evicting the least recently used entry."""
+        with self._lock:
+            self._memory[short_url] = ref
+            self._memory.move_to_end(short_url)
+            while len(self._memory) > self.cache_size:
+                self._memory.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the persistent cache's connection."""
+        if self._pool is not None:
+            self._pool.close()
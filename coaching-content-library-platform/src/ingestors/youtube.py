@@ -1,28 +1,56 @@
 """YouTube content ingestor."""
 import logging
-import re
-from typing import Optional
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional, Union
 from datetime import datetime
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from ..models.content import ContentItem, ContentSource, ContentType
 from ..config import settings
-from .base import BaseIngestor
+from .base import BaseIngestor, Tombstone
+from .cache import ResponseCache
+from .quota import QuotaExhaustedError, QuotaLedger
+from .resilience import CircuitOpenError, UpstreamUnavailableError
+from .urls import canonicalize
 
 logger = logging.getLogger(__name__)
 
+# videos.list accepts at most this many IDs per call (one quota unit per call)
+VIDEOS_PER_REQUEST = 50
+
+# HttpError reasons meaning the daily quota is used up
+QUOTA_ERROR_REASONS = (b"quotaExceeded", b"dailyLimitExceeded")
+
 
 class YouTubeIngestor(BaseIngestor):
     """Ingestor for YouTube videos using the YouTube Data API v3."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        cache: Optional[ResponseCache] = None,
+        quota: Optional[QuotaLedger] = None,
+        http: Optional[httplib2.Http] = None,
+    ):
         """Initialize YouTube ingestor.
 
         Args:
             api_key: YouTube Data API v3 key
+            cache: Optional response cache for search and discover calls
+            quota: Optional ledger; calls are charged to it and refused
+                once the day's budget can't cover them
+            http: Transport for every API call (e.g. a replay.ReplayHttp).
+                Shared by concurrent discover searches, so it must be
+                thread-safe. By default each discover search gets its own.
         """
         self.api_key = api_key
+        self.cache = cache
+        self.quota = quota
+        self.http = http
         self._youtube = None
 
     @property
@@ -34,13 +62,14 @@ class YouTubeIngestor(BaseIngestor):
     def youtube(self):
         """Lazy-load the YouTube API client."""
         if self._youtube is None:
-            self._youtube = build('youtube', 'v3', developerKey=self.api_key)
+            self._youtube = build('youtube', 'v3', developerKey=self.api_key, http=self.http)
         return self._youtube
 
     def search(
         self,
         query: str,
         max_results: int = 10,
+        raise_errors: bool = False,
         **kwargs
     ) -> list[ContentItem]:
         """Search for YouTube videos matching the query.
@@ -48,6 +77,8 @@ class YouTubeIngestor(BaseIngestor):
         Args:
             query: Search terms (e.g., "butterfly drill goalie")
             max_results: Maximum number of results to return
+            raise_errors: Raise API, quota and outage errors instead of
+                logging them and returning [], for callers that report them
             **kwargs: Additional YouTube-specific parameters (e.g., order, publishedAfter)
 
         Returns:
@@ -55,13 +86,13 @@ class YouTubeIngestor(BaseIngestor):
         """
         try:
             # Step 1: Search for videos
-            search_response = self.youtube.search().list(
+            search_response = self._search_list(
                 part="snippet",
                 type="video",
                 q=query,
                 maxResults=max_results,
                 **kwargs
-            ).execute()
+            )
 
             # Extract video IDs
             video_ids = [
@@ -74,27 +105,24 @@ class YouTubeIngestor(BaseIngestor):
                 return []
 
             # Step 2: Get detailed video information including statistics
-            videos_response = self.youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=','.join(video_ids)
-            ).execute()
+            videos = self.get_many(video_ids, use_cache=True)
 
-            # Step 3: Map to ContentItem objects
-            content_items = []
-            for video in videos_response.get('items', []):
-                try:
-                    content_item = self._map_to_content_item(video)
-                    content_items.append(content_item)
-                except Exception as e:
-                    logger.error(f"Error mapping video {video.get('id')}: {e}")
-                    continue
-
-            return content_items
+            # Step 3: Keep search result order
+            return [videos[video_id] for video_id in video_ids if video_id in videos]
 
+        except (QuotaExhaustedError, UpstreamUnavailableError) as e:
+            if raise_errors:
+                raise
+            logger.warning(f"Skipping YouTube search: {e}")
+            return []
         except HttpError as e:
+            if raise_errors:
+                raise
             logger.error(f"YouTube API error during search: {e}")
             return []
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"Unexpected error during YouTube search: {e}")
             return []
 
@@ -106,12 +134,17 @@ class YouTubeIngestor(BaseIngestor):
 
         Returns:
             ContentItem if found, None otherwise
+
+        Raises:
+            UpstreamUnavailableError: If the API is down or keeps failing, or
+                the daily quota is used up (retry_after is the time until it
+                resets)
         """
         try:
-            response = self.youtube.videos().list(
+            response = self._execute("videos.list", self.youtube.videos().list(
                 part="snippet,statistics,contentDetails",
                 id=content_id
-            ).execute()
+            ))
 
             items = response.get('items', [])
             if not items:
@@ -120,13 +153,143 @@ class YouTubeIngestor(BaseIngestor):
 
             return self._map_to_content_item(items[0])
 
+        except QuotaExhaustedError as e:
+            logger.warning(f"Not fetching video {content_id}: {e}")
+            raise self._quota_unavailable(str(e)) from e
+        except UpstreamUnavailableError:
+            raise
         except HttpError as e:
+            if self._is_quota_error(e):
+                raise self._quota_unavailable("YouTube daily quota exceeded") from e
             logger.error(f"YouTube API error fetching video {content_id}: {e}")
             return None
         except Exception as e:
             logger.error(f"Unexpected error fetching video {content_id}: {e}")
             return None
 
+    def get_many(
+        self,
+        content_ids: list[str],
+        use_cache: bool = False,
+        reserve: int = 0,
+    ) -> dict[str, ContentItem]:
+        """Fetch many YouTube videos, VIDEOS_PER_REQUEST IDs per API call.
+
+        Args:
+            content_ids: YouTube video IDs (duplicates are fetched once)
+            use_cache: Serve videos from the response cache when possible.
+                Off by default so saves and refreshes see current stats.
+            reserve: Quota units the calls must leave unspent (background
+                refreshes leave room for saves and searches)
+
+        Returns:
+            Dict of video ID -> ContentItem, in request order. Videos that
+            don't exist, and chunks whose API call failed, are omitted.
+        """
+        unique_ids = list(dict.fromkeys(content_ids))
+        videos = {}
+        to_fetch = unique_ids
+        cache = self.cache if use_cache else None
+
+        if cache is not None:
+            to_fetch = []
+            for video_id in unique_ids:
+                video = cache.get("youtube.videos", {"id": video_id})
+                if video is None:
+                    to_fetch.append(video_id)
+                    continue
+                try:
+                    videos[video_id] = self._map_to_content_item(video)
+                except Exception as e:
+                    logger.error(f"Error mapping cached video {video_id}: {e}")
+
+        fetched, _ = self._fetch_videos(to_fetch, reserve, cache)
+        videos.update(fetched)
+
+        # The API doesn't promise to return items in request order
+        return {video_id: videos[video_id] for video_id in unique_ids if video_id in videos}
+
+    def lookup_many(
+        self,
+        content_ids: list[str],
+        reserve: int = 0,
+    ) -> dict[str, Union[ContentItem, Tombstone]]:
+        """Look up many videos, with tombstones for videos that are gone.
+
+        videos.list silently leaves out videos that were deleted or made
+        private, so an ID missing from a successful response is reported as
+        Tombstone(id, "not_found").
+
+        Args:
+            content_ids: YouTube video IDs (duplicates are fetched once)
+            reserve: Quota units the calls must leave unspent
+
+        Returns:
+            Dict of video ID -> ContentItem or Tombstone, in request order.
+            IDs in a chunk whose API call failed are omitted (their state
+            is unknown, not gone).
+        """
+        unique_ids = list(dict.fromkeys(content_ids))
+        results: dict[str, Union[ContentItem, Tombstone]] = {}
+        videos, answered = self._fetch_videos(unique_ids, reserve)
+        for video_id in unique_ids:
+            if video_id in videos:
+                results[video_id] = videos[video_id]
+            elif video_id in answered:
+                results[video_id] = Tombstone(video_id, "not_found")
+        return results
+
+    def _fetch_videos(
+        self,
+        video_ids: list[str],
+        reserve: int = 0,
+        cache: Optional[ResponseCache] = None,
+    ) -> tuple[dict[str, ContentItem], set[str]]:
+        """Call videos.list for unique IDs, VIDEOS_PER_REQUEST at a time.
+
+        Args:
+            video_ids: Unique video IDs
+            reserve: Quota units the calls must leave unspent
+            cache: Cache to store fetched videos in, if any
+
+        Returns:
+            Tuple of (videos by ID, IDs whose videos.list call succeeded).
+            An answered ID without a video doesn't exist (or is private).
+        """
+        videos = {}
+        answered = set()
+
+        for start in range(0, len(video_ids), VIDEOS_PER_REQUEST):
+            chunk = video_ids[start:start + VIDEOS_PER_REQUEST]
+            try:
+                response = self._execute("videos.list", self.youtube.videos().list(
+                    part="snippet,statistics,contentDetails",
+                    id=','.join(chunk),
+                ), reserve=reserve)
+            except (QuotaExhaustedError, CircuitOpenError) as e:
+                logger.warning(f"Not fetching {len(video_ids) - start} videos: {e}")
+                break
+            except HttpError as e:
+                logger.error(f"YouTube API error fetching {len(chunk)} videos: {e}")
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error fetching {len(chunk)} videos: {e}")
+                continue
+
+            answered.update(chunk)
+            for video in response.get('items', []):
+                try:
+                    videos[video['id']] = self._map_to_content_item(video)
+                except Exception as e:
+                    # Returned but unmappable: not gone, so leave it unanswered
+                    answered.discard(video.get('id'))
+                    logger.error(f"Error mapping video {video.get('id')}: {e}")
+                    continue
+                if cache is not None:
+                    cache.set("youtube.videos", {"id": video['id']}, video)
+
+        return videos, answered
+
     def from_url(self, url: str) -> Optional[ContentItem]:
         """Fetch a YouTube video from its URL.
 
@@ -143,6 +306,17 @@ class YouTubeIngestor(BaseIngestor):
 
         return self.get_by_id(video_id)
 
+    def extract_id(self, url: str) -> Optional[str]:
+        """Get the video ID from a URL without fetching it.
+
+        Args:
+            url: Content URL
+
+        Returns:
+            ID if the URL is recognized, None otherwise
+        """
+        return self._extract_video_id(url)
+
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL.
 
@@ -157,22 +331,8 @@ class YouTubeIngestor(BaseIngestor):
         Returns:
             Video ID if found, None otherwise
         """
-        # Standard watch URL: youtube.com/watch?v=VIDEO_ID
-        match = re.search(r'[?&]v=([A-Za-z0-9_-]{11})', url)
-        if match:
-            return match.group(1)
-
-        # Shorts URL: youtube.com/shorts/VIDEO_ID
-        match = re.search(r'youtube\.com/shorts/([A-Za-z0-9_-]{11})', url)
-        if match:
-            return match.group(1)
-
-        # Short URL: youtu.be/VIDEO_ID
-        match = re.search(r'youtu\.be/([A-Za-z0-9_-]{11})', url)
-        if match:
-            return match.group(1)
-
-        return None
+        ref = canonicalize(ContentSource.YOUTUBE, url)
+        return ref.id if ref else None
 
     def get_recent(self, max_results: int = 10) -> list[ContentItem]:
         """Get recent videos for configured discover terms.
@@ -188,40 +348,76 @@ class YouTubeIngestor(BaseIngestor):
         """
         try:
             all_video_ids = {}  # Use dict to preserve order and deduplicate
+            terms = settings.youtube_discover_terms
 
             # Calculate results per term to fetch enough before deduplication
             # Use a multiplier to account for duplicates across terms
-            results_per_term = max(5, max_results // len(settings.youtube_discover_terms) + 2)
+            results_per_term = max(5, max_results // len(terms) + 2)
+            deferred = 0  # Term searches skipped to protect the quota reserve
+
+            # Search up to youtube_discover_concurrency terms at once, merged
+            # in term order so the result matches searching them one after
+            # another. Terms are submitted as earlier ones finish, so once
+            # enough videos are collected no further searches (100 units
+            # each) are started. Each term gets youtube_discover_term_timeout
+            # seconds from submission, retries included.
+            self.youtube  # Build the client here, not racing in the workers
+            concurrency = max(1, min(settings.youtube_discover_concurrency, len(terms)))
+            term_timeout = settings.youtube_discover_term_timeout
+            pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="youtube-discover")
+            pending = iter(terms)
+            in_flight = deque()
+
+            def submit_next() -> None:
+                term = next(pending, None)
+                if term is not None:
+                    future = pool.submit(self._search_recent, term, results_per_term)
+                    in_flight.append((term, future, time.monotonic() + term_timeout))
 
-            for term in settings.youtube_discover_terms:
-                try:
-                    # Search with order="date" to get recent uploads
-                    search_response = self.youtube.search().list(
-                        part="snippet",
-                        type="video",
-                        q=term,
-                        maxResults=results_per_term,
-                        order="date"
-                    ).execute()
-
-                    # Collect video IDs (dict preserves insertion order in Python 3.7+)
-                    for item in search_response.get('items', []):
-                        if item['id']['kind'] == 'youtube#video':
-                            video_id = item['id']['videoId']
-                            # Only add if not already seen
-                            if video_id not in all_video_ids:
-                                all_video_ids[video_id] = True
-
-                    # Stop early if we have enough unique videos
-                    if len(all_video_ids) >= max_results:
-                        break
-
-                except HttpError as e:
-                    logger.error(f"YouTube API error searching term '{term}': {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Unexpected error searching term '{term}': {e}")
-                    continue
+            try:
+                for _ in range(concurrency):
+                    submit_next()
+
+                while in_flight:
+                    term, future, deadline = in_flight.popleft()
+                    try:
+                        search_response = future.result(timeout=max(0.0, deadline - time.monotonic()))
+
+                        # Collect video IDs (dict preserves insertion order in Python 3.7+)
+                        for item in search_response.get('items', []):
+                            if item['id']['kind'] == 'youtube#video':
+                                video_id = item['id']['videoId']
+                                # Only add if not already seen
+                                if video_id not in all_video_ids:
+                                    all_video_ids[video_id] = True
+
+                        # Stop early if we have enough unique videos
+                        if len(all_video_ids) >= max_results:
+                            break
+
+                    except FutureTimeoutError:
+                        # Not started yet (workers busy with abandoned terms): don't start it
+                        future.cancel()
+                        logger.warning(f"Skipping discover term '{term}': no response within {term_timeout}s")
+                    except QuotaExhaustedError:
+                        deferred += 1
+                    except UpstreamUnavailableError as e:
+                        logger.warning(f"Skipping discover term '{term}': {e}")
+                    except HttpError as e:
+                        logger.error(f"YouTube API error searching term '{term}': {e}")
+                    except Exception as e:
+                        logger.error(f"Unexpected error searching term '{term}': {e}")
+                    submit_next()
+            finally:
+                # Searches already in flight after an early stop finish unused
+                pool.shutdown(wait=False, cancel_futures=True)
+
+            if deferred:
+                logger.info(
+                    f"Deferred {deferred} discover term search(es): "
+                    f"{self.quota.remaining()} quota units left, keeping "
+                    f"{settings.youtube_quota_discover_reserve} for saves and searches"
+                )
 
             if not all_video_ids:
                 logger.warning("No recent videos found across all discover terms")
@@ -231,20 +427,7 @@ class YouTubeIngestor(BaseIngestor):
             video_ids_list = list(all_video_ids.keys())[:max_results]
 
             # Get detailed video information
-            videos_response = self.youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=','.join(video_ids_list)
-            ).execute()
-
-            # Map to ContentItem objects
-            content_items = []
-            for video in videos_response.get('items', []):
-                try:
-                    content_item = self._map_to_content_item(video)
-                    content_items.append(content_item)
-                except Exception as e:
-                    logger.error(f"Error mapping video {video.get('id')}: {e}")
-                    continue
+            content_items = list(self.get_many(video_ids_list, use_cache=True).values())
 
             # Sort by published date (most recent first)
             content_items.sort(
@@ -259,6 +442,117 @@ class YouTubeIngestor(BaseIngestor):
             logger.error(f"Unexpected error in get_recent: {e}")
             return []
 
+    def _search_recent(self, term: str, max_results: int) -> dict:
+        """Search one discover term for recent uploads. Safe to call from worker threads.
+
+        Args:
+            term: Search terms
+            max_results: Maximum number of results
+
+        Returns:
+            search.list response
+        """
+        # The client's shared httplib2.Http is not thread-safe; give each call its own.
+        # Discover is background work, so it leaves a reserve for user requests.
+        return self._search_list(
+            http=self._request_http(),
+            reserve=settings.youtube_quota_discover_reserve,
+            part="snippet",
+            type="video",
+            q=term,
+            maxResults=max_results,
+            order="date"
+        )
+
+    def _search_list(
+        self,
+        http: Optional[httplib2.Http] = None,
+        reserve: int = 0,
+        **params
+    ) -> dict:
+        """Call search.list, going through the response cache if there is one.
+
+        Args:
+            http: Transport for this call; the client's shared one if None
+            reserve: Quota units the call must leave unspent
+            **params: search.list parameters
+
+        Returns:
+            search.list response
+
+        Raises:
+            QuotaExhaustedError: If the response isn't cached and the call
+                would dip into the reserve
+        """
+        def fetch() -> dict:
+            return self._execute("search.list", self.youtube.search().list(**params), http, reserve)
+
+        if self.cache is None:
+            return fetch()
+        # Search is case-insensitive, so "Goalie Drills" shares an entry with "goalie drills"
+        key = {**params, "q": params.get("q", "").casefold()}
+        return self.cache.get_or_fetch("youtube.search", key, fetch)
+
+    def _execute(
+        self,
+        call: str,
+        request,
+        http: Optional[httplib2.Http] = None,
+        reserve: int = 0,
+    ) -> dict:
+        """Execute an API request with retries, charging it to the quota ledger.
+
+        Args:
+            call: Quota call type, e.g. "search.list"
+            request: googleapiclient HttpRequest
+            http: Transport for this call; the client's shared one if None
+            reserve: Quota units the call must leave unspent
+
+        Returns:
+            Response body
+
+        Raises:
+            QuotaExhaustedError: If the budget can't cover the call
+            UpstreamUnavailableError: If the API is down or keeps failing
+            HttpError: If the API rejects the call (not found, bad request, quota)
+        """
+        def attempt() -> dict:
+            # Retries are billed too, so each attempt is charged
+            if self.quota is not None and not self.quota.try_charge(call, reserve=reserve):
+                raise QuotaExhaustedError(
+                    f"{call} needs {self.quota.cost(call)} quota units, "
+                    f"{self.quota.remaining()} left (reserve {reserve})"
+                )
+            try:
+                return request.execute(http=http) if http is not None else request.execute()
+            except HttpError as e:
+                if self.quota is not None and self._is_quota_error(e):
+                    self.quota.mark_exhausted()
+                raise
+
+        return self.resilience.call(attempt)
+
+    @staticmethod
+    def _is_quota_error(error: HttpError) -> bool:
+        """Whether the API rejected a call because the daily quota is used up."""
+        return error.resp.status == 403 and any(
+            reason in (error.content or b"") for reason in QUOTA_ERROR_REASONS
+        )
+
+    def _quota_unavailable(self, message: str) -> UpstreamUnavailableError:
+        """Error for a call the daily quota can't cover, retryable after the reset."""
+        return UpstreamUnavailableError(
+            message,
+            source=self.source,
+            retry_after=QuotaLedger.seconds_until_reset(),
+        )
+
+    def _request_http(self) -> httplib2.Http:
+        """HTTP transport for one request, with the per-term timeout."""
+        if self.http is not None:
+            return self.http
+        return httplib2.Http(timeout=settings.youtube_discover_term_timeout)
+
     def _map_to_content_item(self, video: dict) -> ContentItem:
         """Map a YouTube video response to a ContentItem.
 
@@ -1,15 +1,24 @@
 """CLI entry point using Typer."""
 import json
+import queue
+import threading
+import time
 import typer
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
+from rich.live import Live
+from rich.progress import Progress
 from rich.table import Table
 
 from .config import settings
 from .models.content import ContentItem, ContentSource, ContentType
+from .ingestors.cache import ResponseCache
+from .ingestors.quota import QuotaLedger
 from .ingestors.youtube import YouTubeIngestor
 from .ingestors.reddit import RedditIngestor
+from .refresh import MetadataRefresher, source_from_name
+from .storage.repository import SaveResult
 from .storage.sqlite import SQLiteRepository
 
 app = typer.Typer(help="Goalie Drill Aggregator - Discover and save goalie training content")
@@ -53,48 +62,96 @@ def search(
     source: str = typer.Option("all", help="Source to search: youtube, reddit, or all"),
     max_results: int = typer.Option(10, help="Maximum number of results to return"),
     subreddits: Optional[str] = typer.Option(None, help="Comma-separated subreddit names (Reddit only)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Skip the response cache and query the APIs"),
+    timeout: float = typer.Option(30.0, help="Seconds to wait for each source; slower sources are skipped"),
 ):
     """
     Search for goalie drill content.
 
+    With --source all, YouTube and Reddit are searched at the same time and
+    each source's results are shown as soon as they arrive.
+
     Examples:
         python -m src.main search "butterfly drill" --source youtube --max-results 10
         python -m src.main search "goalie tips" --source reddit --subreddits hockeygoalies,hockeyplayers
+        python -m src.main search "glove save" --timeout 5
     """
     ensure_data_directory()
 
     all_results = []
+    quota = QuotaLedger(
+        settings.database_path,
+        daily_limit=settings.youtube_daily_quota,
+        pragmas=settings.sqlite_pragmas,
+    )
+    cache = None
+    if not no_cache:
+        cache = ResponseCache(
+            db_path=settings.response_cache_path,
+            ttls=settings.response_cache_ttls,
+            max_bytes=settings.response_cache_max_bytes,
+            pragmas=settings.sqlite_pragmas,
+        )
 
-    try:
-        # Search YouTube
-        if source in ["youtube", "all"]:
-            console.print(f"[cyan]Searching YouTube for: {query}[/cyan]")
-            youtube = YouTubeIngestor(settings.youtube_api_key)
-            youtube_results = youtube.search(query, max_results=max_results)
-            all_results.extend(youtube_results)
-            console.print(f"[green]Found {len(youtube_results)} YouTube videos[/green]")
-
-        # Search Reddit
-        if source in ["reddit", "all"]:
-            console.print(f"[cyan]Searching Reddit for: {query}[/cyan]")
-            reddit = RedditIngestor(
-                settings.reddit_client_id,
-                settings.reddit_client_secret,
-                settings.reddit_user_agent
-            )
+    # raise_errors: a source whose search fails is shown as failed below,
+    # not as "0 results"
+    searches = {}
+    if source in ["youtube", "all"]:
+        youtube = YouTubeIngestor(settings.youtube_api_key, cache=cache, quota=quota)
+        searches["YouTube"] = lambda: youtube.search(query, max_results=max_results, raise_errors=True)
+    if source in ["reddit", "all"]:
+        reddit = RedditIngestor(
+            settings.reddit_client_id,
+            settings.reddit_client_secret,
+            settings.reddit_user_agent,
+            cache=cache,
+        )
 
-            # Parse subreddits if provided
-            subreddit_list = None
-            if subreddits:
-                subreddit_list = [s.strip() for s in subreddits.split(',')]
+        # Parse subreddits if provided
+        subreddit_list = None
+        if subreddits:
+            subreddit_list = [s.strip() for s in subreddits.split(',')]
 
-            reddit_results = reddit.search(
-                query,
-                max_results=max_results,
-                subreddits=subreddit_list
-            )
-            all_results.extend(reddit_results)
-            console.print(f"[green]Found {len(reddit_results)} Reddit posts[/green]")
+        searches["Reddit"] = lambda: reddit.search(
+            query,
+            max_results=max_results,
+            subreddits=subreddit_list,
+            raise_errors=True,
+        )
+
+    # Display results in a table, filled in as each source finishes
+    table = Table(title=f"Search Results: {query}")
+    table.add_column("Index", justify="right", style="cyan")
+    table.add_column("Source", style="magenta")
+    table.add_column("Title", style="white", max_width=50)
+    table.add_column("Author", style="blue")
+    table.add_column("Views/Score", justify="right", style="green")
+
+    # Per-source state and latency, shown under the table
+    status = {name: "searching..." for name in searches}
+    pending = set(searches)
+
+    def show_status():
+        table.caption = " | ".join(f"{name}: {state}" for name, state in status.items())
+
+    show_status()
+    console.print(f"[cyan]Searching {', '.join(searches) or 'nothing'} for: {query}[/cyan]")
+
+    try:
+        with Live(table, console=console, refresh_per_second=8):
+            for name, elapsed, items, error in _search_concurrently(searches, timeout):
+                pending.discard(name)
+                if error is not None:
+                    status[name] = f"[red]failed after {elapsed:.2f}s: {error}[/red]"
+                else:
+                    status[name] = f"[green]{len(items)} in {elapsed:.2f}s[/green]"
+                    for item in items:
+                        _add_result_row(table, len(all_results), item)
+                        all_results.append(item)
+                show_status()
+            for name in pending:
+                status[name] = f"[yellow]timed out after {timeout:g}s[/yellow]"
+            show_status()
 
         if not all_results:
             console.print("[yellow]No results found.[/yellow]")
@@ -102,42 +159,74 @@ def search(
 
         # Save results
         save_last_search(all_results)
+        console.print(f"\n[dim]Results saved. Use 'save <index>' to save items to your collection.[/dim]")
 
-        # Display results in a table
-        table = Table(title=f"Search Results: {query}")
-        table.add_column("Index", justify="right", style="cyan")
-        table.add_column("Source", style="magenta")
-        table.add_column("Title", style="white", max_width=50)
-        table.add_column("Author", style="blue")
-        table.add_column("Views/Score", justify="right", style="green")
+    except Exception as e:
+        console.print(f"[red]Error during search: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        # A timed-out search may still be using them; the process is about to exit anyway
+        if not pending:
+            quota.close()
+            if cache is not None:
+                cache.close()
 
-        for idx, item in enumerate(all_results):
-            # Truncate title if too long
-            title = item.title
-            if len(title) > 47:
-                title = title[:47] + "..."
 
-            # Get engagement metric (views for YouTube, score for Reddit)
-            engagement = ""
-            if item.view_count is not None:
-                engagement = f"{item.view_count:,}"
-            elif item.like_count is not None:
-                engagement = f"{item.like_count:,}"
+def _search_concurrently(searches: dict, timeout: float):
+    """Run source searches at the same time, yielding each as it finishes.
 
-            table.add_row(
-                str(idx),
-                item.source.value,
-                title,
-                item.author or "N/A",
-                engagement
-            )
+    Searches run on daemon threads, so one that is still stuck when the
+    timeout passes is abandoned rather than keeping the command alive.
 
-        console.print(table)
-        console.print(f"\n[dim]Results saved. Use 'save <index>' to save items to your collection.[/dim]")
+    Args:
+        searches: Source name -> zero-argument search function
+        timeout: Seconds to wait, counted from when the searches start
 
-    except Exception as e:
-        console.print(f"[red]Error during search: {e}[/red]")
-        raise typer.Exit(1)
+    Yields:
+        (source name, seconds taken, results, exception or None) in completion order
+    """
+    finished = queue.Queue()
+
+    def run(name, search_fn):
+        start = time.perf_counter()
+        try:
+            items, error = search_fn(), None
+        except Exception as e:
+            items, error = [], e
+        finished.put((name, time.perf_counter() - start, items, error))
+
+    for name, search_fn in searches.items():
+        threading.Thread(target=run, args=(name, search_fn), name=f"search-{name}", daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    for _ in searches:
+        try:
+            yield finished.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            return
+
+
+def _add_result_row(table: Table, idx: int, item: ContentItem):
+    """Append one search result to the results table."""
+    # Truncate title if too long
+    title = item.title
+    if len(title) > 47:
+        title = title[:47] + "..."
+
+    # Get engagement metric (views for YouTube, score for Reddit)
+    engagement = ""
+    if item.view_count is not None:
+        engagement = f"{item.view_count:,}"
+    elif item.like_count is not None:
+        engagement = f"{item.like_count:,}"
+
+    table.add_row(
+        str(idx),
+        item.source.value,
+        title,
+        item.author or "N/A",
+        engagement
+    )
 
 
 @app.command()
@@ -179,7 +268,7 @@ def save(
             item.notes = notes
 
         # Save to repository
-        repo = SQLiteRepository(settings.database_path)
+        repo = SQLiteRepository(settings.database_path, pragmas=settings.sqlite_pragmas)
         repo.save(item)
 
         console.print(f"[green]✓ Saved: {item.title}[/green]")
@@ -195,6 +284,38 @@ def save(
         raise typer.Exit(1)
 
 
+@app.command("save-all")
+def save_all(
+    tags: Optional[str] = typer.Option(None, help="Comma-separated tags"),
+    collection: Optional[str] = typer.Option(None, help="Collection name"),
+):
+    """
+    Save every content item from the last search results.
+
+    Examples:
+        python -m src.main save-all --collection warmups
+    """
+    try:
+        results = load_last_search()
+
+        tags_list = [t.strip() for t in tags.split(',')] if tags else None
+        for item in results:
+            if tags_list:
+                item.tags = tags_list
+            if collection:
+                item.collection_id = collection
+
+        repo = SQLiteRepository(settings.database_path, pragmas=settings.sqlite_pragmas)
+        outcomes = repo.save_many(results)
+
+        inserted = sum(1 for outcome in outcomes if outcome == SaveResult.INSERTED)
+        console.print(f"[green]✓ Saved {len(results)} items ({inserted} new, {len(results) - inserted} updated)[/green]")
+
+    except Exception as e:
+        console.print(f"[red]Error saving items: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command()
 def list(
     source: Optional[str] = typer.Option(None, help="Filter by source: youtube, reddit"),
@@ -211,7 +332,7 @@ def list(
         python -m src.main list --collection warmups
     """
     try:
-        repo = SQLiteRepository(settings.database_path)
+        repo = SQLiteRepository(settings.database_path, pragmas=settings.sqlite_pragmas)
 
         # Convert source string to enum if provided
         source_enum = None
@@ -232,7 +353,8 @@ def list(
             query=query,
             source=source_enum,
             tags=tags_list,
-            collection_id=collection
+            collection_id=collection,
+            include_metadata=False,  # The table never shows source_metadata
         )
 
         if not items:
@@ -299,7 +421,7 @@ def delete(
             raise typer.Exit(1)
 
         # Get the item first to show what will be deleted
-        repo = SQLiteRepository(settings.database_path)
+        repo = SQLiteRepository(settings.database_path, pragmas=settings.sqlite_pragmas)
         item = repo.get_by_id(source_enum, content_id)
 
         if not item:
@@ -331,5 +453,118 @@ def delete(
         raise typer.Exit(1)
 
 
+@app.command()
+def refresh(
+    source: str = typer.Option("all", help="Source to refresh: youtube, reddit, or all"),
+    limit: int = typer.Option(settings.refresh_max_items, help="Maximum number of items to refresh"),
+    max_age_hours: float = typer.Option(
+        settings.refresh_max_age_hours, help="Refresh items fetched longer ago than this"
+    ),
+):
+    """
+    Refresh view, like and comment counts of saved content once.
+
+    Examples:
+        python -m src.main refresh
+        python -m src.main refresh --source reddit --max-age-hours 6
+    """
+    sources = None
+    if source != "all":
+        try:
+            sources = [source_from_name(source)]
+        except ValueError:
+            console.print(f"[red]Unknown source: {source}[/red]")
+            raise typer.Exit(1)
+
+    repo = SQLiteRepository(settings.database_path, pragmas=settings.sqlite_pragmas)
+    ledger = QuotaLedger(
+        settings.database_path,
+        daily_limit=settings.youtube_daily_quota,
+        pragmas=settings.sqlite_pragmas,
+    )
+    refresher = MetadataRefresher.from_settings(
+        repo,
+        {
+            ContentSource.YOUTUBE: YouTubeIngestor(settings.youtube_api_key, quota=ledger),
+            ContentSource.REDDIT: RedditIngestor(
+                settings.reddit_client_id,
+                settings.reddit_client_secret,
+                settings.reddit_user_agent,
+            ),
+        },
+        max_age_hours=max_age_hours,
+    )
+
+    try:
+        with Progress(console=console) as progress:
+            task = progress.add_task("Refreshing", total=None)
+
+            def update(stats):
+                progress.update(task, total=stats.selected, completed=stats.processed + stats.skipped)
+
+            stats = refresher.run(limit=limit, sources=sources, on_progress=update)
+            update(stats)
+
+        if not stats.selected:
+            console.print("[yellow]Nothing to refresh.[/yellow]")
+            return
+
+        table = Table(title="Metadata refresh")
+        table.add_column("Items", style="magenta")
+        table.add_column("Count", justify="right", style="green")
+        for label, count in [
+            ("Selected", stats.selected),
+            ("Updated", stats.updated),
+            ("Unchanged", stats.unchanged),
+            ("Deleted/removed", stats.gone),
+            ("Failed", stats.failed),
+            ("Skipped", stats.skipped),
+        ]:
+            table.add_row(label, f"{count:,}")
+
+        console.print(table)
+        console.print(
+            f"[dim]{stats.api_calls} API calls in {stats.elapsed:.1f}s "
+            f"({stats.items_per_second:.1f} items/s)[/dim]"
+        )
+    except Exception as e:
+        console.print(f"[red]Error refreshing metadata: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        ledger.close()
+        repo.close()
+
+
+@app.command()
+def quota():
+    """
+    Show today's YouTube API quota usage.
+
+    Examples:
+        python -m src.main quota
+    """
+    ledger = QuotaLedger(
+        settings.database_path,
+        daily_limit=settings.youtube_daily_quota,
+        pragmas=settings.sqlite_pragmas,
+    )
+    try:
+        table = Table(title=f"YouTube quota for {ledger.today()} (Pacific)")
+        table.add_column("Call", style="magenta")
+        table.add_column("Calls", justify="right", style="cyan")
+        table.add_column("Units", justify="right", style="green")
+
+        for call, usage in ledger.usage().items():
+            table.add_row(call, f"{usage['calls']:,}", f"{usage['units']:,}")
+
+        console.print(table)
+        console.print(
+            f"[bold]{ledger.remaining():,}[/bold] of {ledger.daily_limit:,} units left "
+            f"[dim](discover stops at {settings.youtube_quota_discover_reserve:,})[/dim]"
+        )
+    finally:
+        ledger.close()
+
+
 if __name__ == "__main__":
     app()
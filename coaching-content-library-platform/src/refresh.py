@@ -0,0 +1,388 @@
+"""Background refresh of engagement stats for saved content.
+
+view_count, like_count and comment_count are captured when an item is
+saved. MetadataRefresher re-fetches them for items whose copy has gone
+stale, most popular first, using each source's batch lookup (50 videos
+per videos.list call, 100 submissions per Reddit info() call). Each
+source has its own call budget per run, and only stats that changed are
+written back.
+"""
+import logging
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from .config import settings
+from .ingestors.base import BaseIngestor, Tombstone
+from .ingestors.reddit import INFO_BATCH_SIZE
+from .ingestors.resilience import CircuitBreaker
+from .ingestors.youtube import VIDEOS_PER_REQUEST
+from .models.content import ContentSource
+from .storage.sqlite import STATS_COLUMNS, SQLiteRepository, StatsRow
+
+logger = logging.getLogger(__name__)
+
+# IDs per batch lookup; sources without a batch endpoint aren't refreshed
+REFRESH_BATCH_SIZES = {
+    ContentSource.YOUTUBE: VIDEOS_PER_REQUEST,
+    ContentSource.REDDIT: INFO_BATCH_SIZE,
+}
+
+_SOURCES_BY_NAME = {source.value.lower(): source for source in ContentSource}
+
+
+def source_from_name(name: str) -> ContentSource:
+    """Parse a case-insensitive source name (e.g. "youtube") as used in settings and the CLI.
+
+    Raises:
+        ValueError: If no source has that name
+    """
+    try:
+        return _SOURCES_BY_NAME[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown content source: {name}") from None
+
+
+class RateBudget:
+    """Limits one source's API calls during a refresh run.
+
+    Calls are spaced at least 60 / calls_per_minute seconds apart, and at
+    most max_calls are made per run.
+    """
+
+    def __init__(
+        self,
+        calls_per_minute: float,
+        max_calls: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the budget.
+
+        Args:
+            calls_per_minute: Maximum call rate; 0 or less means unlimited
+            max_calls: Maximum calls in total (unlimited if None)
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.interval = 60.0 / calls_per_minute if calls_per_minute > 0 else 0.0
+        self.max_calls = max_calls
+        self.calls = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._next_call_at = 0.0
+
+    def acquire(self) -> bool:
+        """Wait for the next call slot.
+
+        Returns:
+            True if a call may be made, False if the budget is spent
+        """
+        if self.max_calls is not None and self.calls >= self.max_calls:
+            return False
+        wait = self._next_call_at - self._clock()
+        if wait > 0:
+            self._sleep(wait)
+        self._next_call_at = self._clock() + self.interval
+        self.calls += 1
+        return True
+
+
+@dataclass
+class RefreshStats:
+    """Progress and throughput of one refresh run.
+
+    Attributes:
+        selected: Stale items picked for this run
+        processed: Items whose batch lookup was made
+        updated: Items with at least one changed stat
+        unchanged: Items whose stats were unchanged
+        gone: Items the source reports deleted, removed or missing
+        failed: Items whose lookup failed (left stale to retry next run)
+        skipped: Items not looked up (budget spent, circuit open, no ingestor)
+        api_calls: Batch lookups made
+        started_at: When the run started
+        finished_at: When the run finished (None while running)
+        elapsed: Seconds spent so far
+    """
+    selected: int = 0
+    processed: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    gone: int = 0
+    failed: int = 0
+    skipped: int = 0
+    api_calls: int = 0
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+    elapsed: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Items processed per second of run time."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        """JSON-friendly summary, including throughput."""
+        summary = asdict(self)
+        summary["started_at"] = self.started_at.isoformat()
+        summary["finished_at"] = self.finished_at.isoformat() if self.finished_at else None
+        summary["elapsed"] = round(self.elapsed, 3)
+        summary["items_per_second"] = round(self.items_per_second, 2)
+        return summary
+
+
+class MetadataRefresher:
+    """Re-fetch engagement stats for stale saved items.
+
+    Items fetched more than max_age_hours ago are due. They are ranked by
+    age times log-popularity, so a popular video is refreshed before an
+    equally stale one nobody watches, but nothing waits forever.
+    """
+
+    def __init__(
+        self,
+        repository: SQLiteRepository,
+        ingestors: dict[ContentSource, BaseIngestor],
+        max_age_hours: float = 24,
+        calls_per_minute: Optional[dict[ContentSource, float]] = None,
+        max_calls: Optional[dict[ContentSource, int]] = None,
+        youtube_reserve: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the refresher.
+
+        Args:
+            repository: Repository holding the saved content
+            ingestors: Ingestor per source; sources without one are skipped
+            max_age_hours: Refresh items fetched longer ago than this
+            calls_per_minute: Per-source call rate limit (unlimited if absent)
+            max_calls: Per-source batch lookups per run (unlimited if absent)
+            youtube_reserve: YouTube quota units refreshes must leave unspent
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.repository = repository
+        self.ingestors = ingestors
+        self.max_age_hours = max_age_hours
+        self.calls_per_minute = calls_per_minute or {}
+        self.max_calls = max_calls or {}
+        self.youtube_reserve = youtube_reserve
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.progress: Optional[RefreshStats] = None
+        self.last_run: Optional[RefreshStats] = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        repository: SQLiteRepository,
+        ingestors: dict[ContentSource, BaseIngestor],
+        **overrides,
+    ) -> "MetadataRefresher":
+        """Build a refresher configured by the refresh_* settings.
+
+        Args:
+            repository: Repository holding the saved content
+            ingestors: Ingestor per source
+            **overrides: Constructor arguments to use instead of the settings
+
+        Returns:
+            MetadataRefresher
+        """
+        options = {
+            "max_age_hours": settings.refresh_max_age_hours,
+            "calls_per_minute": {
+                source_from_name(name): rate for name, rate in settings.refresh_calls_per_minute.items()
+            },
+            "max_calls": {
+                source_from_name(name): calls for name, calls in settings.refresh_max_calls.items()
+            },
+            "youtube_reserve": settings.youtube_quota_discover_reserve,
+        }
+        options.update(overrides)
+        return cls(repository, ingestors, **options)
+
+    def select(
+        self,
+        limit: Optional[int] = None,
+        sources: Optional[list[ContentSource]] = None,
+    ) -> list[StatsRow]:
+        """Pick the stale items to refresh, highest priority first.
+
+        Args:
+            limit: Maximum number of items (all due items if None)
+            sources: Only these sources (every refreshable source if None)
+
+        Returns:
+            StatsRow for each item to refresh
+        """
+        sources = [
+            source for source in (sources or REFRESH_BATCH_SIZES)
+            if source in REFRESH_BATCH_SIZES and source in self.ingestors
+        ]
+        if not sources:
+            return []
+
+        now = datetime.now(timezone.utc)
+        rows = self.repository.stats_due(now - timedelta(hours=self.max_age_hours), sources)
+        rows.sort(key=lambda row: self._priority(row, now), reverse=True)
+        return rows[:limit] if limit is not None else rows
+
+    def run(
+        self,
+        limit: Optional[int] = None,
+        sources: Optional[list[ContentSource]] = None,
+        on_progress: Optional[Callable[[RefreshStats], None]] = None,
+    ) -> RefreshStats:
+        """Refresh stale items once. Blocking.
+
+        Args:
+            limit: Maximum number of items to refresh
+            sources: Only these sources (every refreshable source if None)
+            on_progress: Called with the running stats after each batch
+
+        Returns:
+            Stats for the run
+
+        Raises:
+            RuntimeError: If another run is in progress
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A metadata refresh is already running")
+        try:
+            stats = RefreshStats()
+            self.progress = stats
+            start = self._clock()
+
+            rows = self.select(limit, sources)
+            stats.selected = len(rows)
+            by_source: dict[ContentSource, list[StatsRow]] = {}
+            for row in rows:
+                by_source.setdefault(row.source, []).append(row)
+
+            for source, source_rows in by_source.items():
+                self._refresh_source(source, source_rows, stats, start, on_progress)
+
+            stats.elapsed = self._clock() - start
+            stats.finished_at = datetime.now(timezone.utc)
+            self.last_run = stats
+            logger.info(
+                f"Refreshed {stats.processed}/{stats.selected} items in {stats.elapsed:.1f}s "
+                f"({stats.updated} changed, {stats.gone} gone, {stats.failed} failed, "
+                f"{stats.skipped} skipped, {stats.api_calls} calls)"
+            )
+            return stats
+        finally:
+            self._lock.release()
+
+    def status(self) -> dict:
+        """Current run's progress (if one is running) and the last finished run."""
+        running = self.progress if self.progress is not self.last_run else None
+        return {
+            "running": running.as_dict() if running else None,
+            "last_run": self.last_run.as_dict() if self.last_run else None,
+        }
+
+    def _refresh_source(
+        self,
+        source: ContentSource,
+        rows: list[StatsRow],
+        stats: RefreshStats,
+        start: float,
+        on_progress: Optional[Callable[[RefreshStats], None]],
+    ) -> None:
+        """Look up one source's items in batches and write back changed stats."""
+        ingestor = self.ingestors[source]
+        batch_size = REFRESH_BATCH_SIZES[source]
+        budget = RateBudget(
+            self.calls_per_minute.get(source, 0),
+            self.max_calls.get(source),
+            clock=self._clock,
+            sleep=self._sleep,
+        )
+
+        for offset in range(0, len(rows), batch_size):
+            remaining = len(rows) - offset
+            reason = self._stop_reason(ingestor)
+            if reason is None and not budget.acquire():
+                reason = f"call budget of {budget.max_calls} spent"
+            if reason is not None:
+                logger.info(f"Stopping {source.value} refresh with {remaining} items left: {reason}")
+                stats.skipped += remaining
+                break
+
+            batch = rows[offset:offset + batch_size]
+            stats.api_calls += 1
+            fetched_at = datetime.now(timezone.utc)
+            try:
+                results = self._lookup(ingestor, [row.id for row in batch])
+            except Exception as e:
+                logger.error(f"Error refreshing {len(batch)} {source.value} items: {e}")
+                results = {}
+
+            changes = {}
+            for row in batch:
+                result = results.get(row.id)
+                if result is None:
+                    stats.failed += 1
+                elif isinstance(result, Tombstone):
+                    # Keep the last known stats; just don't pick it again until it's stale
+                    stats.gone += 1
+                    changes[row.id] = {}
+                else:
+                    changed = self._changed_stats(row, result)
+                    changes[row.id] = changed
+                    if changed:
+                        stats.updated += 1
+                    else:
+                        stats.unchanged += 1
+
+            if changes:
+                self.repository.update_stats(source, changes, fetched_at)
+            stats.processed += len(batch)
+            stats.elapsed = self._clock() - start
+            if on_progress:
+                on_progress(stats)
+
+    def _lookup(self, ingestor: BaseIngestor, content_ids: list[str]) -> dict:
+        """Batch-fetch items, with tombstones where the source provides them."""
+        if ingestor.source == ContentSource.YOUTUBE:
+            return ingestor.lookup_many(content_ids, reserve=self.youtube_reserve)
+        if hasattr(ingestor, "lookup_many"):
+            return ingestor.lookup_many(content_ids)
+        return ingestor.get_many(content_ids)
+
+    def _stop_reason(self, ingestor: BaseIngestor) -> Optional[str]:
+        """Why no more lookups should be made for this source, if any."""
+        if ingestor.resilience.breaker.state == CircuitBreaker.OPEN:
+            return "circuit open"
+        quota = getattr(ingestor, "quota", None)
+        if quota is not None and not quota.can_afford("videos.list", reserve=self.youtube_reserve):
+            return "YouTube quota reserve reached"
+        return None
+
+    @staticmethod
+    def _changed_stats(row: StatsRow, item) -> dict:
+        """Stats that differ from the stored row. Missing (hidden) counts keep the stored value."""
+        changed = {}
+        for column in STATS_COLUMNS:
+            value = getattr(item, column)
+            if value is not None and value != getattr(row, column):
+                changed[column] = value
+        return changed
+
+    @staticmethod
+    def _priority(row: StatsRow, now: datetime) -> float:
+        """Staleness in hours, weighted by log popularity."""
+        fetched_at = row.fetched_at
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+        age_hours = max((now - fetched_at).total_seconds() / 3600, 0.0)
+        engagement = max(row.view_count or 0, (row.like_count or 0) + (row.comment_count or 0))
+        return age_hours * (1 + math.log10(1 + engagement))
@@ -1,5 +1,14 @@
 """Storage layer for content persistence."""
-from .repository import ContentRepository
-from .sqlite import SQLiteRepository
+from .jobs import Job, JobStatus, JobStore
+from .repository import ContentRepository, SaveResult
+from .sqlite import SearchPage, SQLiteRepository
 
-__all__ = ["ContentRepository", "SQLiteRepository"]
+__all__ = [
+    "ContentRepository",
+    "Job",
+    "JobStatus",
+    "JobStore",
+    "SaveResult",
+    "SearchPage",
+    "SQLiteRepository",
+]
@@ -0,0 +1,226 @@
+"""SQLite-backed queue of ingestion jobs."""
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+from .pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of an ingestion job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """One queued request to fetch and save a URL."""
+    id: str
+    status: JobStatus
+    payload: dict
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    attempts: int = 0
+    result_source: Optional[str] = None
+    result_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class JobStore:
+    """Persist ingestion jobs so queued work survives restarts.
+
+    Lives in the same database file as the content table. Workers claim
+    jobs with a single UPDATE ... RETURNING, so two workers (or two
+    processes) never run the same job.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/content.db",
+        pool_size: int = 2,
+        pragmas: Optional[dict] = None,
+        max_attempts: int = 3,
+    ):
+        """Initialize the job store.
+
+        Args:
+            db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled connections
+            pragmas: PRAGMA profile applied to each connection
+            max_attempts: Runs a job gets before requeue_running() fails it
+        """
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = ConnectionPool(db_path, size=pool_size, pragmas=pragmas)
+        self._init_db()
+
+    def _init_db(self):
+        """Create the jobs table."""
+        with self._pool.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result_source TEXT,
+                    result_id TEXT,
+                    error TEXT
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at ON jobs (status, created_at)"
+            )
+
+    def create(self, payload: dict) -> Job:
+        """Queue a new job.
+
+        Args:
+            payload: JSON-serializable request to run (e.g. a SaveContentRequest dump)
+
+        Returns:
+            The queued Job
+        """
+        job = Job(
+            id=uuid.uuid4().hex,
+            status=JobStatus.QUEUED,
+            payload=payload,
+            created_at=datetime.now(timezone.utc),
+        )
+        with self._pool.transaction() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, payload, created_at) VALUES (?, ?, ?, ?)",
+                (job.id, job.status.value, json.dumps(payload), job.created_at.isoformat()),
+            )
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by ID.
+
+        Args:
+            job_id: Job ID returned by create()
+
+        Returns:
+            Job if found, None otherwise
+        """
+        with self._pool.connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def claim(self) -> Optional[Job]:
+        """Mark the oldest queued job as running and return it.
+
+        Returns:
+            The claimed Job, or None if the queue is empty
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._pool.transaction() as conn:
+            rows = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, attempts = attempts + 1 "
+                "WHERE id = (SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1) "
+                "RETURNING *",
+                (JobStatus.RUNNING.value, now, JobStatus.QUEUED.value),
+            ).fetchall()
+        return self._row_to_job(rows[0]) if rows else None
+
+    def complete(self, job_id: str, source: str, content_id: str) -> None:
+        """Record that a job saved its content.
+
+        Args:
+            job_id: Job ID
+            source: ContentSource value of the saved item
+            content_id: ID of the saved item
+        """
+        self._finish(job_id, JobStatus.SUCCEEDED, result_source=source, result_id=content_id)
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Record that a job failed.
+
+        Args:
+            job_id: Job ID
+            error: Human-readable reason
+        """
+        self._finish(job_id, JobStatus.FAILED, error=error)
+
+    def _finish(self, job_id: str, status: JobStatus, **columns) -> None:
+        """Move a job to a terminal status."""
+        values = {
+            "status": status.value,
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            **columns,
+        }
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        with self._pool.transaction() as conn:
+            conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?",
+                [*values.values(), job_id],
+            )
+
+    def requeue_running(self) -> int:
+        """Put jobs interrupted by a shutdown or crash back on the queue.
+
+        Jobs that have already been claimed max_attempts times are failed
+        instead, so a job that crashes the worker isn't retried forever.
+        Only call this when no worker is running, e.g. at startup.
+
+        Returns:
+            Number of jobs requeued
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._pool.transaction() as conn:
+            failed = conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ? "
+                "WHERE status = ? AND attempts >= ?",
+                (
+                    JobStatus.FAILED.value,
+                    now,
+                    f"Interrupted {self.max_attempts} times; giving up",
+                    JobStatus.RUNNING.value,
+                    self.max_attempts,
+                ),
+            ).rowcount
+            count = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?",
+                (JobStatus.QUEUED.value, JobStatus.RUNNING.value),
+            ).rowcount
+        if failed:
+            logger.warning(f"Failed {failed} job(s) interrupted {self.max_attempts} times")
+        if count:
+            logger.info(f"Requeued {count} interrupted job(s)")
+        return count
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._pool.close()
+
+    def _row_to_job(self, row) -> Job:
+        """Convert a database row to a Job."""
+        def parse(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return Job(
+            id=row["id"],
+            status=JobStatus(row["status"]),
+            payload=json.loads(row["payload"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            started_at=parse(row["started_at"]),
+            finished_at=parse(row["finished_at"]),
+            attempts=row["attempts"],
+            result_source=row["result_source"],
+            result_id=row["result_id"],
+            error=row["error"],
+        )
@@ -0,0 +1,211 @@
+"""Bounded SQLite connection pool shared across threads."""
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolClosedError(RuntimeError):
+    """Raised when a connection is requested from a closed pool."""
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived SQLite connections.
+
+    Connections are opened lazily up to ``size`` and reused afterwards, so
+    the file open, schema read and per-connection setup happen once per
+    connection instead of once per query. Safe to use from FastAPI's
+    threadpool: each checkout hands a connection to exactly one thread.
+
+    A connection is only pinged on checkout if it sat idle for
+    ``ping_after`` seconds or its last use raised a SQLite error; a local
+    file connection that was fine a moment ago doesn't need a round trip
+    on every request.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 5,
+        timeout: float = 30.0,
+        pragmas: Optional[dict] = None,
+        ping_after: float = 30.0,
+    ):
+        """Initialize the pool.
+
+        Args:
+            db_path: Path to SQLite database file
+            size: Maximum number of open connections
+            timeout: Seconds to wait for a free connection before failing
+            pragmas: PRAGMA name -> value applied to every new connection
+            ping_after: Idle seconds after which a connection is checked
+                before being handed out
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.pragmas = dict(pragmas or {})
+        self.ping_after = ping_after
+        # (connection, monotonic time it was returned, or None if it must be checked)
+        self._idle: queue.LifoQueue[tuple[sqlite3.Connection, Optional[float]]] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure(conn)
+        return conn
+
+    def _configure(self, conn: sqlite3.Connection) -> None:
+        """Apply per-connection PRAGMAs. Runs once when a connection is opened."""
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        """Check that a pooled connection is still usable."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding unhealthy SQLite connection: {e}")
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a connection and free its slot."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._opened -= 1
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Check out an idle connection, opening a new one if below capacity."""
+        while True:
+            if self._closed:
+                raise PoolClosedError("Connection pool is closed")
+
+            try:
+                conn, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                conn = None
+
+            if conn is None:
+                with self._lock:
+                    can_open = self._opened < self.size
+                    if can_open:
+                        self._opened += 1
+                if can_open:
+                    try:
+                        return self._connect()
+                    except Exception:
+                        with self._lock:
+                            self._opened -= 1
+                        raise
+                try:
+                    conn, released_at = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"Timed out waiting for a SQLite connection after {self.timeout}s"
+                    )
+
+            if released_at is not None and time.monotonic() - released_at < self.ping_after:
+                return conn
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def _release(self, conn: sqlite3.Connection, failed: bool = False) -> None:
+        """Return a connection to the pool, rolling back any open transaction.
+
+        Args:
+            conn: Connection being returned
+            failed: Its last use raised a SQLite error; check it on next checkout
+        """
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Rollback failed, discarding SQLite connection: {e}")
+            self._discard(conn)
+            return
+
+        if self._closed:
+            self._discard(conn)
+        else:
+            self._idle.put((conn, None if failed else time.monotonic()))
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of a ``with`` block.
+
+        Uncommitted work is rolled back when the connection is returned.
+        """
+        conn = self._acquire()
+        failed = False
+        try:
+            yield conn
+        except sqlite3.Error:
+            failed = True
+            raise
+        finally:
+            self._release(conn, failed)
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection and commit on success, roll back on error.
+
+        Args:
+            immediate: Take the write lock up front with BEGIN IMMEDIATE, so
+                reads at the start of the block see the state the writes
+                apply to. Otherwise the transaction only starts at the first
+                write and earlier SELECTs run outside it.
+        """
+        with self.connection() as conn:
+            with conn:
+                if immediate:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+
+    def health_check(self) -> bool:
+        """Return True if a connection can be checked out and queried."""
+        try:
+            with self.connection() as conn:
+                conn.execute("SELECT 1").fetchone()
+            return True
+        except Exception as e:
+            logger.error(f"SQLite health check failed: {e}")
+            return False
+
+    def close(self) -> None:
+        """Close all idle connections and refuse new checkouts.
+
+        Connections currently checked out are closed when they are returned.
+        """
+        self._closed = True
+        while True:
+            try:
+                idle, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(idle)
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import Optional
 from ..models.content import ContentItem, ContentSource
 
+class SaveResult(str, Enum):
+    """Outcome of saving one item in a bulk save."""
+    INSERTED = "inserted"
+    UPDATED = "updated"
+
 class ContentRepository(ABC):
     """
     Abstract repository for content persistence.
@@ -13,6 +19,11 @@ class ContentRepository(ABC):
         """Save or update a content item."""
         pass
     
+    @abstractmethod
+    def save_many(self, items: list[ContentItem], chunk_size: int = 500) -> list[SaveResult]:
+        """Save or update many items in one transaction. Returns a result per item."""
+        pass
+    
     @abstractmethod
     def get_by_id(self, source: ContentSource, content_id: str) -> Optional[ContentItem]:
         """Retrieve a saved content item."""
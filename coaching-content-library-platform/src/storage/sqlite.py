@@ -2,29 +2,260 @@
 import sqlite3
 import json
 import logging
+import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 from datetime import datetime, timezone
 
 from ..models.content import ContentItem, ContentSource, ContentType, Difficulty
-from .repository import ContentRepository
+from .pool import ConnectionPool
+from .repository import ContentRepository, SaveResult
 
 logger = logging.getLogger(__name__)
 
+_SOURCES = {source.value: source for source in ContentSource}
+_CONTENT_TYPES = {content_type.value: content_type for content_type in ContentType}
+_DIFFICULTIES = {difficulty.value.lower(): difficulty for difficulty in Difficulty}
+
+# Columns every projection reads: identity, decoding and the pagination key
+KEY_COLUMNS = frozenset({"source", "id", "content_type", "saved_at"})
+
+# ContentItem fields stored as-is, JSON-encoded, or as ISO timestamps
+_PLAIN_FIELDS = (
+    "id", "title", "url", "description", "author", "thumbnail_url",
+    "view_count", "like_count", "comment_count", "notes", "collection_id",
+    "drill_description", "equipment", "age_group",
+)
+_JSON_FIELDS = {"source_metadata": dict, "tags": list, "drill_tags": list}
+_DATETIME_FIELDS = ("published_at", "fetched_at", "saved_at")
+
+_new_content_item = ContentItem.__new__
+_set_attr = object.__setattr__
+
+
+class RowDecoder:
+    """Decode content rows with precomputed column offsets.
+
+    Rows come from our own schema and were validated on the way in, so the
+    ContentItem is constructed directly, skipping validation.
+    One decoder is built per distinct column list and reused for every row.
+    Raises on anything unexpected so the caller can fall back to the
+    validating path.
+    """
+
+    def __init__(self, columns: tuple[str, ...]):
+        """Precompute where each ContentItem field lives in a row.
+
+        Args:
+            columns: Column names of the rows to decode
+        """
+        offsets = {name: i for i, name in enumerate(columns)}
+        self._plain = [(name, offsets[name]) for name in _PLAIN_FIELDS if name in offsets]
+        self._json = [
+            (name, offsets[name], empty) for name, empty in _JSON_FIELDS.items() if name in offsets
+        ]
+        self._datetimes = [(name, offsets[name]) for name in _DATETIME_FIELDS if name in offsets]
+        self._source = offsets["source"]
+        self._content_type = offsets["content_type"]
+        self._difficulty = offsets.get("difficulty")
+        # Required fields outside a projection stay unset, as with model_construct.
+        # Defaults are resolved here: FieldInfo.get_default() inspects the
+        # factory's signature on every call.
+        self._missing = [
+            (name, field.default_factory, field.default)
+            for name, field in ContentItem.model_fields.items()
+            if name not in offsets and not field.is_required()
+        ]
+
+    def __call__(self, row) -> ContentItem:
+        """Decode one row into a ContentItem."""
+        values = {name: row[i] for name, i in self._plain}
+
+        for name, i, empty in self._json:
+            raw = row[i]
+            values[name] = json.loads(raw) if raw else empty()
+
+        for name, i in self._datetimes:
+            raw = row[i]
+            values[name] = datetime.fromisoformat(raw) if raw else None
+
+        values["source"] = _SOURCES[row[self._source]]
+        values["content_type"] = _CONTENT_TYPES[row[self._content_type]]
+
+        if self._difficulty is not None:
+            # Normalize legacy lowercase values; unknown strings become None
+            raw = row[self._difficulty]
+            values["difficulty"] = _DIFFICULTIES.get(raw.lower()) if raw else None
+
+        fields_set = set(values)
+        for name, factory, default in self._missing:
+            values[name] = factory() if factory else default
+
+        # Equivalent to ContentItem.model_construct(**values) without its
+        # per-call field bookkeeping, which dominates decode time
+        item = _new_content_item(ContentItem)
+        _set_attr(item, "__dict__", values)
+        _set_attr(item, "__pydantic_fields_set__", fields_set)
+        _set_attr(item, "__pydantic_extra__", None)
+        _set_attr(item, "__pydantic_private__", None)
+        return item
+
+
+@dataclass
+class SearchPage:
+    """One page of search results.
+
+    next_key is the sort key of the last item, to pass as `after` for the
+    next page; None when there are no more results.
+    """
+
+    items: list[ContentItem]
+    next_key: Optional[tuple] = None
+
+
+@dataclass
+class StatsRow:
+    """Engagement stats of one saved item, as read for a metadata refresh."""
+
+    source: ContentSource
+    id: str
+    fetched_at: datetime
+    view_count: Optional[int] = None
+    like_count: Optional[int] = None
+    comment_count: Optional[int] = None
+
+
+# Secondary indexes managed by _ensure_schema. Indexes named idx_content_*
+# that are not listed here are dropped on startup; changed definitions are
+# rebuilt. Filter indexes end in the (saved_at, source, id) sort key so
+# filtered, paginated listings need no temp sort.
+CONTENT_INDEXES = {
+    # get(content_id) looks up by id without a source
+    "idx_content_id": "CREATE INDEX idx_content_id ON content (id)",
+    # Default listing order; also walked backwards for ORDER BY saved_at DESC LIMIT n
+    "idx_content_saved_at": "CREATE INDEX idx_content_saved_at ON content (saved_at, source, id)",
+    "idx_content_source_saved_at": "CREATE INDEX idx_content_source_saved_at ON content (source, saved_at, id)",
+    "idx_content_type_saved_at": "CREATE INDEX idx_content_type_saved_at ON content (content_type, saved_at, source, id)",
+    # Matches the case-insensitive LOWER(difficulty) = LOWER(?) filter
+    "idx_content_difficulty": "CREATE INDEX idx_content_difficulty ON content (LOWER(difficulty), saved_at, source, id)",
+    "idx_content_age_group": "CREATE INDEX idx_content_age_group ON content (age_group, saved_at, source, id)",
+    "idx_content_collection": "CREATE INDEX idx_content_collection ON content (collection_id, saved_at, source, id)",
+    # Metadata refresh picks items by source and staleness
+    "idx_content_source_fetched_at": "CREATE INDEX idx_content_source_fetched_at ON content (source, fetched_at)",
+}
+
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the row without
+# firing delete triggers, which would leave stale FTS entries
+UPSERT_SQL = """
+    INSERT INTO content (
+        source, id, content_type, title, url, description, author,
+        published_at, fetched_at, thumbnail_url, view_count,
+        like_count, comment_count, source_metadata, tags, notes,
+        saved_at, collection_id, drill_tags, drill_description, difficulty,
+        equipment, age_group
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (source, id) DO UPDATE SET
+        content_type = excluded.content_type,
+        title = excluded.title,
+        url = excluded.url,
+        description = excluded.description,
+        author = excluded.author,
+        published_at = excluded.published_at,
+        fetched_at = excluded.fetched_at,
+        thumbnail_url = excluded.thumbnail_url,
+        view_count = excluded.view_count,
+        like_count = excluded.like_count,
+        comment_count = excluded.comment_count,
+        source_metadata = excluded.source_metadata,
+        tags = excluded.tags,
+        notes = excluded.notes,
+        saved_at = excluded.saved_at,
+        collection_id = excluded.collection_id,
+        drill_tags = excluded.drill_tags,
+        drill_description = excluded.drill_description,
+        difficulty = excluded.difficulty,
+        equipment = excluded.equipment,
+        age_group = excluded.age_group
+"""
+
+# Drill metadata columns that update_metadata() may change
+METADATA_COLUMNS = ("drill_tags", "drill_description", "difficulty", "equipment", "age_group")
+
+# Columns owned by the user rather than the source; a refetch keeps them
+USER_COLUMNS = ("tags", "notes", "saved_at", "collection_id", *METADATA_COLUMNS)
+
+# Engagement stats that update_stats() may change
+STATS_COLUMNS = ("view_count", "like_count", "comment_count")
+
+# bm25() column weights for content_fts: title, description, drill_description, tags
+FTS_WEIGHTS = (10.0, 1.0, 5.0, 3.0)
+
+# content_fts rows are keyed by content's implicit rowid. content has a
+# composite TEXT primary key, so that rowid is not a stable alias: VACUUM may
+# renumber it and silently detach the index. Vacuum through
+# SQLiteRepository.vacuum(), which rebuilds the index afterwards; after a
+# VACUUM from the sqlite3 shell, call rebuild_fts().
+FTS_BACKFILL_SQL = """
+    INSERT INTO content_fts (rowid, title, description, drill_description, tags)
+    SELECT rowid, title, description, drill_description,
+           COALESCE(tags, '') || ' ' || COALESCE(drill_tags, '')
+    FROM content
+"""
+
+# Keeps content_fts in step with content. Tags and drill tags share one column.
+FTS_TRIGGERS = {
+    "content_fts_ai": """
+        CREATE TRIGGER content_fts_ai AFTER INSERT ON content BEGIN
+            INSERT INTO content_fts (rowid, title, description, drill_description, tags)
+            VALUES (new.rowid, new.title, new.description, new.drill_description,
+                    COALESCE(new.tags, '') || ' ' || COALESCE(new.drill_tags, ''));
+        END
+    """,
+    "content_fts_ad": """
+        CREATE TRIGGER content_fts_ad AFTER DELETE ON content BEGIN
+            DELETE FROM content_fts WHERE rowid = old.rowid;
+        END
+    """,
+    # Only text column changes touch the index, so metadata and stats updates don't churn it
+    "content_fts_au": """
+        CREATE TRIGGER content_fts_au
+        AFTER UPDATE OF title, description, drill_description, tags, drill_tags ON content
+        BEGIN
+            DELETE FROM content_fts WHERE rowid = old.rowid;
+            INSERT INTO content_fts (rowid, title, description, drill_description, tags)
+            VALUES (new.rowid, new.title, new.description, new.drill_description,
+                    COALESCE(new.tags, '') || ' ' || COALESCE(new.drill_tags, ''));
+        END
+    """,
+}
+
 
 class SQLiteRepository(ContentRepository):
     """SQLite-based content repository."""
 
-    def __init__(self, db_path: str = "data/content.db"):
+    def __init__(
+        self,
+        db_path: str = "data/content.db",
+        pool_size: int = 5,
+        pragmas: Optional[dict] = None,
+    ):
         """Initialize SQLite repository.
 
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled connections
+            pragmas: PRAGMA profile applied to each connection
+                (e.g. settings.sqlite_pragmas). SQLite defaults if None.
         """
         self.db_path = db_path
         self._ensure_data_directory()
+        self._pool = ConnectionPool(db_path, size=pool_size, pragmas=pragmas)
+        self._fts_enabled = False
+        self._decoders: dict[tuple[str, ...], RowDecoder] = {}
         self._init_db()
         self._ensure_schema()  # Run migrations for Phase 2 fields
+        self._ensure_fts()
 
     def _ensure_data_directory(self):
         """Ensure the data directory exists."""
@@ -33,7 +264,7 @@ class SQLiteRepository(ContentRepository):
 
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS content (
                     source TEXT NOT NULL,
@@ -57,14 +288,14 @@ class SQLiteRepository(ContentRepository):
                     PRIMARY KEY (source, id)
                 )
             """)
-            conn.commit()
 
     def _ensure_schema(self):
-        """Ensure database schema includes all Phase 2 fields.
+        """Ensure database schema includes all Phase 2 fields and indexes.
 
-        Adds missing columns to existing databases (migration).
+        Adds missing columns to existing databases (migration) and brings
+        the secondary index set in line with CONTENT_INDEXES.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             # Check existing columns
             cursor = conn.execute("PRAGMA table_info(content)")
             existing_columns = {row[1] for row in cursor.fetchall()}
@@ -87,7 +318,141 @@ class SQLiteRepository(ContentRepository):
                     logger.info(f"Adding column '{col_name}' to content table")
                     conn.execute(f"ALTER TABLE content ADD COLUMN {col_name} {col_type}")
 
-            conn.commit()
+            # Rows saved before saved_at was always set sort with everything
+            # else; the pagination key cannot contain NULLs
+            conn.execute("UPDATE content SET saved_at = fetched_at WHERE saved_at IS NULL")
+
+            # Sync managed indexes
+            existing_indexes = {
+                row[0]: row[1] for row in conn.execute(
+                    "SELECT name, sql FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = 'content' AND name LIKE 'idx_content_%'"
+                )
+            }
+            for index_name, existing_ddl in existing_indexes.items():
+                if CONTENT_INDEXES.get(index_name) != existing_ddl:
+                    logger.info(f"Dropping obsolete index '{index_name}'")
+                    conn.execute(f"DROP INDEX {index_name}")
+            for index_name, ddl in CONTENT_INDEXES.items():
+                if existing_indexes.get(index_name) != ddl:
+                    logger.info(f"Creating index '{index_name}'")
+                    conn.execute(ddl)
+
+            self._columns = [row[1] for row in conn.execute("PRAGMA table_info(content)")]
+
+    def _ensure_fts(self):
+        """Create the FTS5 index over searchable text and backfill it.
+
+        Databases created before the index get it built from existing rows.
+        If this SQLite build lacks FTS5, text search falls back to LIKE.
+        """
+        with self._pool.transaction() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'content_fts'"
+            ).fetchone()
+
+            if not exists:
+                try:
+                    conn.execute("""
+                        CREATE VIRTUAL TABLE content_fts USING fts5(
+                            title, description, drill_description, tags,
+                            tokenize = 'unicode61 remove_diacritics 2'
+                        )
+                    """)
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"FTS5 unavailable, using LIKE search: {e}")
+                    return
+
+                logger.info("Building content_fts index from existing content")
+                conn.execute(FTS_BACKFILL_SQL)
+
+            existing_triggers = {
+                row[0]: row[1] for row in conn.execute(
+                    "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"
+                )
+            }
+            for name, ddl in FTS_TRIGGERS.items():
+                ddl = ddl.strip()
+                if existing_triggers.get(name) == ddl:
+                    continue
+                if name in existing_triggers:
+                    logger.info(f"Replacing outdated trigger '{name}'")
+                    conn.execute(f"DROP TRIGGER {name}")
+                conn.execute(ddl)
+
+        self._fts_enabled = True
+
+    def _fts_query(self, query: str) -> Optional[str]:
+        """Convert free text into an FTS5 MATCH expression.
+
+        Each word becomes a quoted prefix term, so "butterfly push" matches
+        rows containing words starting with both "butterfly" and "push".
+
+        Returns:
+            MATCH expression, or None if FTS is unavailable or the query has no words
+        """
+        if not self._fts_enabled:
+            return None
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return None
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def _text_filter(self, query: str) -> tuple[str, str, list, Optional[str]]:
+        """Build the text-search part of a content query.
+
+        Args:
+            query: Free-text search
+
+        Returns:
+            Tuple of (join, where, params, order_by). order_by is a BM25
+            ranking expression when the FTS index is used, else None.
+        """
+        match = self._fts_query(query)
+        if match:
+            weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+            return (
+                " JOIN content_fts ON content_fts.rowid = content.rowid",
+                " AND content_fts MATCH ?",
+                [match],
+                f"bm25(content_fts, {weights})",
+            )
+
+        search_term = f"%{query}%"
+        return (
+            "",
+            " AND (content.title LIKE ? OR content.description LIKE ?)",
+            [search_term, search_term],
+            None,
+        )
+
+    def _item_to_row(self, item: ContentItem) -> tuple:
+        """Serialize a ContentItem into UPSERT_SQL parameter order."""
+        return (
+            item.source.value,
+            item.id,
+            item.content_type.value,
+            item.title,
+            item.url,
+            item.description,
+            item.author,
+            item.published_at.isoformat() if item.published_at else None,
+            item.fetched_at.isoformat(),
+            item.thumbnail_url,
+            item.view_count,
+            item.like_count,
+            item.comment_count,
+            json.dumps(item.source_metadata),
+            json.dumps(item.tags),
+            item.notes,
+            item.saved_at.isoformat() if item.saved_at else None,
+            item.collection_id,
+            json.dumps(item.drill_tags),
+            item.drill_description,
+            getattr(item.difficulty, 'value', item.difficulty),
+            item.equipment,
+            item.age_group,
+        )
 
     def save(self, item: ContentItem) -> None:
         """Save or update a content item.
@@ -99,41 +464,208 @@ class SQLiteRepository(ContentRepository):
         if item.saved_at is None:
             item.saved_at = datetime.now(timezone.utc)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO content (
-                    source, id, content_type, title, url, description, author,
-                    published_at, fetched_at, thumbnail_url, view_count,
-                    like_count, comment_count, source_metadata, tags, notes,
-                    saved_at, collection_id, drill_tags, drill_description, difficulty,
-                    equipment, age_group
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                item.source.value,
-                item.id,
-                item.content_type.value,
-                item.title,
-                item.url,
-                item.description,
-                item.author,
-                item.published_at.isoformat() if item.published_at else None,
-                item.fetched_at.isoformat(),
-                item.thumbnail_url,
-                item.view_count,
-                item.like_count,
-                item.comment_count,
-                json.dumps(item.source_metadata),
-                json.dumps(item.tags),
-                item.notes,
-                item.saved_at.isoformat() if item.saved_at else None,
-                item.collection_id,
-                json.dumps(item.drill_tags),
-                item.drill_description,
-                item.difficulty.value if item.difficulty else None,
-                item.equipment,
-                item.age_group,
-            ))
-            conn.commit()
+        with self._pool.transaction() as conn:
+            conn.execute(UPSERT_SQL, self._item_to_row(item))
+
+    def save_many(self, items: list[ContentItem], chunk_size: int = 500) -> list[SaveResult]:
+        """Save or update many content items in a single transaction.
+
+        Rows are written with executemany in chunks of `chunk_size`, so a
+        bulk import costs one commit instead of one per item.
+
+        Args:
+            items: ContentItems to save
+            chunk_size: Rows per executemany batch
+
+        Returns:
+            SaveResult for each item, in input order
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        now = datetime.now(timezone.utc)
+        for item in items:
+            if item.saved_at is None:
+                item.saved_at = now
+
+        results = []
+        seen = set()
+        # IMMEDIATE so a concurrent writer can't insert between the existence
+        # check and the upsert and turn a reported INSERTED into a lie
+        with self._pool.transaction(immediate=True) as conn:
+            for start in range(0, len(items), chunk_size):
+                chunk = items[start:start + chunk_size]
+                keys = [(item.source.value, item.id) for item in chunk]
+
+                placeholders = ", ".join("(?, ?)" for _ in keys)
+                existing = {
+                    (row[0], row[1]) for row in conn.execute(
+                        f"SELECT source, id FROM content WHERE (source, id) IN (VALUES {placeholders})",
+                        [part for key in keys for part in key],
+                    )
+                }
+
+                conn.executemany(UPSERT_SQL, [self._item_to_row(item) for item in chunk])
+
+                for key in keys:
+                    if key in existing or key in seen:
+                        results.append(SaveResult.UPDATED)
+                    else:
+                        results.append(SaveResult.INSERTED)
+                    seen.add(key)
+
+        return results
+
+    def update_metadata(self, content_id: str, fields: dict) -> Optional[ContentItem]:
+        """Update only the given drill metadata columns of one item.
+
+        Issues a single UPDATE ... RETURNING, so there is no read-modify-write
+        round trip and untouched columns (including source_metadata) are not
+        re-encoded.
+
+        Args:
+            content_id: Content ID (searches across all sources, like get())
+            fields: Column name -> new value; keys must be in METADATA_COLUMNS
+
+        Returns:
+            The updated ContentItem, or None if no item has that ID
+
+        Raises:
+            ValueError: If fields contains a column that is not drill metadata
+        """
+        unknown = set(fields) - set(METADATA_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot update columns: {', '.join(sorted(unknown))}")
+        if not fields:
+            return self.get(content_id)
+
+        assignments = []
+        params = []
+        for column in METADATA_COLUMNS:
+            if column not in fields:
+                continue
+            value = fields[column]
+            if column == "drill_tags":
+                value = json.dumps(value)
+            elif column == "difficulty" and value is not None:
+                value = self._normalize_difficulty(value)
+            assignments.append(f"{column} = ?")
+            params.append(value)
+        params.append(content_id)
+
+        with self._pool.transaction() as conn:
+            rows = conn.execute(
+                f"UPDATE content SET {', '.join(assignments)} "
+                "WHERE rowid = (SELECT rowid FROM content WHERE id = ? LIMIT 1) "
+                "RETURNING *",
+                params,
+            ).fetchall()
+
+        if not rows:
+            return None
+        return self._decode_rows(rows)[0]
+
+    def stats_due(
+        self,
+        fetched_before: datetime,
+        sources: Optional[list[ContentSource]] = None,
+    ) -> list[StatsRow]:
+        """List items whose stats were last fetched before a cutoff.
+
+        Reads only the key, fetched_at and stats columns, so scanning a
+        large library for refresh candidates stays cheap.
+
+        Args:
+            fetched_before: Items fetched at or after this time are skipped
+            sources: Only these sources (all if None)
+
+        Returns:
+            StatsRow for each stale item, oldest fetch first
+        """
+        if fetched_before.tzinfo is None:
+            fetched_before = fetched_before.replace(tzinfo=timezone.utc)
+        sql = (
+            "SELECT source, id, fetched_at, view_count, like_count, comment_count "
+            "FROM content WHERE fetched_at < ?"
+        )
+        params: list = [fetched_before.astimezone(timezone.utc).isoformat()]
+        if sources:
+            sql += f" AND source IN ({', '.join('?' for _ in sources)})"
+            params.extend(source.value for source in sources)
+        sql += " ORDER BY fetched_at"
+
+        with self._pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [
+            StatsRow(
+                source=_SOURCES[row[0]],
+                id=row[1],
+                fetched_at=datetime.fromisoformat(row[2]),
+                view_count=row[3],
+                like_count=row[4],
+                comment_count=row[5],
+            )
+            for row in rows
+        ]
+
+    def update_stats(
+        self,
+        source: ContentSource,
+        changes: dict[str, dict],
+        fetched_at: Optional[datetime] = None,
+    ) -> int:
+        """Record refreshed stats for many items in one transaction.
+
+        Only the columns given for an item are written; items with no
+        changed columns just get a new fetched_at. Text columns are never
+        touched, so the full-text index is left alone.
+
+        Args:
+            source: ContentSource of every item in `changes`
+            changes: Content ID -> {column: new value}; keys must be in STATS_COLUMNS
+            fetched_at: When the stats were fetched (now if None)
+
+        Returns:
+            Number of items updated
+
+        Raises:
+            ValueError: If a change names a column that is not a stat
+        """
+        for fields in changes.values():
+            unknown = set(fields) - set(STATS_COLUMNS)
+            if unknown:
+                raise ValueError(f"Cannot update columns: {', '.join(sorted(unknown))}")
+
+        fetched = (fetched_at or datetime.now(timezone.utc)).isoformat()
+        touched = [(fetched, source.value, content_id) for content_id, fields in changes.items() if not fields]
+
+        updated = 0
+        with self._pool.transaction() as conn:
+            for content_id, fields in changes.items():
+                if not fields:
+                    continue
+                columns = [column for column in STATS_COLUMNS if column in fields]
+                cursor = conn.execute(
+                    f"UPDATE content SET {', '.join(f'{column} = ?' for column in columns)}, "
+                    "fetched_at = ? WHERE source = ? AND id = ?",
+                    [*(fields[column] for column in columns), fetched, source.value, content_id],
+                )
+                updated += cursor.rowcount
+            if touched:
+                cursor = conn.executemany(
+                    "UPDATE content SET fetched_at = ? WHERE source = ? AND id = ?", touched
+                )
+                updated += cursor.rowcount
+        return updated
+
+    def _normalize_difficulty(self, value) -> str:
+        """Store known difficulty levels in PascalCase; keep anything else as given."""
+        raw = getattr(value, 'value', value)
+        try:
+            return Difficulty(raw.capitalize()).value
+        except ValueError:
+            return raw
 
     def get_by_id(self, source: ContentSource, content_id: str) -> Optional[ContentItem]:
         """Retrieve a saved content item.
@@ -145,8 +677,7 @@ class SQLiteRepository(ContentRepository):
         Returns:
             ContentItem if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._pool.connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM content WHERE source = ? AND id = ?",
                 (source.value, content_id)
@@ -156,34 +687,43 @@ class SQLiteRepository(ContentRepository):
             if row is None:
                 return None
 
-            return self._row_to_content_item(row)
+            return self._decode_rows([row])[0]
 
     def search_saved(
         self,
         query: Optional[str] = None,
         source: Optional[ContentSource] = None,
         tags: Optional[list[str]] = None,
-        collection_id: Optional[str] = None
+        collection_id: Optional[str] = None,
+        include_metadata: bool = True,
     ) -> list[ContentItem]:
         """Search through saved content with filters.
 
         Args:
-            query: Search in title and description (case-insensitive)
+            query: Full-text search over title, description, drill description
+                and tags (case-insensitive, ranked by relevance)
             source: Filter by ContentSource
             tags: Filter items containing any of the provided tags
             collection_id: Exact match on collection_id
+            include_metadata: Load source_metadata; when False it is neither
+                read nor decoded and items carry an empty dict
 
         Returns:
             List of matching ContentItem objects
         """
-        sql = "SELECT * FROM content WHERE 1=1"
+        sql = f"SELECT {self._projection(include_metadata)} FROM content"
+        where = " WHERE 1=1"
         params = []
+        rank = None
 
-        # Add query filter (search in title and description)
+        # Add query filter (full-text index, LIKE fallback)
         if query:
-            sql += " AND (title LIKE ? OR description LIKE ?)"
-            search_term = f"%{query}%"
-            params.extend([search_term, search_term])
+            join, text_where, text_params, rank = self._text_filter(query)
+            sql += join
+            where += text_where
+            params.extend(text_params)
+
+        sql += where
 
         # Add source filter
         if source:
@@ -207,14 +747,16 @@ class SQLiteRepository(ContentRepository):
             tags_sql = " OR ".join(tag_conditions)
             sql += f" AND EXISTS (SELECT 1 FROM json_each(content.tags) WHERE {tags_sql})"
 
-        sql += " ORDER BY saved_at DESC"
+        if rank:
+            sql += f" ORDER BY {rank}, saved_at DESC, source DESC, id DESC"
+        else:
+            sql += " ORDER BY saved_at DESC, source DESC, id DESC"
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._pool.connection() as conn:
             cursor = conn.execute(sql, params)
             rows = cursor.fetchall()
 
-            return [self._row_to_content_item(row) for row in rows]
+            return self._decode_rows(rows)
 
     def delete(self, source: ContentSource, content_id: str) -> bool:
         """Delete a saved content item.
@@ -226,14 +768,70 @@ class SQLiteRepository(ContentRepository):
         Returns:
             True if found and deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             cursor = conn.execute(
                 "DELETE FROM content WHERE source = ? AND id = ?",
                 (source.value, content_id)
             )
-            conn.commit()
             return cursor.rowcount > 0
 
+    def health_check(self) -> bool:
+        """Check that the database is reachable.
+
+        Returns:
+            True if a pooled connection can run a query
+        """
+        return self._pool.health_check()
+
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """Copy WAL frames back into the main database file.
+
+        No-op (returns (0, -1, -1)) when the database is not in WAL mode.
+
+        Args:
+            mode: PASSIVE, FULL, RESTART or TRUNCATE
+
+        Returns:
+            Tuple of (busy, wal_frames, checkpointed_frames)
+        """
+        mode = mode.upper()
+        if mode not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+
+        with self._pool.connection() as conn:
+            row = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+            return tuple(row)
+
+    def rebuild_fts(self) -> None:
+        """Rebuild content_fts from the content table's current rowids.
+
+        No-op when FTS5 is unavailable.
+        """
+        if not self._fts_enabled:
+            return
+        with self._pool.transaction(immediate=True) as conn:
+            conn.execute("DELETE FROM content_fts")
+            conn.execute(FTS_BACKFILL_SQL)
+
+    def vacuum(self) -> None:
+        """Compact the database file and rebuild the full-text index.
+
+        VACUUM may renumber content's implicit rowids, which content_fts is
+        keyed by, so the index is rebuilt right after. Use this instead of a
+        bare VACUUM.
+        """
+        with self._pool.connection() as conn:
+            conn.execute("VACUUM")
+        self.rebuild_fts()
+
+    def close(self) -> None:
+        """Checkpoint the WAL (if any) and close all pooled connections."""
+        try:
+            self.checkpoint("TRUNCATE")
+        except sqlite3.Error as e:
+            logger.warning(f"WAL checkpoint on close failed: {e}")
+        self._pool.close()
+
     # Convenience methods for API (Phase 2)
 
     def get(self, content_id: str) -> Optional[ContentItem]:
@@ -245,8 +843,7 @@ class SQLiteRepository(ContentRepository):
         Returns:
             ContentItem if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._pool.connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM content WHERE id = ? LIMIT 1",
                 (content_id,)
@@ -256,145 +853,288 @@ class SQLiteRepository(ContentRepository):
             if row is None:
                 return None
 
-            return self._row_to_content_item(row)
+            return self._decode_rows([row])[0]
 
-    def search(
+    def _projection(
         self,
-        query: str = "",
-        criteria: Optional[dict] = None,
-        limit: int = 10
-    ) -> list[ContentItem]:
-        """Search content with flexible criteria.
+        include_metadata: bool = True,
+        fields: Optional[list[str]] = None,
+    ) -> str:
+        """Build the content column list for a SELECT.
 
         Args:
-            query: Text search in title and description
-            criteria: Dict with optional filters (source, content_type, difficulty, skill_focus, etc.)
-            limit: Maximum number of results
+            include_metadata: Whether to read the source_metadata JSON blob
+            fields: Only read these columns. The key columns (source, id,
+                content_type, saved_at) are always read.
 
         Returns:
-            List of matching ContentItem objects
+            SQL column list
+
+        Raises:
+            ValueError: If a field is not a content column
+        """
+        if fields is not None:
+            unknown = set(fields) - set(self._columns)
+            if unknown:
+                raise ValueError(f"Unknown content fields: {', '.join(sorted(unknown))}")
+            wanted = KEY_COLUMNS | set(fields)
+            return ", ".join(f"content.{column}" for column in self._columns if column in wanted)
+        if include_metadata:
+            return "content.*"
+        return ", ".join(
+            f"content.{column}" for column in self._columns if column != "source_metadata"
+        )
+
+    def _search_filters(
+        self,
+        query: str,
+        criteria: Optional[dict],
+    ) -> tuple[str, str, list, Optional[str]]:
+        """Build the FROM and WHERE clauses shared by search_page() and count().
+
+        Args:
+            query: Free-text search
+            criteria: Dict with optional filters
+
+        Returns:
+            Tuple of (from, where, params, rank). rank is a BM25 expression
+            when the query uses the FTS index, else None.
         """
-        sql = "SELECT * FROM content WHERE 1=1"
+        from_sql = " FROM content"
+        where = " WHERE 1=1"
         params = []
+        rank = None
 
-        # Add text search
+        # Add text search (full-text index, LIKE fallback)
         if query:
-            sql += " AND (title LIKE ? OR description LIKE ?)"
-            search_term = f"%{query}%"
-            params.extend([search_term, search_term])
+            join, text_where, text_params, rank = self._text_filter(query)
+            from_sql += join
+            where += text_where
+            params.extend(text_params)
 
         # Add criteria filters
         if criteria:
             if "source" in criteria:
-                sql += " AND source = ?"
+                where += " AND source = ?"
                 params.append(criteria["source"].value)
 
             if "content_type" in criteria:
-                sql += " AND content_type = ?"
+                where += " AND content_type = ?"
                 params.append(criteria["content_type"].value)
 
             if "difficulty" in criteria:
                 # Case-insensitive comparison to handle legacy lowercase data
-                sql += " AND LOWER(difficulty) = LOWER(?)"
+                where += " AND LOWER(difficulty) = LOWER(?)"
                 params.append(criteria["difficulty"].value if hasattr(criteria["difficulty"], 'value') else criteria["difficulty"])
 
             if "equipment" in criteria:
-                sql += " AND equipment LIKE ?"
+                where += " AND equipment LIKE ?"
                 params.append(f"%{criteria['equipment']}%")
 
             if "age_group" in criteria:
-                sql += " AND age_group = ?"
+                where += " AND age_group = ?"
                 params.append(criteria["age_group"])
 
-        sql += " ORDER BY saved_at DESC LIMIT ?"
-        params.append(limit)
+        return from_sql, where, params, rank
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(sql, params)
-            rows = cursor.fetchall()
+    def search(
+        self,
+        query: str = "",
+        criteria: Optional[dict] = None,
+        limit: int = 10,
+        include_metadata: bool = True,
+        fields: Optional[list[str]] = None,
+    ) -> list[ContentItem]:
+        """Search content with flexible criteria.
 
-            return [self._row_to_content_item(row) for row in rows]
+        Args:
+            query: Full-text search over title, description, drill description
+                and tags; results are ranked by BM25 relevance
+            criteria: Dict with optional filters (source, content_type, difficulty, skill_focus, etc.)
+            limit: Maximum number of results
+            include_metadata: Load source_metadata (see search_saved())
+            fields: Only load these columns (see search_page())
 
-    def _row_to_content_item(self, row: sqlite3.Row) -> ContentItem:
-        """Convert a database row to a ContentItem.
+        Returns:
+            List of matching ContentItem objects
+        """
+        return self.search_page(
+            query,
+            criteria=criteria,
+            limit=limit,
+            include_metadata=include_metadata,
+            fields=fields,
+        ).items
+
+    def search_page(
+        self,
+        query: str = "",
+        criteria: Optional[dict] = None,
+        limit: int = 10,
+        after: Optional[tuple] = None,
+        include_metadata: bool = True,
+        fields: Optional[list[str]] = None,
+    ) -> SearchPage:
+        """Fetch one page of search results using keyset pagination.
+
+        Results are ordered by (saved_at, source, id) descending, or by
+        relevance first for text queries. Instead of an OFFSET, each page
+        continues strictly after the sort key of the previous page's last
+        row, so deep pages cost the same as the first.
 
         Args:
-            row: SQLite row object
+            query: Full-text search (see search())
+            criteria: Dict with optional filters (see search())
+            limit: Maximum number of results
+            after: next_key from the previous page, or None for the first page
+            include_metadata: Load source_metadata (see search_saved())
+            fields: Only load these columns; overrides include_metadata.
+                Items are sparse: fields that were not loaded and have no
+                default are unset on the returned ContentItems.
 
         Returns:
-            ContentItem object
+            SearchPage with the items and the key to continue from
+
+        Raises:
+            ValueError: If `after` does not fit this query's sort order,
+                or `fields` names a column that does not exist
         """
-        # Parse JSON fields
-        source_metadata = json.loads(row['source_metadata']) if row['source_metadata'] else {}
-        tags = json.loads(row['tags']) if row['tags'] else []
+        from_sql, where, params, rank = self._search_filters(query, criteria)
+        columns = self._projection(include_metadata, fields)
+
+        if rank:
+            select = f"SELECT {columns}, {rank} AS rank_score"
+            order = "rank_score, saved_at DESC, source DESC, id DESC"
+        else:
+            select = f"SELECT {columns}"
+            order = "saved_at DESC, source DESC, id DESC"
+
+        if after is not None:
+            key_size = 4 if rank else 3
+            if len(after) != key_size:
+                raise ValueError("Pagination key does not match this query")
+            if rank:
+                where += (
+                    " AND (rank_score > ? OR (rank_score = ?"
+                    " AND (saved_at, source, id) < (?, ?, ?)))"
+                )
+                params.extend([after[0], after[0], *after[1:]])
+            else:
+                where += " AND (saved_at, source, id) < (?, ?, ?)"
+                params.extend(after)
+
+        # Fetch one extra row to learn whether another page exists
+        sql = f"{select}{from_sql}{where} ORDER BY {order} LIMIT ?"
+        params.append(limit + 1)
+
+        with self._pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_key = (last['saved_at'], last['source'], last['id'])
+            if rank:
+                next_key = (last['rank_score'], *next_key)
+
+        return SearchPage(
+            items=self._decode_rows(rows),
+            next_key=next_key,
+        )
 
-        # Parse datetime fields
-        published_at = None
-        if row['published_at']:
-            try:
-                published_at = datetime.fromisoformat(row['published_at'])
-            except ValueError as e:
-                logger.warning(f"Failed to parse published_at: {e}")
+    def count(self, query: str = "", criteria: Optional[dict] = None) -> int:
+        """Count all content matching a search, ignoring pagination.
 
-        fetched_at = datetime.fromisoformat(row['fetched_at'])
+        Args:
+            query: Full-text search (see search())
+            criteria: Dict with optional filters (see search())
 
-        saved_at = None
-        if row['saved_at']:
-            try:
-                saved_at = datetime.fromisoformat(row['saved_at'])
-            except ValueError as e:
-                logger.warning(f"Failed to parse saved_at: {e}")
+        Returns:
+            Number of matching items
+        """
+        from_sql, where, params, _ = self._search_filters(query, criteria)
+
+        with self._pool.connection() as conn:
+            return conn.execute(f"SELECT COUNT(*){from_sql}{where}", params).fetchone()[0]
 
-        # Get Phase 2 fields (with migration compatibility)
-        row_keys = row.keys()
+    def _decode_rows(self, rows: list[sqlite3.Row]) -> list[ContentItem]:
+        """Convert rows from one query into ContentItems via the trusted fast path.
 
-        # Parse drill_tags from JSON
-        drill_tags = []
-        if 'drill_tags' in row_keys and row['drill_tags']:
+        Rows that the fast path cannot decode (bad JSON, unknown enum values,
+        malformed timestamps) go through the validating _row_to_content_item.
+
+        Args:
+            rows: Rows sharing the same column list
+
+        Returns:
+            List of ContentItem objects, in row order
+        """
+        if not rows:
+            return []
+
+        columns = tuple(rows[0].keys())
+        decoder = self._decoders.get(columns)
+        if decoder is None:
+            decoder = self._decoders[columns] = RowDecoder(columns)
+
+        items = []
+        for row in rows:
             try:
-                drill_tags = json.loads(row['drill_tags'])
-            except (json.JSONDecodeError, TypeError):
-                logger.warning(f"Failed to parse drill_tags for {row['id']}")
+                items.append(decoder(row))
+            except (KeyError, ValueError, TypeError, AttributeError):
+                items.append(self._row_to_content_item(row))
+        return items
 
-        drill_description = row['drill_description'] if 'drill_description' in row_keys else None
+    def _row_to_content_item(self, row: sqlite3.Row) -> ContentItem:
+        """Convert a database row to a ContentItem with full validation.
+
+        Slow path for rows the RowDecoder rejects. Like RowDecoder, it
+        honours the query's projection: columns that weren't selected get
+        their model defaults, and required fields outside the projection
+        stay unset. Unparseable JSON or timestamps are logged and replaced
+        by their defaults.
+
+        Args:
+            row: SQLite row object
+
+        Returns:
+            ContentItem object
+        """
+        row_keys = set(row.keys())
+        values = {name: row[name] for name in _PLAIN_FIELDS if name in row_keys}
+        values['source'] = ContentSource(row['source'])
+        values['content_type'] = ContentType(row['content_type'])
+
+        # Parse JSON fields
+        for name, empty in _JSON_FIELDS.items():
+            if name not in row_keys:
+                continue
+            values[name] = empty()
+            if row[name]:
+                try:
+                    values[name] = json.loads(row[name])
+                except (json.JSONDecodeError, TypeError):
+                    logger.warning(f"Failed to parse {name} for {row['id']}")
+
+        # Parse datetime fields; an unparseable fetched_at falls back to now
+        for name in _DATETIME_FIELDS:
+            if name not in row_keys or not row[name]:
+                continue
+            try:
+                values[name] = datetime.fromisoformat(row[name])
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to parse {name} for {row['id']}: {e}")
+                if name != 'fetched_at':
+                    values[name] = None
 
         # Normalize difficulty to PascalCase enum value (handles legacy lowercase data)
-        difficulty_raw = row['difficulty'] if 'difficulty' in row_keys else None
-        difficulty = None
-        if difficulty_raw:
-            difficulty_map = {
-                'beginner': Difficulty.BEGINNER,
-                'intermediate': Difficulty.INTERMEDIATE,
-                'advanced': Difficulty.ADVANCED,
-            }
-            difficulty = difficulty_map.get(difficulty_raw.lower())
-
-        equipment = row['equipment'] if 'equipment' in row_keys else None
-        age_group = row['age_group'] if 'age_group' in row_keys else None
-
-        return ContentItem(
-            id=row['id'],
-            source=ContentSource(row['source']),
-            content_type=ContentType(row['content_type']),
-            title=row['title'],
-            url=row['url'],
-            description=row['description'],
-            author=row['author'],
-            published_at=published_at,
-            fetched_at=fetched_at,
-            thumbnail_url=row['thumbnail_url'],
-            view_count=row['view_count'],
-            like_count=row['like_count'],
-            comment_count=row['comment_count'],
-            source_metadata=source_metadata,
-            tags=tags,
-            notes=row['notes'],
-            saved_at=saved_at,
-            collection_id=row['collection_id'],
-            drill_tags=drill_tags,
-            drill_description=drill_description,
-            difficulty=difficulty,
-            equipment=equipment,
-            age_group=age_group,
-        )
+        if 'difficulty' in row_keys:
+            difficulty_raw = row['difficulty']
+            values['difficulty'] = _DIFFICULTIES.get(difficulty_raw.lower()) if difficulty_raw else None
+
+        if all(name in values for name, field in ContentItem.model_fields.items() if field.is_required()):
+            return ContentItem(**values)
+        # Sparse projection: build it the way RowDecoder does, leaving
+        # unselected required fields unset
+        return ContentItem.model_construct(**values)
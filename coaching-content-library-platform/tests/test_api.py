@@ -1,10 +1,20 @@
 """Tests for FastAPI backend."""
+import asyncio
+import time
+import httpx
 import pytest
+import tempfile
+from pathlib import Path
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 
+from src.api.jobs import JobRunner, job_executor
+from src.api.routes import ingest_executor
 from src.api.main import app
+from src.ingestors.resilience import CircuitOpenError
 from src.models.content import ContentItem, ContentSource, ContentType
+from src.storage.jobs import JobStatus, JobStore
+from src.storage.sqlite import SearchPage, SQLiteRepository
 
 
 class TestHealthCheck:
@@ -41,6 +51,7 @@ class TestSaveContent:
         )
         mock_ingestor.from_url.return_value = mock_content
         mock_ingestors.get.return_value = mock_ingestor
+        mock_repo.get_by_id.return_value = None  # Not saved yet
 
         # Mock repository
         mock_repo.save.return_value = None
@@ -78,6 +89,7 @@ class TestSaveContent:
         )
         mock_ingestor.from_url.return_value = mock_content
         mock_ingestors.get.return_value = mock_ingestor
+        mock_repo.get_by_id.return_value = None  # Not saved yet
 
         client = TestClient(app)
         response = client.post(
@@ -126,6 +138,7 @@ class TestSaveContent:
         mock_ingestor = Mock()
         mock_ingestor.from_url.return_value = None  # Content not found
         mock_ingestors.get.return_value = mock_ingestor
+        mock_repo.get_by_id.return_value = None  # Not saved yet
 
         client = TestClient(app)
         response = client.post(
@@ -139,6 +152,31 @@ class TestSaveContent:
         assert response.status_code == 404
         assert "Could not fetch content" in response.json()["detail"]
 
+    @patch('src.api.routes.repository')
+    @patch('src.api.routes.ingestors')
+    def test_save_content_upstream_unavailable(self, mock_ingestors, mock_repo):
+        """Test that an unavailable upstream is a 503 with Retry-After, not a 404."""
+        mock_ingestor = Mock()
+        mock_ingestor.extract_id.return_value = "down123"
+        mock_ingestor.from_url.side_effect = CircuitOpenError(
+            "YouTube is unavailable (circuit open)",
+            source=ContentSource.YOUTUBE,
+            retry_after=12.3,
+        )
+        mock_ingestors.get.return_value = mock_ingestor
+        mock_repo.get_by_id.return_value = None
+
+        client = TestClient(app)
+        response = client.post(
+            "/api/v1/content",
+            json={"url": "https://youtube.com/watch?v=down123", "source": "YouTube"}
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "13"
+        assert "circuit open" in response.json()["detail"]
+        mock_repo.save.assert_not_called()
+
 
 class TestListContent:
     """Test GET /api/v1/content endpoint."""
@@ -146,7 +184,7 @@ class TestListContent:
     @patch('src.api.routes.repository')
     def test_list_content_empty(self, mock_repo):
         """Test listing content when database is empty."""
-        mock_repo.search.return_value = []
+        mock_repo.search_page.return_value = SearchPage(items=[])
 
         client = TestClient(app)
         response = client.get("/api/v1/content")
@@ -155,6 +193,7 @@ class TestListContent:
         data = response.json()
         assert data["items"] == []
         assert data["total"] == 0
+        assert data["next_cursor"] is None
 
     @patch('src.api.routes.repository')
     def test_list_content_with_results(self, mock_repo):
@@ -175,7 +214,7 @@ class TestListContent:
                 url="https://reddit.com/1",
             ),
         ]
-        mock_repo.search.return_value = mock_items
+        mock_repo.search_page.return_value = SearchPage(items=mock_items)
 
         client = TestClient(app)
         response = client.get("/api/v1/content")
@@ -187,10 +226,34 @@ class TestListContent:
         assert data["items"][0]["id"] == "item1"
         assert data["items"][1]["id"] == "item2"
 
+    @patch('src.api.routes.repository')
+    def test_list_content_skips_revalidation(self, mock_repo):
+        """Test that listed items are serialized without validating them again."""
+        mock_repo.search_page.return_value = SearchPage(items=[ContentItem(
+            id="item1",
+            source=ContentSource.YOUTUBE,
+            content_type=ContentType.VIDEO,
+            title="Video 1",
+            url="https://youtube.com/1",
+            difficulty="Beginner",
+        )])
+        client = TestClient(app)
+
+        # serialize_response is where FastAPI validates against response_model
+        with patch("fastapi.routing.serialize_response", side_effect=AssertionError):
+            response = client.get("/api/v1/content")
+
+        assert response.status_code == 200
+        assert response.json()["items"][0]["difficulty"] == "Beginner"
+        schema = client.get("/openapi.json").json()["paths"]["/api/v1/content"]["get"]
+        assert schema["responses"]["200"]["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/ContentListResponse"
+        }
+
     @patch('src.api.routes.repository')
     def test_list_content_with_filters(self, mock_repo):
         """Test listing content with filters."""
-        mock_repo.search.return_value = []
+        mock_repo.search_page.return_value = SearchPage(items=[])
 
         client = TestClient(app)
         response = client.get(
@@ -205,8 +268,8 @@ class TestListContent:
 
         assert response.status_code == 200
         # Verify repository was called with correct criteria
-        mock_repo.search.assert_called_once()
-        call_args = mock_repo.search.call_args
+        mock_repo.search_page.assert_called_once()
+        call_args = mock_repo.search_page.call_args
         assert call_args[1]["criteria"]["source"] == ContentSource.YOUTUBE
         assert call_args[1]["criteria"]["content_type"] == ContentType.VIDEO
         assert call_args[1]["criteria"]["difficulty"] == "intermediate"
@@ -215,7 +278,7 @@ class TestListContent:
     @patch('src.api.routes.repository')
     def test_list_content_with_query(self, mock_repo):
         """Test searching content with query."""
-        mock_repo.search.return_value = []
+        mock_repo.search_page.return_value = SearchPage(items=[])
 
         client = TestClient(app)
         response = client.get(
@@ -225,11 +288,476 @@ class TestListContent:
 
         assert response.status_code == 200
         # Verify repository was called with query
-        mock_repo.search.assert_called_once()
-        call_args = mock_repo.search.call_args
+        mock_repo.search_page.assert_called_once()
+        call_args = mock_repo.search_page.call_args
         assert call_args[0][0] == "butterfly push"
 
 
+class TestListPagination:
+    """Test cursor pagination on GET /api/v1/content against a real database."""
+
+    @pytest.fixture
+    def repo(self):
+        """Temporary repository seeded with 25 items saved at distinct times."""
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_file.close()
+        repo = SQLiteRepository(temp_file.name)
+        for i in range(25):
+            repo.save(ContentItem(
+                id=f"drill{i:02d}",
+                source=ContentSource.YOUTUBE if i % 2 else ContentSource.REDDIT,
+                content_type=ContentType.VIDEO,
+                title=f"Butterfly drill {i}",
+                url=f"https://youtube.com/watch?v=drill{i:02d}",
+                saved_at=f"2024-01-01T00:00:{i // 2:02d}+00:00",  # Ties on saved_at
+            ))
+        with patch('src.api.routes.repository', repo):
+            yield repo
+        repo.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+    def fetch_all(self, client, **params):
+        """Follow next_cursor until exhausted, returning all ids and page count."""
+        ids, pages, cursor = [], 0, None
+        while True:
+            response = client.get("/api/v1/content", params={**params, **({"cursor": cursor} if cursor else {})})
+            assert response.status_code == 200
+            data = response.json()
+            ids.extend(item["id"] for item in data["items"])
+            pages += 1
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return ids, pages
+
+    def test_pages_cover_every_item_once(self, repo):
+        """Test that walking the cursor yields every item exactly once, newest first."""
+        client = TestClient(app)
+
+        ids, pages = self.fetch_all(client, limit=10)
+
+        assert pages == 3
+        assert len(ids) == 25
+        assert len(set(ids)) == 25
+        assert ids[0] == "drill24"
+
+    def test_pages_with_text_query(self, repo):
+        """Test that relevance-ranked results paginate without gaps."""
+        client = TestClient(app)
+
+        ids, _ = self.fetch_all(client, query="butterfly", limit=7)
+
+        assert sorted(ids) == sorted(f"drill{i:02d}" for i in range(25))
+
+    def test_include_total(self, repo):
+        """Test that total_count counts all matches, not just the page."""
+        client = TestClient(app)
+
+        data = client.get(
+            "/api/v1/content",
+            params={"source": "YouTube", "limit": 5, "include_total": True},
+        ).json()
+
+        assert data["total"] == 5
+        assert data["total_count"] == 12
+        assert data["next_cursor"] is not None
+
+    def test_total_count_omitted_by_default(self, repo):
+        """Test that the count query only runs on request."""
+        data = TestClient(app).get("/api/v1/content").json()
+
+        assert data["total_count"] is None
+
+    def test_invalid_cursor(self, repo):
+        """Test that a garbage cursor is a 400, not a 500."""
+        client = TestClient(app)
+
+        response = client.get("/api/v1/content", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert "Invalid cursor" in response.json()["detail"]
+
+    def test_cursor_from_different_query(self, repo):
+        """Test that reusing a listing cursor for a text search is rejected."""
+        client = TestClient(app)
+        cursor = client.get("/api/v1/content", params={"limit": 5}).json()["next_cursor"]
+
+        response = client.get("/api/v1/content", params={"query": "butterfly", "cursor": cursor})
+
+        assert response.status_code == 400
+
+    def test_exclude_metadata(self, repo):
+        """Test that include_metadata=false drops source_metadata from items."""
+        client = TestClient(app)
+
+        default = client.get("/api/v1/content", params={"limit": 1}).json()
+        trimmed = client.get("/api/v1/content", params={"limit": 1, "include_metadata": False}).json()
+
+        assert default["items"][0]["source_metadata"] == {}
+        assert trimmed["items"][0]["source_metadata"] is None
+        assert trimmed["items"][0]["id"] == default["items"][0]["id"]
+
+    def test_sparse_fields(self, repo):
+        """Test that fields= returns only the requested fields plus id."""
+        client = TestClient(app)
+
+        data = client.get(
+            "/api/v1/content",
+            params={"fields": "title,thumbnail_url,source,difficulty", "limit": 10},
+        ).json()
+
+        assert len(data["items"]) == 10
+        assert set(data["items"][0]) == {"id", "title", "thumbnail_url", "source", "difficulty"}
+        assert data["items"][0]["title"] == "Butterfly drill 24"
+        assert data["next_cursor"] is not None
+
+    def test_sparse_fields_paginate(self, repo):
+        """Test that cursors keep working with a projection."""
+        client = TestClient(app)
+
+        ids, _ = self.fetch_all(client, fields="title", limit=10)
+
+        assert len(set(ids)) == 25
+
+    def test_unknown_field(self, repo):
+        """Test that an unknown field name is a 400."""
+        response = TestClient(app).get("/api/v1/content", params={"fields": "title,notes"})
+
+        assert response.status_code == 400
+        assert "notes" in response.json()["detail"]
+
+
+class TestAlreadySaved:
+    """Test that re-saving stored content skips the upstream fetch."""
+
+    @pytest.fixture
+    def env(self):
+        """Real repository holding one saved video, plus a mock ingestor."""
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_file.close()
+        repo = SQLiteRepository(temp_file.name)
+        repo.save(ContentItem(
+            id="saved123456",
+            source=ContentSource.YOUTUBE,
+            content_type=ContentType.VIDEO,
+            title="Stored title",
+            url="https://youtube.com/watch?v=saved123456",
+        ))
+        ingestor = Mock()
+        ingestor.extract_id.side_effect = lambda url: url.rsplit("=", 1)[-1]
+        ingestor.from_url.return_value = ContentItem(
+            id="saved123456",
+            source=ContentSource.YOUTUBE,
+            content_type=ContentType.VIDEO,
+            title="Fresh title",
+            url="https://youtube.com/watch?v=saved123456",
+        )
+        with patch('src.api.routes.repository', repo), \
+                patch.dict('src.api.routes.ingestors', {ContentSource.YOUTUBE: ingestor}):
+            yield repo, ingestor
+        repo.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+    def save(self, **extra):
+        """POST the saved video's URL."""
+        return TestClient(app).post("/api/v1/content", json={
+            "url": "https://www.youtube.com/watch?v=saved123456",
+            "source": "YouTube",
+            **extra,
+        })
+
+    def test_returns_stored_item_without_fetching(self, env):
+        """Test that a re-save returns the saved copy and makes no API call."""
+        _, ingestor = env
+
+        response = self.save()
+
+        assert response.status_code == 201
+        assert response.json()["title"] == "Stored title"
+        ingestor.from_url.assert_not_called()
+
+    def test_merges_new_drill_metadata(self, env):
+        """Test that overrides on a re-save are written to the stored item."""
+        repo, ingestor = env
+
+        response = self.save(drill_tags=["butterfly"], difficulty="Beginner")
+
+        assert response.json()["drill_tags"] == ["butterfly"]
+        stored = repo.get("saved123456")
+        assert stored.drill_tags == ["butterfly"]
+        assert stored.title == "Stored title"
+        ingestor.from_url.assert_not_called()
+
+    def test_refresh_refetches(self, env):
+        """Test that refresh=true always calls the source API."""
+        repo, ingestor = env
+
+        response = self.save(refresh=True)
+
+        assert response.json()["title"] == "Fresh title"
+        assert repo.get("saved123456").title == "Fresh title"
+        ingestor.from_url.assert_called_once()
+
+    def test_refresh_keeps_user_metadata(self, env):
+        """Test that a refetch replaces upstream data but not tags, drill metadata or saved_at."""
+        repo, _ = env
+        self.save(drill_tags=["butterfly"], difficulty="Beginner", equipment="pucks")
+        before = repo.get("saved123456")
+
+        response = self.save(refresh=True)
+
+        assert response.json()["drill_tags"] == ["butterfly"]
+        stored = repo.get("saved123456")
+        assert stored.title == "Fresh title"
+        assert stored.drill_tags == ["butterfly"]
+        assert (stored.difficulty, stored.equipment) == (before.difficulty, "pucks")
+        assert stored.saved_at == before.saved_at
+
+    def test_stale_copy_is_refetched(self, env):
+        """Test that copies older than the threshold are fetched again."""
+        _, ingestor = env
+
+        with patch('src.api.routes.settings.content_refetch_after_hours', 0.0):
+            response = self.save()
+
+        assert response.json()["title"] == "Fresh title"
+        ingestor.from_url.assert_called_once()
+
+
+class TestConcurrentSaves:
+    """Load test: slow upstream fetches must not stall reads."""
+
+    SAVE_DELAY = 0.5
+
+    @pytest.fixture
+    def repo(self):
+        """Temporary repository with a few items to list."""
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_file.close()
+        repo = SQLiteRepository(temp_file.name)
+        for i in range(20):
+            repo.save(ContentItem(
+                id=f"seed{i}",
+                source=ContentSource.YOUTUBE,
+                content_type=ContentType.VIDEO,
+                title=f"Seed drill {i}",
+                url=f"https://youtube.com/watch?v=seed{i}",
+            ))
+        yield repo
+        repo.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+    def slow_ingestor(self):
+        """Ingestor whose from_url blocks like a slow YouTube/Reddit round trip."""
+        def from_url(url):
+            time.sleep(self.SAVE_DELAY)
+            content_id = url.rsplit("=", 1)[-1]
+            return ContentItem(
+                id=content_id,
+                source=ContentSource.YOUTUBE,
+                content_type=ContentType.VIDEO,
+                title=f"Slow {content_id}",
+                url=url,
+            )
+
+        ingestor = Mock()
+        ingestor.source = ContentSource.YOUTUBE
+        ingestor.extract_id.side_effect = lambda url: url.rsplit("=", 1)[-1]
+        ingestor.from_url.side_effect = from_url
+        return ingestor
+
+    async def run_load(self, saves: int, reads: int):
+        """Start slow saves and list requests together; time each read from the start."""
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            start = time.perf_counter()
+            save_tasks = [
+                asyncio.create_task(client.post("/api/v1/content", json={
+                    "url": f"https://youtube.com/watch?v=slow{i}",
+                    "source": "YouTube",
+                }))
+                for i in range(saves)
+            ]
+
+            async def timed_read():
+                response = await client.get("/api/v1/content", params={"limit": 20})
+                return response, time.perf_counter() - start
+
+            read_results = await asyncio.gather(*(timed_read() for _ in range(reads)))
+            save_responses = await asyncio.gather(*save_tasks)
+        return save_responses, read_results
+
+    def test_duplicate_saves_share_one_fetch(self, repo):
+        """Test that concurrent saves of the same URL make one upstream call."""
+        ingestor = self.slow_ingestor()
+
+        async def save_same_url(count):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(*(
+                    client.post("/api/v1/content", json={
+                        "url": "https://youtube.com/watch?v=dup",
+                        "source": "YouTube",
+                        "drill_tags": ["butterfly"],
+                    })
+                    for _ in range(count)
+                ))
+
+        with patch('src.api.routes.repository', repo), \
+                patch.dict('src.api.routes.ingestors', {ContentSource.YOUTUBE: ingestor}):
+            responses = asyncio.run(save_same_url(4))
+
+        assert [response.status_code for response in responses] == [201] * 4
+        assert all(response.json()["drill_tags"] == ["butterfly"] for response in responses)
+        assert ingestor.from_url.call_count == 1
+
+    def test_reads_stay_fast_during_slow_saves(self, repo):
+        """Test that list requests complete while saves are still blocked upstream."""
+        ingestor = self.slow_ingestor()
+
+        with patch('src.api.routes.repository', repo), \
+                patch.dict('src.api.routes.ingestors', {ContentSource.YOUTUBE: ingestor}):
+            save_responses, read_results = asyncio.run(self.run_load(saves=4, reads=20))
+
+        assert all(response.status_code == 201 for response in save_responses)
+        assert all(response.status_code == 200 for response, _ in read_results)
+        # With saves blocking the event loop, reads would finish only after them
+        assert max(elapsed for _, elapsed in read_results) < self.SAVE_DELAY / 2
+        assert repo.get("slow3") is not None
+
+
+class TestJobs:
+    """Test POST /api/v1/jobs and GET /api/v1/jobs/{id}."""
+
+    @pytest.fixture
+    def env(self):
+        """Temporary job store and repository patched into the API."""
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_file.close()
+        store = JobStore(temp_file.name)
+        repo = SQLiteRepository(temp_file.name)
+        ingestor = Mock()
+        ingestor.extract_id.side_effect = lambda url: url.rsplit("=", 1)[-1]
+        with patch('src.api.jobs.job_store', store), \
+                patch('src.api.routes.repository', repo), \
+                patch.dict('src.api.routes.ingestors', {ContentSource.YOUTUBE: ingestor}):
+            yield store, ingestor
+        store.close()
+        repo.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+    def test_create_job_returns_immediately(self, env):
+        """Test that POST queues the job without calling the ingestor."""
+        _, ingestor = env
+        client = TestClient(app)
+
+        response = client.post("/api/v1/jobs", json={
+            "url": "https://youtube.com/watch?v=test123",
+            "source": "YouTube",
+        })
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+        assert response.headers["location"].endswith(f"/api/v1/jobs/{job['id']}")
+        ingestor.from_url.assert_not_called()
+
+    def test_job_succeeds(self, env):
+        """Test that a worker saves the content and the job reports it."""
+        store, ingestor = env
+        ingestor.from_url.return_value = ContentItem(
+            id="test123",
+            source=ContentSource.YOUTUBE,
+            content_type=ContentType.VIDEO,
+            title="Test Video",
+            url="https://youtube.com/watch?v=test123",
+        )
+        client = TestClient(app)
+        job_id = client.post("/api/v1/jobs", json={
+            "url": "https://youtube.com/watch?v=test123",
+            "source": "YouTube",
+            "drill_tags": ["butterfly"],
+        }).json()["id"]
+
+        assert asyncio.run(JobRunner(store).run_pending()) == 1
+
+        job = client.get(f"/api/v1/jobs/{job_id}").json()
+        assert job["status"] == "succeeded"
+        assert job["content"]["id"] == "test123"
+        assert job["content"]["drill_tags"] == ["butterfly"]
+
+    def test_job_fails_when_fetch_fails(self, env):
+        """Test that an unfetchable URL ends as a failed job."""
+        store, ingestor = env
+        ingestor.from_url.return_value = None
+        client = TestClient(app)
+        job_id = client.post("/api/v1/jobs", json={
+            "url": "https://youtube.com/watch?v=gone",
+            "source": "YouTube",
+        }).json()["id"]
+
+        asyncio.run(JobRunner(store).run_pending())
+
+        job = client.get(f"/api/v1/jobs/{job_id}").json()
+        assert job["status"] == "failed"
+        assert "Could not fetch" in job["error"]
+        assert job["content"] is None
+
+    def test_job_fails_on_ingestor_error(self, env):
+        """Test that ingestor exceptions are recorded, not raised."""
+        store, ingestor = env
+        ingestor.from_url.side_effect = RuntimeError("quota exceeded")
+        client = TestClient(app)
+        job_id = client.post("/api/v1/jobs", json={
+            "url": "https://youtube.com/watch?v=test123",
+            "source": "YouTube",
+        }).json()["id"]
+
+        asyncio.run(JobRunner(store).run_pending())
+
+        assert client.get(f"/api/v1/jobs/{job_id}").json()["error"] == "quota exceeded"
+
+    def test_workers_pick_up_notified_jobs(self, env):
+        """Test that started workers run jobs queued after startup."""
+        store, ingestor = env
+        ingestor.from_url.return_value = None
+
+        async def scenario():
+            runner = JobRunner(store, workers=2, poll_interval=60)
+            await runner.start()
+            job = store.create({"url": "https://youtube.com/watch?v=x", "source": "YouTube"})
+            runner.notify()
+            for _ in range(100):
+                if store.get(job.id).status == JobStatus.FAILED:
+                    break
+                await asyncio.sleep(0.01)
+            await runner.stop()
+            return store.get(job.id)
+
+        assert asyncio.run(scenario()).status == JobStatus.FAILED
+
+    def test_jobs_use_their_own_executor(self, env):
+        """Test that jobs don't run on the executor POST /content saves use."""
+        store, ingestor = env
+        ingestor.from_url.return_value = None
+        store.create({"url": "https://youtube.com/watch?v=x", "source": "YouTube"})
+        executor = Mock(wraps=job_executor)
+
+        asyncio.run(JobRunner(store, executor=executor).run_pending())
+
+        executor.submit.assert_called_once()
+        assert JobRunner(store).executor is job_executor is not ingest_executor
+
+    def test_get_missing_job(self, env):
+        """Test that unknown job IDs are a 404."""
+        response = TestClient(app).get("/api/v1/jobs/nope")
+
+        assert response.status_code == 404
+
+
 class TestGetContent:
     """Test GET /api/v1/content/{id} endpoint."""
 
@@ -277,9 +805,12 @@ class TestUpdateMetadata:
             content_type=ContentType.VIDEO,
             title="Test Video",
             url="https://youtube.com/test",
+            drill_tags=["butterfly", "lateral"],
+            drill_description="Advanced butterfly drill",
+            difficulty="Advanced",
+            equipment="pucks",
         )
-        mock_repo.get.return_value = mock_item
-        mock_repo.save.return_value = None
+        mock_repo.update_metadata.return_value = mock_item
 
         client = TestClient(app)
         response = client.put(
@@ -297,11 +828,17 @@ class TestUpdateMetadata:
         assert "butterfly" in data["drill_tags"]
         assert "lateral" in data["drill_tags"]
         assert data["drill_description"] == "Advanced butterfly drill"
-        assert data["difficulty"] == "advanced"
+        assert data["difficulty"] == "Advanced"
         assert data["equipment"] == "pucks"
 
-        # Verify save was called
-        mock_repo.save.assert_called_once()
+        # Verify only the provided fields were sent, with no full-row save
+        mock_repo.update_metadata.assert_called_once_with("test123", {
+            "drill_tags": ["butterfly", "lateral"],
+            "drill_description": "Advanced butterfly drill",
+            "difficulty": "advanced",
+            "equipment": "pucks",
+        })
+        mock_repo.save.assert_not_called()
 
     @patch('src.api.routes.repository')
     def test_update_metadata_partial(self, mock_repo):
@@ -332,7 +869,7 @@ class TestUpdateMetadata:
     @patch('src.api.routes.repository')
     def test_update_metadata_not_found(self, mock_repo):
         """Test updating metadata for non-existent content."""
-        mock_repo.get.return_value = None
+        mock_repo.update_metadata.return_value = None
 
         client = TestClient(app)
         response = client.put(
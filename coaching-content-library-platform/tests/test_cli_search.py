@@ -0,0 +1,86 @@
+"""Tests for the CLI search command."""
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from src import main
+from src.config import settings
+from src.models.content import ContentItem, ContentSource, ContentType
+
+
+def make_item(source, content_id):
+    return ContentItem(
+        id=content_id,
+        source=source,
+        content_type=ContentType.VIDEO if source == ContentSource.YOUTUBE else ContentType.POST,
+        title=f"Drill {content_id}",
+        url=f"https://example.com/{content_id}",
+    )
+
+
+def slow_search(source, delay, ids):
+    """Ingestor.search replacement that takes `delay` seconds."""
+    def search(self, query, max_results=10, **kwargs):
+        time.sleep(delay)
+        return [make_item(source, content_id) for content_id in ids]
+    return search
+
+
+@pytest.fixture
+def cli_env(tmp_path, monkeypatch):
+    """Point the CLI's data files and databases at a temporary directory."""
+    monkeypatch.setattr(main, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(main, "LAST_SEARCH_FILE", tmp_path / "last_search.json")
+    monkeypatch.setattr(settings, "database_path", str(tmp_path / "content.db"))
+    monkeypatch.setattr(settings, "response_cache_path", str(tmp_path / "cache.db"))
+    return tmp_path
+
+
+def test_search_sources_concurrently(cli_env):
+    """Test that --source all takes as long as the slowest source, not the sum."""
+    with patch.object(main.YouTubeIngestor, "search", slow_search(ContentSource.YOUTUBE, 0.3, ["v1", "v2"])), \
+            patch.object(main.RedditIngestor, "search", slow_search(ContentSource.REDDIT, 0.3, ["r1"])):
+        start = time.perf_counter()
+        result = CliRunner().invoke(main.app, ["search", "butterfly", "--no-cache"])
+        elapsed = time.perf_counter() - start
+
+    assert result.exit_code == 0, result.output
+    assert elapsed < 0.55
+    assert "YouTube: 2 in" in result.output
+    assert "Reddit: 1 in" in result.output
+    saved = json.loads((cli_env / "last_search.json").read_text())
+    assert sorted(item["id"] for item in saved) == ["r1", "v1", "v2"]
+
+
+def test_search_timeout_skips_slow_source(cli_env):
+    """Test that a source slower than --timeout is reported and left out."""
+    with patch.object(main.YouTubeIngestor, "search", slow_search(ContentSource.YOUTUBE, 0.05, ["v1"])), \
+            patch.object(main.RedditIngestor, "search", slow_search(ContentSource.REDDIT, 2, ["r1"])):
+        start = time.perf_counter()
+        result = CliRunner().invoke(main.app, ["search", "butterfly", "--no-cache", "--timeout", "0.3"])
+        elapsed = time.perf_counter() - start
+
+    assert result.exit_code == 0, result.output
+    assert elapsed < 1
+    assert "Reddit: timed out after 0.3s" in result.output
+    saved = json.loads((cli_env / "last_search.json").read_text())
+    assert [item["id"] for item in saved] == ["v1"]
+
+
+def test_search_reports_failed_source(cli_env):
+    """Test that a source whose API call fails is shown as failed, not as 0 results."""
+    def failing_search_list(self, **params):
+        raise RuntimeError("API down")
+
+    with patch.object(main.YouTubeIngestor, "_search_list", failing_search_list), \
+            patch.object(main.RedditIngestor, "search", slow_search(ContentSource.REDDIT, 0, ["r1"])):
+        result = CliRunner().invoke(main.app, ["search", "butterfly", "--no-cache"])
+
+    assert result.exit_code == 0, result.output
+    assert "YouTube: failed after" in result.output
+    assert "API down" in result.output
+    saved = json.loads((cli_env / "last_search.json").read_text())
+    assert [item["id"] for item in saved] == ["r1"]
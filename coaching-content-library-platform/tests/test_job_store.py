@@ -0,0 +1,97 @@
+"""Tests for the SQLite job queue."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.storage.jobs import JobStatus, JobStore
+
+
+@pytest.fixture
+def store():
+    """Create a job store on a temporary database."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    store = JobStore(temp_file.name)
+    yield store
+    store.close()
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+class TestJobStore:
+    """Test job lifecycle and persistence."""
+
+    def test_create_and_get(self, store):
+        """Test that a new job is queued with its payload."""
+        job = store.create({"url": "https://youtu.be/abc", "source": "YouTube"})
+
+        loaded = store.get(job.id)
+
+        assert loaded.status == JobStatus.QUEUED
+        assert loaded.payload == {"url": "https://youtu.be/abc", "source": "YouTube"}
+        assert loaded.attempts == 0
+
+    def test_get_missing(self, store):
+        """Test that unknown job IDs return None."""
+        assert store.get("nope") is None
+
+    def test_claim_is_fifo_and_exclusive(self, store):
+        """Test that jobs are claimed oldest first and only once."""
+        first = store.create({"n": 1})
+        second = store.create({"n": 2})
+
+        claimed = [store.claim(), store.claim(), store.claim()]
+
+        assert [job.id for job in claimed[:2]] == [first.id, second.id]
+        assert claimed[2] is None
+        assert claimed[0].status == JobStatus.RUNNING
+        assert claimed[0].started_at is not None
+        assert claimed[0].attempts == 1
+
+    def test_complete_and_fail(self, store):
+        """Test that terminal states record their result."""
+        ok = store.create({})
+        bad = store.create({})
+        store.claim()
+        store.claim()
+
+        store.complete(ok.id, "YouTube", "abc")
+        store.fail(bad.id, "Could not fetch")
+
+        ok, bad = store.get(ok.id), store.get(bad.id)
+        assert (ok.status, ok.result_source, ok.result_id) == (JobStatus.SUCCEEDED, "YouTube", "abc")
+        assert (bad.status, bad.error) == (JobStatus.FAILED, "Could not fetch")
+        assert ok.finished_at is not None
+
+    def test_jobs_survive_restart(self, store):
+        """Test that queued and interrupted jobs are runnable after reopening."""
+        queued = store.create({"n": 1})
+        interrupted = store.create({"n": 2})
+        store.claim()  # queued is now running
+        store.close()
+
+        reopened = JobStore(store.db_path)
+        try:
+            assert reopened.requeue_running() == 1
+            claimed = {reopened.claim().id, reopened.claim().id}
+            assert claimed == {queued.id, interrupted.id}
+            assert reopened.get(queued.id).attempts == 2
+        finally:
+            reopened.close()
+
+    def test_requeue_gives_up_after_max_attempts(self, store):
+        """Test that a job interrupted max_attempts times is failed, not requeued."""
+        job = store.create({"n": 1})
+        for _ in range(store.max_attempts - 1):
+            store.claim()
+            assert store.requeue_running() == 1
+
+        store.claim()
+        assert store.requeue_running() == 0
+
+        failed = store.get(job.id)
+        assert failed.status == JobStatus.FAILED
+        assert failed.attempts == store.max_attempts
+        assert "Interrupted" in failed.error
+        assert store.claim() is None
@@ -0,0 +1,207 @@
+"""Tests for YouTube quota accounting."""
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import httplib2
+import pytest
+from fastapi.testclient import TestClient
+from googleapiclient.errors import HttpError
+
+from src.api.main import app
+from src.config import settings
+from src.ingestors.quota import QuotaLedger
+from src.ingestors.resilience import UpstreamUnavailableError
+from src.ingestors.youtube import YouTubeIngestor
+from src.models.content import ContentSource
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database path, removed with its WAL files afterwards."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    yield temp_file.name
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def ledger(db_path):
+    """Create a ledger with a small daily limit."""
+    ledger = QuotaLedger(db_path, daily_limit=1000)
+    yield ledger
+    ledger.close()
+
+
+def fake_client(search_items=(), error=None):
+    """YouTube client stub with canned search and videos responses."""
+    client = Mock()
+    search_request = client.search.return_value.list.return_value
+    if error is not None:
+        search_request.execute.side_effect = error
+    else:
+        search_request.execute.return_value = {"items": [
+            {"id": {"kind": "youtube#video", "videoId": video_id}} for video_id in search_items
+        ]}
+    client.videos.return_value.list.return_value.execute.return_value = {"items": [
+        {"id": video_id, "snippet": {"title": video_id}} for video_id in search_items
+    ]}
+    return client
+
+
+class TestQuotaLedger:
+    """Test charging and budget checks."""
+
+    def test_charge_and_usage(self, ledger):
+        """Test that calls are charged at their unit cost."""
+        ledger.charge("search.list")
+        ledger.charge("videos.list", count=3)
+
+        assert ledger.used() == 103
+        assert ledger.remaining() == 897
+        assert ledger.usage() == {
+            "search.list": {"calls": 1, "units": 100},
+            "videos.list": {"calls": 3, "units": 3},
+        }
+
+    def test_can_afford_with_reserve(self, ledger):
+        """Test that a reserve holds back units from a call."""
+        ledger.charge("search.list", count=8)
+
+        assert ledger.can_afford("search.list")
+        assert not ledger.can_afford("search.list", reserve=150)
+        assert ledger.can_afford("videos.list", reserve=150)
+
+    def test_try_charge(self, ledger):
+        """Test that try_charge refuses calls that would dip into the reserve."""
+        ledger.charge("search.list", count=8)
+
+        assert ledger.try_charge("search.list", reserve=100)
+        assert not ledger.try_charge("search.list", reserve=100)
+        assert ledger.try_charge("videos.list", reserve=50)
+        assert ledger.used() == 901
+
+    def test_try_charge_is_atomic(self, ledger):
+        """Test that concurrent callers can't overspend the budget."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            charged = list(pool.map(lambda _: ledger.try_charge("search.list"), range(20)))
+
+        assert charged.count(True) == 10
+        assert ledger.used() == 1000
+
+    def test_shared_across_instances(self, ledger, db_path):
+        """Test that usage recorded by one process is seen by another."""
+        other = QuotaLedger(db_path, daily_limit=1000)
+        try:
+            other.charge("search.list")
+            assert ledger.remaining() == 900
+        finally:
+            other.close()
+
+    def test_resets_daily(self, ledger):
+        """Test that usage is tracked per quota day."""
+        with patch.object(QuotaLedger, "today", return_value="2026-01-01"):
+            ledger.charge("search.list", count=10)
+            assert ledger.remaining() == 0
+        with patch.object(QuotaLedger, "today", return_value="2026-01-02"):
+            assert ledger.remaining() == 1000
+
+    def test_mark_exhausted(self, ledger):
+        """Test that an exhausted quota leaves nothing to spend."""
+        ledger.charge("videos.list")
+        ledger.mark_exhausted()
+
+        assert ledger.remaining() == 0
+        assert not ledger.can_afford("videos.list")
+
+
+class TestYouTubeQuota:
+    """Test that the ingestor charges and respects the ledger."""
+
+    def test_search_charges_quota(self, ledger):
+        """Test that a search costs one search.list and one videos.list."""
+        ingestor = YouTubeIngestor(api_key="test_key", quota=ledger)
+        ingestor._youtube = fake_client(["vid1", "vid2"])
+
+        results = ingestor.search("butterfly drill")
+
+        assert [item.id for item in results] == ["vid1", "vid2"]
+        assert ledger.used() == 101
+
+    def test_search_refused_when_quota_low(self, ledger):
+        """Test that a search the budget can't cover makes no API call."""
+        ledger.charge("search.list", count=10)
+        client = fake_client(["vid1"])
+        ingestor = YouTubeIngestor(api_key="test_key", quota=ledger)
+        ingestor._youtube = client
+
+        assert ingestor.search("butterfly drill") == []
+        client.search.return_value.list.return_value.execute.assert_not_called()
+
+    def test_discover_deferred_below_reserve(self, ledger):
+        """Test that discover searches leave the reserve for saves and searches."""
+        ledger.charge("search.list", count=7)  # 300 units left
+        client = fake_client(["vid1"])
+        ingestor = YouTubeIngestor(api_key="test_key", quota=ledger)
+        ingestor._youtube = client
+
+        with patch.object(settings, "youtube_quota_discover_reserve", 150), \
+                patch.object(settings, "youtube_discover_terms", ["a", "b", "c"]), \
+                patch.object(YouTubeIngestor, "_request_http", return_value=None):
+            results = ingestor.get_recent(max_results=5)
+
+        # Only one 100-unit search fits above the 150-unit reserve
+        assert client.search.return_value.list.return_value.execute.call_count == 1
+        assert [item.id for item in results] == ["vid1"]
+        # A save still fits
+        assert ledger.can_afford("videos.list")
+
+    def test_quota_error_marks_exhausted(self, ledger):
+        """Test that a quotaExceeded response empties the budget."""
+        error = HttpError(
+            httplib2.Response({"status": 403}),
+            b'{"error": {"errors": [{"reason": "quotaExceeded"}]}}',
+        )
+        ingestor = YouTubeIngestor(api_key="test_key", quota=ledger)
+        ingestor._youtube = fake_client(error=error)
+
+        assert ingestor.search("butterfly drill") == []
+        assert ledger.remaining() == 0
+
+    def test_save_reports_exhausted_quota(self, ledger):
+        """Test that a save the quota can't cover is a retryable 503, not a 404."""
+        ledger.mark_exhausted()
+        client = fake_client(["dQw4w9WgXcQ"])
+        ingestor = YouTubeIngestor(api_key="test_key", quota=ledger)
+        ingestor._youtube = client
+
+        with pytest.raises(UpstreamUnavailableError) as excinfo:
+            ingestor.get_by_id("dQw4w9WgXcQ")
+        assert 0 < excinfo.value.retry_after <= 24 * 3600
+        client.videos.return_value.list.return_value.execute.assert_not_called()
+
+        with patch("src.api.routes.repository") as repo, \
+                patch.dict("src.api.routes.ingestors", {ContentSource.YOUTUBE: ingestor}):
+            repo.get_by_id.return_value = None
+            response = TestClient(app).post("/api/v1/content", json={
+                "url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                "source": "YouTube",
+            })
+
+        assert response.status_code == 503
+        assert int(response.headers["retry-after"]) > 0
+
+    def test_quota_error_on_fetch_is_unavailable(self, ledger):
+        """Test that a quotaExceeded response to get_by_id raises instead of returning None."""
+        ingestor = YouTubeIngestor(api_key="test_key", quota=ledger)
+        ingestor._youtube = fake_client()
+        ingestor._youtube.videos.return_value.list.return_value.execute.side_effect = HttpError(
+            httplib2.Response({"status": 403}),
+            b'{"error": {"errors": [{"reason": "quotaExceeded"}]}}',
+        )
+
+        with pytest.raises(UpstreamUnavailableError):
+            ingestor.get_by_id("dQw4w9WgXcQ")
+        assert ledger.remaining() == 0
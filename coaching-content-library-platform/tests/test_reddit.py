@@ -1,6 +1,8 @@
 """Tests for Reddit ingestor."""
 import pytest
-from src.ingestors.reddit import RedditIngestor
+from unittest.mock import Mock
+
+from src.ingestors.reddit import RedditIngestor, Tombstone
 
 
 def test_reddit_ingestor_initialization():
@@ -24,3 +26,81 @@ def test_reddit_fetch_content():
     )
     results = ingestor.fetch_content("hockeygoalies", max_results=5)
     assert isinstance(results, list)
+
+
+def fake_submission(post_id, removed_by_category=None, author="goalie_coach"):
+    """Stand-in for a PRAW Submission as returned by info()."""
+    return Mock(
+        id=post_id,
+        title=f"Post {post_id}",
+        author=author,
+        removed_by_category=removed_by_category,
+        url=f"https://www.reddit.com/r/hockeygoalies/comments/{post_id}/",
+        permalink=f"/r/hockeygoalies/comments/{post_id}/",
+        subreddit="hockeygoalies",
+        created_utc=1700000000,
+        is_self=True,
+        is_video=False,
+        selftext="",
+        thumbnail="self",
+        preview=None,
+        link_flair_text=None,
+        upvote_ratio=0.9,
+        score=10,
+        num_comments=3,
+    )
+
+
+def test_reddit_lookup_many_batches_and_tombstones():
+    """Test that info() is called per 100 IDs and gone posts become tombstones."""
+    ingestor = RedditIngestor("test_id", "test_secret", "test_agent")
+    special = {
+        "p00003": fake_submission("p00003", removed_by_category="moderator"),
+        "p00004": fake_submission("p00004", removed_by_category="deleted", author=None),
+        "p00005": fake_submission("p00005", author=None),
+    }
+    calls = []
+
+    def info(fullnames):
+        calls.append(fullnames)
+        for fullname in fullnames:
+            post_id = fullname[len("t3_"):]
+            if post_id == "p00007":
+                continue  # Never existed: info() skips it
+            yield special.get(post_id) or fake_submission(post_id)
+
+    ingestor._reddit = Mock()
+    ingestor._reddit.info.side_effect = info
+    ids = [f"p{i:05d}" for i in range(250)]
+
+    results = ingestor.lookup_many(ids + ids[:5])
+
+    assert [len(chunk) for chunk in calls] == [100, 100, 50]
+    assert list(results) == ids
+    assert results["p00000"].title == "Post p00000"
+    assert results["p00003"] == Tombstone("p00003", "removed", "moderator")
+    assert results["p00004"] == Tombstone("p00004", "deleted", "deleted")
+    assert results["p00005"] == Tombstone("p00005", "deleted")
+    assert results["p00007"] == Tombstone("p00007", "not_found")
+
+    live = ingestor.get_many(ids[:10])
+    assert list(live) == ["p00000", "p00001", "p00002", "p00006", "p00008", "p00009"]
+
+
+def test_reddit_lookup_many_skips_failed_batch():
+    """Test that a failed batch is left out rather than reported as gone."""
+    ingestor = RedditIngestor("test_id", "test_secret", "test_agent")
+    batches = iter([ValueError("bad response"), None])
+
+    def info(fullnames):
+        error = next(batches)
+        if error:
+            raise error
+        return (fake_submission(fullname[len("t3_"):]) for fullname in fullnames)
+
+    ingestor._reddit = Mock()
+    ingestor._reddit.info.side_effect = info
+
+    results = ingestor.lookup_many([f"p{i:05d}" for i in range(150)])
+
+    assert list(results) == [f"p{i:05d}" for i in range(100, 150)]
@@ -0,0 +1,243 @@
+"""Tests for the async httpx Reddit ingestor."""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from src.config import settings
+from src.ingestors.reddit_async import AsyncRedditIngestor, ListingSubmission
+from src.models.content import ContentType
+
+
+def submission_json(post_id, subreddit="hockeygoalies", created_utc=1700000000, **fields):
+    """A t3 listing child shaped like Reddit's /hot and /search responses."""
+    data = {
+        "id": post_id,
+        "name": f"t3_{post_id}",
+        "title": f"Post {post_id}",
+        "author": "goalie_coach",
+        "subreddit": subreddit,
+        "url": f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/post/",
+        "permalink": f"/r/{subreddit}/comments/{post_id}/post/",
+        "created_utc": created_utc,
+        "is_self": True,
+        "is_video": False,
+        "selftext": "Work on your post-to-post push.",
+        "thumbnail": "self",
+        "link_flair_text": "Drills",
+        "removed_by_category": None,
+        "score": 42,
+        "num_comments": 7,
+        "upvote_ratio": 0.97,
+    }
+    data.update(fields)
+    return {"kind": "t3", "data": data}
+
+
+def listing_json(children, after=None):
+    """A Reddit listing response."""
+    return {"kind": "Listing", "data": {"children": children, "after": after, "before": None}}
+
+
+def run(coro):
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+def make_ingestor(handler):
+    """AsyncRedditIngestor whose HTTP calls go to `handler`."""
+    return AsyncRedditIngestor(
+        "client", "secret", "test-agent", transport=httpx.MockTransport(handler)
+    )
+
+
+def token_response():
+    return httpx.Response(200, json={"access_token": "token123", "expires_in": 3600})
+
+
+class TestListingSubmission:
+    """Test the PRAW-like view over listing JSON."""
+
+    def test_attributes(self):
+        """Test that fields read as attributes and missing ones raise AttributeError."""
+        submission = ListingSubmission(submission_json("abc")["data"])
+
+        assert submission.title == "Post abc"
+        assert not hasattr(submission, "preview")
+
+    def test_deleted_author_is_none(self):
+        """Test that [deleted] authors look like PRAW's None."""
+        submission = ListingSubmission(submission_json("abc", author="[deleted]")["data"])
+
+        assert submission.author is None
+
+
+class TestAsyncRedditIngestor:
+    """Test auth, paging, mapping and merging with a mock transport."""
+
+    def test_get_recent_pages_and_maps(self):
+        """Test that listings are paged with `after` and mapped like the PRAW path."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path == "/api/v1/access_token":
+                return token_response()
+            assert request.headers["Authorization"] == "Bearer token123"
+            if "after" not in request.url.params:
+                return httpx.Response(200, json=listing_json(
+                    [submission_json("p1"), submission_json("gone", author="[deleted]")],
+                    after="t3_gone",
+                ))
+            return httpx.Response(200, json=listing_json([submission_json("p2")]))
+
+        async def fetch():
+            ingestor = make_ingestor(handler)
+            try:
+                return await ingestor.aget_recent(max_results=3)
+            finally:
+                await ingestor.aclose()
+
+        with patch.object(settings, "reddit_subreddits", ["hockeygoalies"]):
+            items = run(fetch())
+
+        assert [item.id for item in items] == ["p1", "p2"]
+        assert items[0].content_type == ContentType.POST
+        assert items[0].like_count == 42
+        assert items[0].source_metadata["subreddit"] == "hockeygoalies"
+        assert items[0].source_metadata["permalink"] == "https://reddit.com/r/hockeygoalies/comments/p1/post/"
+        # One token request, two listing pages
+        assert [r.url.path for r in requests].count("/api/v1/access_token") == 1
+        assert requests[2].url.params["after"] == "t3_gone"
+
+    def test_refreshes_expired_token(self):
+        """Test that a 401 fetches a new token and retries once."""
+        tokens = iter(["old", "new"])
+
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                return httpx.Response(200, json={"access_token": next(tokens), "expires_in": 3600})
+            if request.headers["Authorization"] == "Bearer old":
+                return httpx.Response(401)
+            return httpx.Response(200, json=listing_json([submission_json("p1")]))
+
+        async def search():
+            ingestor = make_ingestor(handler)
+            try:
+                return await ingestor.asearch("butterfly", subreddits=["hockeygoalies"])
+            finally:
+                await ingestor.aclose()
+
+        assert [item.id for item in run(search())] == ["p1"]
+
+    def test_search_merges_new_by_time(self):
+        """Test that sort=new results from several subreddits are merged newest first."""
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                return token_response()
+            subreddit = request.url.path.split("/")[2]
+            assert request.url.params["restrict_sr"] == "1"
+            offset = 0 if subreddit == "a" else 5
+            return httpx.Response(200, json=listing_json([
+                submission_json(f"{subreddit}{i}", subreddit, created_utc=1700000100 - 10 * i - offset)
+                for i in range(3)
+            ]))
+
+        async def search():
+            ingestor = make_ingestor(handler)
+            try:
+                return await ingestor.asearch("glove", max_results=4, subreddits=["a", "b"], sort="new")
+            finally:
+                await ingestor.aclose()
+
+        assert [item.id for item in run(search())] == ["a0", "b0", "a1", "b1"]
+
+    def test_search_failure_returns_empty(self):
+        """Test that a failing search logs and returns no results."""
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                return token_response()
+            return httpx.Response(403)
+
+        async def search():
+            ingestor = make_ingestor(handler)
+            try:
+                return await ingestor.asearch("butterfly")
+            finally:
+                await ingestor.aclose()
+
+        assert run(search()) == []
+
+
+class StubRedditHandler(BaseHTTPRequestHandler):
+    """Serves recorded-style listing JSON, two pages per subreddit, with fixed latency."""
+
+    latency = 0.1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send({"access_token": "token123", "expires_in": 3600})
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        url = urlparse(self.path)
+        subreddit = url.path.split("/")[2]
+        params = parse_qs(url.query)
+        page = 1 if "after" in params else 0
+        limit = int(params["limit"][0])
+        children = [submission_json(f"{subreddit}-{page}-{i}", subreddit) for i in range(limit)]
+        self._send(listing_json(children, after=None if page else f"t3_{subreddit}-0-{limit - 1}"))
+
+    def _send(self, body):
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_reddit():
+    """Local stub Reddit API server; yields its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRedditHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_recent_fetches_subreddits_concurrently(stub_reddit):
+    """Benchmark: 4 subreddits x 2 pages take about two round trips, not eight."""
+    subreddits = ["hockeygoalies", "hockeyplayers", "goaliecoaches", "hockey"]
+
+    async def fetch():
+        ingestor = AsyncRedditIngestor(
+            "client", "secret", "test-agent",
+            api_url=stub_reddit,
+            auth_url=f"{stub_reddit}/api/v1/access_token",
+        )
+        try:
+            start = time.perf_counter()
+            items = await ingestor.aget_recent(max_results=150)
+            return items, time.perf_counter() - start
+        finally:
+            await ingestor.aclose()
+
+    with patch.object(settings, "reddit_subreddits", subreddits):
+        items, elapsed = run(fetch())
+
+    sequential_time = len(subreddits) * 2 * StubRedditHandler.latency
+    assert len(items) == 150
+    # Hot listings are interleaved by rank across subreddits
+    assert [item.source_metadata["subreddit"] for item in items[:4]] == subreddits
+    assert elapsed < sequential_time / 2
@@ -0,0 +1,260 @@
+"""Tests for the background metadata refresher."""
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.ingestors.quota import QuotaLedger
+from src.ingestors.reddit import RedditIngestor
+from src.ingestors.youtube import YouTubeIngestor
+from src.models.content import ContentItem, ContentSource, ContentType
+from src.refresh import MetadataRefresher, RateBudget
+from src.storage.sqlite import SQLiteRepository
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database path, removed with its WAL files afterwards."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    yield temp_file.name
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def repo(db_path):
+    """Create a repository on the temporary database."""
+    repo = SQLiteRepository(db_path)
+    yield repo
+    repo.close()
+
+
+def days_ago(days: float) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def saved_item(content_id, source=ContentSource.YOUTUBE, fetched_days_ago=2, **stats) -> ContentItem:
+    """A saved item fetched `fetched_days_ago` days ago."""
+    return ContentItem(
+        id=content_id,
+        source=source,
+        content_type=ContentType.VIDEO if source == ContentSource.YOUTUBE else ContentType.POST,
+        title=f"Drill {content_id}",
+        url=f"https://example.com/{content_id}",
+        fetched_at=days_ago(fetched_days_ago),
+        **stats,
+    )
+
+
+def youtube_client(statistics):
+    """YouTube client stub whose videos.list returns `statistics` for known IDs."""
+    client = Mock()
+    requested = []
+
+    def videos_list(part, id):
+        ids = id.split(",")
+        requested.append(ids)
+        request = Mock()
+        request.execute.return_value = {"items": [
+            {"id": video_id, "snippet": {"title": video_id}, "statistics": statistics[video_id]}
+            for video_id in ids if video_id in statistics
+        ]}
+        return request
+
+    client.videos.return_value.list.side_effect = videos_list
+    return client, requested
+
+
+def reddit_submission(post_id, score, removed_by_category=None, author="goalie_coach"):
+    """Stand-in for a PRAW Submission as returned by info()."""
+    return Mock(
+        id=post_id,
+        title=f"Post {post_id}",
+        author=author,
+        removed_by_category=removed_by_category,
+        url=f"https://www.reddit.com/r/hockeygoalies/comments/{post_id}/",
+        permalink=f"/r/hockeygoalies/comments/{post_id}/",
+        subreddit="hockeygoalies",
+        created_utc=1700000000,
+        is_self=True,
+        is_video=False,
+        selftext="",
+        thumbnail="self",
+        preview=None,
+        link_flair_text=None,
+        upvote_ratio=0.9,
+        score=score,
+        num_comments=3,
+    )
+
+
+class TestSelection:
+    """Test which items are picked, and in what order."""
+
+    def test_ranks_stale_popular_items_first(self, repo):
+        """Test that fresh items are skipped and popularity breaks near-ties in age."""
+        repo.save_many([
+            saved_item("fresh", fetched_days_ago=0.5, view_count=1_000_000),
+            saved_item("obscure", fetched_days_ago=3, view_count=10),
+            saved_item("popular", fetched_days_ago=2, view_count=500_000),
+            saved_item("ancient", fetched_days_ago=60),
+            saved_item("insta", source=ContentSource.INSTAGRAM, fetched_days_ago=10),
+        ])
+        refresher = MetadataRefresher(repo, {
+            ContentSource.YOUTUBE: Mock(),
+            ContentSource.INSTAGRAM: Mock(),
+        })
+
+        assert [row.id for row in refresher.select()] == ["ancient", "popular", "obscure"]
+        assert [row.id for row in refresher.select(limit=1)] == ["ancient"]
+
+
+class TestRun:
+    """Test refresh runs end to end against stubbed APIs."""
+
+    def test_youtube_writes_changed_stats(self, repo):
+        """Test that changed stats are written, unchanged rows only get a new fetched_at."""
+        repo.save_many([
+            saved_item("changed", view_count=100, like_count=10, comment_count=1),
+            saved_item("same", view_count=50, like_count=5),
+            saved_item("missing", view_count=7),
+        ])
+        ingestor = YouTubeIngestor(api_key="test_key")
+        ingestor._youtube, requested = youtube_client({
+            "changed": {"viewCount": "150", "likeCount": "10", "commentCount": "4"},
+            "same": {"viewCount": "50", "likeCount": "5"},
+        })
+        progress = []
+
+        stats = MetadataRefresher(repo, {ContentSource.YOUTUBE: ingestor}).run(
+            on_progress=lambda s: progress.append(s.processed)
+        )
+
+        assert len(requested) == 1
+        assert (stats.selected, stats.updated, stats.unchanged, stats.gone, stats.failed) == (3, 1, 1, 1, 0)
+        assert stats.api_calls == 1
+        assert progress == [3]
+        changed = repo.get("changed")
+        assert (changed.view_count, changed.like_count, changed.comment_count) == (150, 10, 4)
+        assert repo.get("same").fetched_at > days_ago(1)
+
+    def test_youtube_missing_video_is_gone(self, repo):
+        """Test that a video videos.list leaves out keeps its stats and isn't picked again."""
+        repo.save_many([saved_item("live", view_count=1), saved_item("private", view_count=7)])
+        ingestor = YouTubeIngestor(api_key="test_key")
+        ingestor._youtube, requested = youtube_client({"live": {"viewCount": "2"}})
+        refresher = MetadataRefresher(repo, {ContentSource.YOUTUBE: ingestor})
+
+        stats = refresher.run()
+
+        assert (stats.updated, stats.gone, stats.failed) == (1, 1, 0)
+        private = repo.get("private")
+        assert private.view_count == 7
+        assert private.fetched_at > days_ago(1)
+        assert refresher.select() == []
+
+    def test_failed_lookup_left_stale(self, repo):
+        """Test that items of a failed videos.list call are retried next run."""
+        repo.save(saved_item("vid", view_count=1))
+        ingestor = YouTubeIngestor(api_key="test_key")
+        ingestor._youtube = Mock()
+        ingestor._youtube.videos.return_value.list.return_value.execute.side_effect = RuntimeError("boom")
+        refresher = MetadataRefresher(repo, {ContentSource.YOUTUBE: ingestor})
+
+        stats = refresher.run()
+
+        assert (stats.processed, stats.gone, stats.failed) == (1, 0, 1)
+        assert repo.get("vid").fetched_at < days_ago(1)
+        assert [row.id for row in refresher.select()] == ["vid"]
+
+    def test_reddit_tombstones_keep_stats(self, repo):
+        """Test that deleted and removed posts keep their stats but are marked fetched."""
+        repo.save_many([
+            saved_item("live", ContentSource.REDDIT, like_count=10),
+            saved_item("deleted", ContentSource.REDDIT, like_count=20),
+            saved_item("removed", ContentSource.REDDIT, like_count=30),
+        ])
+        ingestor = RedditIngestor("test_id", "test_secret", "test_agent")
+        ingestor._reddit = Mock()
+        ingestor._reddit.info.return_value = [
+            reddit_submission("live", 12),
+            reddit_submission("deleted", 0, removed_by_category="deleted", author=None),
+            reddit_submission("removed", 0, removed_by_category="moderator"),
+        ]
+
+        stats = MetadataRefresher(repo, {ContentSource.REDDIT: ingestor}).run()
+
+        assert (stats.updated, stats.gone) == (1, 2)
+        assert repo.get("live").like_count == 12
+        assert repo.get("deleted").like_count == 20
+        assert repo.get("removed").fetched_at > days_ago(1)
+
+    def test_call_budget_caps_lookups(self, repo):
+        """Test that a source stops once its per-run call budget is spent."""
+        repo.save_many([
+            saved_item(f"p{i:03d}", ContentSource.REDDIT, like_count=1, comment_count=3) for i in range(150)
+        ])
+        ingestor = RedditIngestor("test_id", "test_secret", "test_agent")
+        ingestor._reddit = Mock()
+        ingestor._reddit.info.side_effect = lambda fullnames: [
+            reddit_submission(fullname[len("t3_"):], 1) for fullname in fullnames
+        ]
+
+        stats = MetadataRefresher(
+            repo, {ContentSource.REDDIT: ingestor}, max_calls={ContentSource.REDDIT: 1}
+        ).run()
+
+        assert ingestor._reddit.info.call_count == 1
+        assert (stats.processed, stats.unchanged, stats.skipped) == (100, 100, 50)
+
+    def test_youtube_leaves_quota_reserve(self, repo, db_path):
+        """Test that refreshes stop at the quota reserve instead of spending it."""
+        repo.save(saved_item("vid", view_count=1))
+        ledger = QuotaLedger(db_path, daily_limit=1000)
+        try:
+            ledger.charge("search.list", count=9)  # 100 units left
+            ingestor = YouTubeIngestor(api_key="test_key", quota=ledger)
+            ingestor._youtube, requested = youtube_client({"vid": {"viewCount": "2"}})
+
+            stats = MetadataRefresher(
+                repo, {ContentSource.YOUTUBE: ingestor}, youtube_reserve=100
+            ).run()
+        finally:
+            ledger.close()
+
+        assert requested == []
+        assert stats.skipped == 1
+        assert repo.get("vid").view_count == 1
+
+    def test_status(self, repo):
+        """Test that the last run's throughput is reported."""
+        refresher = MetadataRefresher(repo, {})
+        assert refresher.status() == {"running": None, "last_run": None}
+
+        refresher.run()
+
+        status = refresher.status()
+        assert status["running"] is None
+        assert status["last_run"]["selected"] == 0
+        assert "items_per_second" in status["last_run"]
+
+
+class TestRateBudget:
+    """Test per-source call spacing and caps."""
+
+    def test_spaces_calls(self):
+        """Test that calls are spaced by 60 / calls_per_minute seconds."""
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        budget = RateBudget(30, max_calls=3, clock=lambda: now[0], sleep=sleep)
+
+        assert [budget.acquire() for _ in range(4)] == [True, True, True, False]
+        assert sleeps == [2.0, 2.0]
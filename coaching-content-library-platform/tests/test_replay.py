@@ -0,0 +1,312 @@
+"""Tests for the record/replay HTTP transports."""
+import asyncio
+import json
+import time
+
+import httplib2
+import httpx
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from typer.testing import CliRunner
+
+from src import benchmark
+from src.config import settings
+
+from src.ingestors.reddit import RedditIngestor
+from src.ingestors.reddit_async import AsyncRedditIngestor
+from src.ingestors.replay import (
+    Fixture,
+    FixtureNotFoundError,
+    FixtureStore,
+    ReplayAdapter,
+    ReplayConditions,
+    ReplayHttp,
+    ReplayTransport,
+    replay_session,
+)
+from src.ingestors.resilience import Resilience, UpstreamUnavailableError
+from src.ingestors.youtube import YouTubeIngestor
+from src.models.content import ContentSource
+
+VIDEO = {
+    "id": "dQw4w9WgXcQ",
+    "snippet": {
+        "title": "Butterfly slide drill",
+        "channelTitle": "Goalie Coach",
+        "publishedAt": "2024-01-15T12:00:00Z",
+    },
+    "statistics": {"viewCount": "1200", "likeCount": "80", "commentCount": "9"},
+    "contentDetails": {"duration": "PT4M"},
+}
+
+
+def submission_json(post_id):
+    """A t3 listing child shaped like Reddit's /api/info response."""
+    return {"kind": "t3", "data": {
+        "id": post_id,
+        "name": f"t3_{post_id}",
+        "title": f"Post {post_id}",
+        "author": "goalie_coach",
+        "subreddit": "hockeygoalies",
+        "url": f"https://www.reddit.com/r/hockeygoalies/comments/{post_id}/post/",
+        "permalink": f"/r/hockeygoalies/comments/{post_id}/post/",
+        "created_utc": 1700000000,
+        "is_self": True,
+        "is_video": False,
+        "selftext": "Work on your post-to-post push.",
+        "thumbnail": "https://b.thumbs.redditmedia.com/drill.jpg",
+        "link_flair_text": None,
+        "removed_by_category": None,
+        "score": 42,
+        "num_comments": 7,
+        "upvote_ratio": 0.97,
+    }}
+
+
+def listing_json(children):
+    return {"kind": "Listing", "data": {"children": children, "after": None, "before": None}}
+
+
+def no_retries(source):
+    """Resilience that fails fast, so injected errors don't sleep."""
+    return Resilience(source, max_attempts=1)
+
+
+class FakeYouTubeHttp:
+    """Stands in for the real API while recording: answers search.list and videos.list."""
+
+    def __init__(self):
+        self.uris = []
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5):
+        self.uris.append(uri)
+        if "/search?" in uri:
+            items = [{"id": {"kind": "youtube#video", "videoId": VIDEO["id"]}}]
+        else:
+            items = [VIDEO]
+        payload = json.dumps({"items": items}).encode()
+        return httplib2.Response({"status": "200", "content-type": "application/json"}), payload
+
+
+class FakeRedditAdapter(BaseAdapter):
+    """Stands in for Reddit while recording: answers the token and info endpoints."""
+
+    def send(self, request, **kwargs):
+        if request.url.endswith("/api/v1/access_token"):
+            body = {"access_token": "token123", "token_type": "bearer", "expires_in": 3600, "scope": "*"}
+        else:
+            body = listing_json([submission_json("abc123")])
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.headers.update({
+            "x-ratelimit-remaining": "599", "x-ratelimit-used": "1", "x-ratelimit-reset": "300",
+        })
+        response._content = json.dumps(body).encode()
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class TestFixtureStore:
+    """Test fixture keys and files."""
+
+    def test_key_ignores_credentials_and_param_order(self, tmp_path):
+        """Test that API keys are stripped and query order doesn't matter."""
+        store = FixtureStore(tmp_path)
+
+        assert store.key("get", "https://api.example.com/v3/videos?key=SECRET&id=a&part=snippet") == \
+            store.key("GET", "https://api.example.com/v3/videos?part=snippet&id=a&key=OTHER")
+        assert store.key("POST", "https://api.example.com/x", b"a=1") != store.key("POST", "https://api.example.com/x", b"a=2")
+
+    def test_round_trip(self, tmp_path):
+        """Test that text and binary bodies come back unchanged, minus dropped headers."""
+        store = FixtureStore(tmp_path)
+        store.save("GET", "https://api.example.com/a?key=SECRET", None, Fixture(
+            200, {"Content-Type": "application/json", "Content-Encoding": "gzip"}, b'{"ok": true}'
+        ))
+        store.save("GET", "https://api.example.com/b", None, Fixture(200, {}, b"\xff\x00"))
+
+        fixture = store.load("GET", "https://api.example.com/a?key=OTHER")
+        assert fixture == Fixture(200, {"content-type": "application/json"}, b'{"ok": true}')
+        assert store.load("GET", "https://api.example.com/b").body == b"\xff\x00"
+        assert len(store) == 2
+        assert not any("SECRET" in path.read_text() for path in tmp_path.rglob("*.json"))
+
+    def test_missing_fixture(self, tmp_path):
+        """Test that unrecorded requests raise FixtureNotFoundError."""
+        with pytest.raises(FixtureNotFoundError):
+            FixtureStore(tmp_path).load("GET", "https://api.example.com/missing")
+
+
+class TestYouTubeReplay:
+    """Test googleapiclient through ReplayHttp."""
+
+    def test_record_then_replay(self, tmp_path):
+        """Test that a recorded videos.list response is parsed the same offline."""
+        fake = FakeYouTubeHttp()
+        recorder = YouTubeIngestor(api_key="SECRET", http=ReplayHttp(tmp_path, mode="record", http=fake))
+        recorded = recorder.get_by_id("dQw4w9WgXcQ")
+
+        replayer = YouTubeIngestor(api_key="OTHER", http=ReplayHttp(tmp_path))
+        replayed = replayer.get_by_id("dQw4w9WgXcQ")
+
+        assert len(fake.uris) == 1
+        assert replayed.model_dump(exclude={"fetched_at"}) == recorded.model_dump(exclude={"fetched_at"})
+        assert replayed.view_count == 1200
+        assert replayer.http.requests == 1
+
+    def test_injected_latency_and_errors(self, tmp_path):
+        """Test that latency is added and an injected 503 surfaces as an upstream failure."""
+        YouTubeIngestor(
+            api_key="SECRET", http=ReplayHttp(tmp_path, mode="record", http=FakeYouTubeHttp())
+        ).get_by_id("dQw4w9WgXcQ")
+
+        slow = YouTubeIngestor(api_key="x", http=ReplayHttp(tmp_path, conditions=ReplayConditions(latency=0.05)))
+        start = time.perf_counter()
+        assert slow.get_by_id("dQw4w9WgXcQ") is not None
+        assert time.perf_counter() - start >= 0.05
+
+        failing = YouTubeIngestor(api_key="x", http=ReplayHttp(tmp_path, conditions=ReplayConditions(error_rate=1)))
+        failing.resilience = no_retries(ContentSource.YOUTUBE)
+        assert failing.get_many(["dQw4w9WgXcQ"]) == {}
+        assert failing.http.faults == 1
+
+    def test_dropped_connection(self, tmp_path):
+        """Test that an injected connection failure is a network error to the ingestor."""
+        ingestor = YouTubeIngestor(api_key="x", http=ReplayHttp(
+            tmp_path, conditions=ReplayConditions(error_rate=1, error_status=None)
+        ))
+        ingestor.resilience = no_retries(ContentSource.YOUTUBE)
+
+        with pytest.raises(UpstreamUnavailableError):
+            ingestor.get_by_id("dQw4w9WgXcQ")
+
+
+class TestRedditReplay:
+    """Test PRAW through a replay requests session."""
+
+    def test_record_then_replay(self, tmp_path):
+        """Test that PRAW's token and info calls replay offline."""
+        recording = requests.Session()
+        recording.mount("https://", ReplayAdapter(tmp_path, mode="record", adapter=FakeRedditAdapter()))
+        recorded = RedditIngestor("id", "secret", "test-agent", session=recording).get_many(["abc123"])
+
+        replayed = RedditIngestor("id", "secret", "test-agent", session=replay_session(tmp_path)).get_many(["abc123"])
+
+        assert list(replayed) == list(recorded) == ["abc123"]
+        assert replayed["abc123"].like_count == 42
+        # Recorded rate-limit headers are dropped, so replays aren't throttled
+        assert not any("x-ratelimit" in path.read_text() for path in tmp_path.rglob("*.json"))
+        # The OAuth token is recorded as a placeholder
+        assert not any("token123" in path.read_text() for path in tmp_path.rglob("*.json"))
+
+
+class TestHttpxReplay:
+    """Test the async Reddit ingestor through ReplayTransport."""
+
+    def test_record_then_replay(self, tmp_path):
+        """Test that listings recorded through httpx replay with added latency."""
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                return httpx.Response(200, json={"access_token": "token123", "expires_in": 3600})
+            return httpx.Response(200, json=listing_json([submission_json(request.url.path.split("/")[2])]))
+
+        async def search(transport):
+            ingestor = AsyncRedditIngestor("id", "secret", "test-agent", transport=transport)
+            try:
+                return await ingestor.asearch("butterfly", subreddits=["a", "b", "c"])
+            finally:
+                await ingestor.aclose()
+
+        recorded = asyncio.run(search(ReplayTransport(tmp_path, mode="record", transport=httpx.MockTransport(handler))))
+
+        replay = ReplayTransport(tmp_path, conditions=ReplayConditions(latency=0.1))
+        start = time.perf_counter()
+        replayed = asyncio.run(search(replay))
+        elapsed = time.perf_counter() - start
+
+        assert [item.id for item in replayed] == [item.id for item in recorded] == ["a", "b", "c"]
+        assert replay.requests == 4
+        # Token, then three concurrent searches: two latencies, not four
+        assert elapsed < 0.35
+        assert not any("token123" in path.read_text() for path in tmp_path.rglob("*.json"))
+
+    def test_sync_client(self, tmp_path):
+        """Test that the same transport works with a sync httpx.Client."""
+        def handler(request):
+            return httpx.Response(200, json={"path": request.url.path})
+
+        with httpx.Client(transport=ReplayTransport(tmp_path, mode="record", transport=httpx.MockTransport(handler))) as client:
+            client.get("https://example.com/a")
+
+        with httpx.Client(transport=ReplayTransport(tmp_path)) as client:
+            assert client.get("https://example.com/a").json() == {"path": "/a"}
+            with pytest.raises(FixtureNotFoundError):
+                client.get("https://example.com/b")
+
+
+def test_conditions_are_reproducible():
+    """Test that a seed fixes which requests fail."""
+    def failures(seed):
+        conditions = ReplayConditions(error_rate=0.3, seed=seed)
+        return [conditions.draw()[1] for _ in range(50)]
+
+    assert failures(7) == failures(7)
+    assert 5 < sum(failures(7)) < 25
+
+
+def test_benchmark_run(tmp_path, monkeypatch):
+    """Test that the benchmark replays every recorded operation offline."""
+    manifest = {
+        "queries": ["butterfly"],
+        "urls": {"youtube": ["https://youtu.be/dQw4w9WgXcQ"], "reddit": []},
+        "max_results": 5,
+        "youtube_discover_terms": ["goalie drills"],
+        "reddit_subreddits": ["hockeygoalies"],
+    }
+    monkeypatch.setattr(settings, "youtube_discover_terms", manifest["youtube_discover_terms"])
+    monkeypatch.setattr(settings, "reddit_subreddits", manifest["reddit_subreddits"])
+    monkeypatch.setattr(settings, "reddit_client_id", "id")
+    monkeypatch.setattr(settings, "reddit_client_secret", "secret")
+    store = FixtureStore(tmp_path)
+    recording = requests.Session()
+    recording.mount("https://", ReplayAdapter(store, mode="record", adapter=FakeRedditAdapter()))
+    recorders = {
+        "youtube": (YouTubeIngestor("x", http=ReplayHttp(store, mode="record", http=FakeYouTubeHttp())), None),
+        "reddit": (RedditIngestor("id", "secret", "test-agent", session=recording), None),
+    }
+    for _, call in benchmark.operations(recorders, manifest):
+        call()
+    (tmp_path / benchmark.MANIFEST_FILE).write_text(json.dumps(manifest))
+    output = tmp_path / "results.json"
+
+    result = CliRunner().invoke(benchmark.app, [
+        "run", str(tmp_path), "--iterations", "4", "--concurrency", "2", "--output", str(output),
+    ])
+
+    assert result.exit_code == 0, result.output
+    results = {row["operation"]: row for row in json.loads(output.read_text())}
+    assert set(results) == {
+        "youtube.search", "youtube.get_recent", "youtube.from_url", "reddit.search", "reddit.get_recent",
+    }
+    assert all(row["errors"] == row["empty"] == 0 for row in results.values())
+    assert results["youtube.from_url"]["items"] == 4
+
+
+def test_benchmark_record_rejects_unrecognized_urls(tmp_path, monkeypatch):
+    """Test that record fails before any API call on a URL from_url can't parse."""
+    monkeypatch.setattr(settings, "reddit_client_id", "id")
+    monkeypatch.setattr(settings, "reddit_client_secret", "secret")
+
+    result = CliRunner().invoke(benchmark.app, [
+        "record", str(tmp_path), "--reddit-url", "https://redd.it/abc123",
+    ])
+
+    assert result.exit_code == 1
+    assert "https://redd.it/abc123" in result.output
+    assert not (tmp_path / benchmark.MANIFEST_FILE).exists()
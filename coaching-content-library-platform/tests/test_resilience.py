@@ -0,0 +1,226 @@
+"""Tests for upstream retries and circuit breaking."""
+from unittest.mock import Mock
+
+import httplib2
+import httpx
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.ingestors.reddit import RedditIngestor
+from src.ingestors.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    UpstreamUnavailableError,
+    classify_error,
+    parse_retry_after,
+)
+from src.ingestors.youtube import YouTubeIngestor
+from src.models.content import ContentSource
+
+
+def http_error(status, content=b"{}", headers=None):
+    """googleapiclient HttpError with the given status."""
+    return HttpError(httplib2.Response({"status": status, **(headers or {})}), content)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def sleeps():
+    """Record sleeps instead of sleeping."""
+    return []
+
+
+@pytest.fixture
+def resilience(sleeps):
+    """Policy with 3 attempts, no real sleeping and a fake-clock breaker."""
+    return Resilience(
+        ContentSource.YOUTUBE,
+        max_attempts=3,
+        backoff_base=0.5,
+        breaker=CircuitBreaker(failure_threshold=5, reset_timeout=30, clock=FakeClock()),
+        sleep=sleeps.append,
+    )
+
+
+class TestClassifyError:
+    """Test which failures are retried."""
+
+    def test_transient_statuses(self):
+        """Test that 429 and 5xx are retried and Retry-After is read."""
+        assert classify_error(http_error(503)) == (True, None)
+        assert classify_error(http_error(429, headers={"retry-after": "7"})) == (True, 7.0)
+        request = httpx.Request("GET", "https://oauth.reddit.com")
+        response = httpx.Response(502, headers={"Retry-After": "2"}, request=request)
+        error = httpx.HTTPStatusError("bad gateway", request=request, response=response)
+        assert classify_error(error) == (True, 2.0)
+
+    def test_network_errors_are_transient(self):
+        """Test that timeouts and connection failures are retried."""
+        assert classify_error(TimeoutError())[0]
+        assert classify_error(httpx.ConnectError("refused"))[0]
+        assert classify_error(httplib2.ServerNotFoundError("dns"))[0]
+
+    def test_permanent_errors(self):
+        """Test that not found, bad requests and quota errors are not retried."""
+        assert classify_error(http_error(404)) == (False, None)
+        assert classify_error(http_error(403, b'{"reason": "quotaExceeded"}')) == (False, None)
+        assert classify_error(ValueError("bad mapping")) == (False, None)
+
+    def test_rate_limit_403_is_transient(self):
+        """Test that YouTube's per-second rate limit 403 is retried."""
+        assert classify_error(http_error(403, b'{"reason": "rateLimitExceeded"}'))[0]
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds, HTTP dates and junk."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # In the past
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestResilience:
+    """Test retries, backoff and the circuit breaker."""
+
+    def test_retries_then_succeeds(self, resilience, sleeps):
+        """Test that transient failures are retried with capped jittered backoff."""
+        fn = Mock(side_effect=[http_error(503), http_error(500), "ok"])
+
+        assert resilience.call(fn) == "ok"
+        assert fn.call_count == 3
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+        assert resilience.snapshot() == {
+            "calls": 1, "successes": 1, "retries": 2, "failures": 0,
+            "short_circuits": 0, "circuit": "closed",
+        }
+
+    def test_honors_retry_after(self, resilience, sleeps):
+        """Test that the upstream's Retry-After is waited out."""
+        fn = Mock(side_effect=[http_error(429, headers={"retry-after": "3"}), "ok"])
+
+        assert resilience.call(fn) == "ok"
+        assert sleeps[0] >= 3
+
+    def test_retry_after_past_deadline_fails_fast(self, resilience, sleeps):
+        """Test that a long Retry-After fails the call instead of blocking."""
+        fn = Mock(side_effect=http_error(429, headers={"retry-after": "3600"}))
+
+        with pytest.raises(UpstreamUnavailableError) as excinfo:
+            resilience.call(fn)
+
+        assert excinfo.value.retry_after == 3600
+        assert fn.call_count == 1
+        assert sleeps == []
+
+    def test_gives_up_after_max_attempts(self, resilience):
+        """Test that persistent transient failures raise UpstreamUnavailableError."""
+        fn = Mock(side_effect=TimeoutError("read timed out"))
+
+        with pytest.raises(UpstreamUnavailableError):
+            resilience.call(fn)
+        assert fn.call_count == 3
+        assert resilience.metrics["failures"] == 1
+
+    def test_permanent_error_not_retried(self, resilience):
+        """Test that a 404 is raised unchanged on the first attempt."""
+        fn = Mock(side_effect=http_error(404))
+
+        with pytest.raises(HttpError):
+            resilience.call(fn)
+        assert fn.call_count == 1
+        assert resilience.breaker.state == CircuitBreaker.CLOSED
+
+    def test_circuit_opens_and_recovers(self, resilience):
+        """Test open -> short-circuit -> half-open trial -> closed."""
+        clock = resilience.breaker._clock
+        failing = Mock(side_effect=http_error(503))
+
+        with pytest.raises(UpstreamUnavailableError):
+            resilience.call(failing)  # 3 failures
+        with pytest.raises(UpstreamUnavailableError):
+            resilience.call(failing)  # 2 more open the circuit
+        assert failing.call_count == 5
+        assert resilience.breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError) as excinfo:
+            resilience.call(failing)
+        assert failing.call_count == 5  # Upstream left alone
+        assert excinfo.value.retry_after == 30
+        assert resilience.metrics["short_circuits"] == 1
+
+        clock.now = 31
+        assert resilience.breaker.state == CircuitBreaker.HALF_OPEN
+        assert resilience.call(Mock(return_value="ok")) == "ok"
+        assert resilience.breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self, resilience):
+        """Test that a failed half-open trial opens the circuit again."""
+        breaker = resilience.breaker
+        for _ in range(5):
+            breaker.record_failure()
+        breaker._clock.now = 31
+
+        assert breaker.allow()
+        assert not breaker.allow()  # Only one trial at a time
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestIngestorResilience:
+    """Test that ingestors retry and surface outages instead of returning nothing."""
+
+    def test_youtube_get_by_id_retries(self, resilience):
+        """Test that a 503 from videos.list is retried."""
+        ingestor = YouTubeIngestor(api_key="test_key")
+        ingestor.resilience = resilience
+        client = Mock()
+        client.videos.return_value.list.return_value.execute.side_effect = [
+            http_error(503),
+            {"items": [{"id": "vid1", "snippet": {"title": "Butterfly drill"}}]},
+        ]
+        ingestor._youtube = client
+
+        assert ingestor.get_by_id("vid1").title == "Butterfly drill"
+
+    def test_youtube_get_by_id_raises_when_down(self, resilience):
+        """Test that an outage raises rather than looking like a missing video."""
+        ingestor = YouTubeIngestor(api_key="test_key")
+        ingestor.resilience = resilience
+        client = Mock()
+        client.videos.return_value.list.return_value.execute.side_effect = http_error(503)
+        ingestor._youtube = client
+
+        with pytest.raises(UpstreamUnavailableError):
+            ingestor.get_by_id("vid1")
+
+    def test_youtube_search_degrades_when_down(self, resilience):
+        """Test that search returns no results when YouTube is down."""
+        ingestor = YouTubeIngestor(api_key="test_key")
+        ingestor.resilience = resilience
+        client = Mock()
+        client.search.return_value.list.return_value.execute.side_effect = TimeoutError()
+        ingestor._youtube = client
+
+        assert ingestor.search("butterfly drill") == []
+
+    def test_reddit_get_by_id_raises_when_down(self, resilience):
+        """Test that Reddit outages surface from get_by_id."""
+        ingestor = RedditIngestor("id", "secret", "agent")
+        ingestor.resilience = resilience
+        ingestor._reddit = Mock()
+        type(ingestor._reddit.submission.return_value).title = property(
+            Mock(side_effect=httpx.ConnectError("refused"))
+        )
+
+        with pytest.raises(UpstreamUnavailableError):
+            ingestor.get_by_id("abc123")
@@ -0,0 +1,175 @@
+"""Tests for the on-disk API response cache."""
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.ingestors.cache import ResponseCache
+from src.ingestors.reddit import RedditIngestor
+from src.ingestors.youtube import YouTubeIngestor
+from src.models.content import ContentItem, ContentSource, ContentType
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database path, removed with its WAL files afterwards."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    yield temp_file.name
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def cache(db_path):
+    """Create a response cache on a temporary database."""
+    cache = ResponseCache(db_path)
+    yield cache
+    cache.close()
+
+
+class TestResponseCache:
+    """Test keys, expiry, eviction and counters."""
+
+    def test_roundtrip_and_counters(self, cache):
+        """Test that a stored response is returned and hits/misses are counted."""
+        assert cache.get("youtube.search", {"q": "butterfly"}) is None
+
+        cache.set("youtube.search", {"q": "butterfly"}, {"items": [1, 2]})
+
+        assert cache.get("youtube.search", {"q": "butterfly"}) == {"items": [1, 2]}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_key_normalization(self, cache):
+        """Test that parameter order and whitespace don't change the key."""
+        cache.set("youtube.search", {"q": "  butterfly   drill", "maxResults": 5}, {"items": []})
+
+        assert cache.get("youtube.search", {"maxResults": 5, "q": "butterfly drill"}) == {"items": []}
+        assert cache.get("youtube.search", {"maxResults": 10, "q": "butterfly drill"}) is None
+        assert cache.get("reddit.search", {"maxResults": 5, "q": "butterfly drill"}) is None
+
+    def test_expired_entries_miss(self, db_path):
+        """Test that entries past their endpoint's TTL are not returned."""
+        cache = ResponseCache(db_path, ttls={"youtube.search": 60})
+        try:
+            with patch("src.ingestors.cache.time.time", return_value=1000.0):
+                cache.set("youtube.search", {"q": "a"}, "old")
+                cache.set("other", {"q": "a"}, "kept")
+            with patch("src.ingestors.cache.time.time", return_value=1061.0):
+                assert cache.get("youtube.search", {"q": "a"}) is None
+                assert cache.get("other", {"q": "a"}) == "kept"  # default_ttl
+        finally:
+            cache.close()
+
+    def test_lru_eviction(self, db_path):
+        """Test that the least recently used entries are evicted past max_bytes."""
+        cache = ResponseCache(db_path, max_bytes=350)
+        try:
+            for i, now in enumerate([1000.0, 1001.0, 1002.0]):
+                with patch("src.ingestors.cache.time.time", return_value=now):
+                    cache.set("e", {"i": i}, "x" * 100)
+            # Three 102-byte entries fit; 0 was touched, so 1 goes when 3 arrives
+            with patch("src.ingestors.cache.time.time", return_value=1003.0):
+                cache.get("e", {"i": 0})
+            with patch("src.ingestors.cache.time.time", return_value=1004.0):
+                cache.set("e", {"i": 3}, "x" * 100)
+
+            with patch("src.ingestors.cache.time.time", return_value=1005.0):
+                assert cache.get("e", {"i": 1}) is None
+                assert cache.get("e", {"i": 0}) is not None
+                assert cache.get("e", {"i": 2}) is not None
+                assert cache.get("e", {"i": 3}) is not None
+            assert cache.stats()["bytes"] <= 350
+            assert cache.stats()["evictions"] == 1
+        finally:
+            cache.close()
+
+    def test_get_or_fetch_does_not_cache_errors(self, cache):
+        """Test that a failed fetch is retried next time."""
+        fetch = Mock(side_effect=[RuntimeError("quota"), {"items": []}])
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("youtube.search", {"q": "a"}, fetch)
+        assert cache.get_or_fetch("youtube.search", {"q": "a"}, fetch) == {"items": []}
+        assert cache.get_or_fetch("youtube.search", {"q": "a"}, fetch) == {"items": []}
+        assert fetch.call_count == 2
+
+    def test_persists_across_instances(self, db_path):
+        """Test that cached responses survive a restart."""
+        first = ResponseCache(db_path)
+        first.set("youtube.videos", {"id": "abc"}, {"id": "abc"})
+        first.close()
+
+        second = ResponseCache(db_path)
+        try:
+            assert second.get("youtube.videos", {"id": "abc"}) == {"id": "abc"}
+        finally:
+            second.close()
+
+
+class TestIngestorCaching:
+    """Test that repeated searches are served from the cache."""
+
+    def test_youtube_search_hits_cache(self, cache):
+        """Test that a repeated search makes no API calls."""
+        client = Mock()
+        client.search.return_value.list.return_value.execute.return_value = {"items": [
+            {"id": {"kind": "youtube#video", "videoId": "vid1"}},
+        ]}
+        client.videos.return_value.list.return_value.execute.return_value = {"items": [
+            {"id": "vid1", "snippet": {"title": "Butterfly drill"}},
+        ]}
+        ingestor = YouTubeIngestor(api_key="test_key", cache=cache)
+        ingestor._youtube = client
+
+        first = ingestor.search("Butterfly Drill", max_results=5)
+        second = ingestor.search("butterfly drill", max_results=5)
+
+        assert [item.title for item in first] == ["Butterfly drill"]
+        assert [item.id for item in second] == [item.id for item in first]
+        assert client.search.return_value.list.call_count == 1
+        assert client.videos.return_value.list.call_count == 1
+
+    def test_youtube_get_many_uncached_by_default(self, cache):
+        """Test that direct lookups (saves, refreshes) bypass the cache."""
+        client = Mock()
+        client.videos.return_value.list.return_value.execute.return_value = {"items": [
+            {"id": "vid1", "snippet": {"title": "Butterfly drill"}},
+        ]}
+        ingestor = YouTubeIngestor(api_key="test_key", cache=cache)
+        ingestor._youtube = client
+
+        ingestor.get_many(["vid1"], use_cache=True)
+        ingestor.get_many(["vid1"])
+
+        assert client.videos.return_value.list.call_count == 2
+
+    def test_reddit_search_hits_cache(self, cache):
+        """Test that a repeated Reddit search is served from the cache."""
+        ingestor = RedditIngestor("id", "secret", "agent", cache=cache)
+        item = ContentItem(
+            id="abc123",
+            source=ContentSource.REDDIT,
+            content_type=ContentType.POST,
+            title="Post-save recovery tips",
+            url="https://www.reddit.com/r/hockeygoalies/comments/abc123/",
+        )
+
+        with patch.object(RedditIngestor, "_search", return_value=[item]) as search:
+            first = ingestor.search("Recovery", subreddits=["hockeyplayers", "hockeygoalies"])
+            second = ingestor.search("recovery", subreddits=["hockeygoalies", "hockeyplayers"])
+
+        assert first == second == [item]
+        assert search.call_count == 1
+
+    def test_reddit_failed_search_not_cached(self, cache):
+        """Test that API errors return no results and aren't cached."""
+        ingestor = RedditIngestor("id", "secret", "agent", cache=cache)
+
+        with patch.object(RedditIngestor, "_search", side_effect=[RuntimeError("503"), []]) as search:
+            assert ingestor.search("recovery") == []
+            assert ingestor.search("recovery") == []
+
+        assert search.call_count == 2
@@ -0,0 +1,69 @@
+"""Tests for request coalescing."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.ingestors.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test that concurrent calls per key run once."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers with the same key get the leader's result."""
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(lambda _: flight.do("key", fetch), range(5)))
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert flight.coalesced == 4
+        assert flight.in_flight() == 0
+
+    def test_different_keys_run_independently(self):
+        """Test that distinct keys are not coalesced."""
+        flight = SingleFlight()
+        barrier = threading.Barrier(2, timeout=1)
+
+        def fetch(key):
+            barrier.wait()  # Deadlocks if the two keys were serialized
+            return key
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda key: flight.do(key, fetch, key), ["a", "b"]))
+
+        assert results == ["a", "b"]
+
+    def test_error_reaches_every_waiter(self):
+        """Test that the leader's exception is raised in waiting callers too."""
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise RuntimeError("upstream down")
+
+        def call(_):
+            with pytest.raises(RuntimeError, match="upstream down"):
+                flight.do("key", fail)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(call, range(3)))
+
+        assert flight.in_flight() == 0
+
+    def test_results_are_not_cached(self):
+        """Test that sequential calls each execute."""
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        assert flight.do("key", next, counter) == 0
+        assert flight.do("key", next, counter) == 1
@@ -0,0 +1,253 @@
+"""Tests for the pooled SQLite connection layer."""
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.models.content import ContentItem, ContentSource, ContentType
+from src.storage.pool import ConnectionPool, PoolClosedError
+from src.storage.sqlite import SQLiteRepository
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    yield temp_file.name
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+class TestConnectionPool:
+    """Test ConnectionPool checkout, reuse and shutdown."""
+
+    def test_connection_is_reused(self, temp_db):
+        """Test that sequential checkouts share one connection."""
+        pool = ConnectionPool(temp_db, size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        pool.close()
+
+    def test_pragmas_applied_once_per_connection(self, temp_db):
+        """Test that configured PRAGMAs are set on new connections."""
+        pool = ConnectionPool(temp_db, size=1, pragmas={"foreign_keys": "ON"})
+
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        pool.close()
+
+    def test_pool_never_exceeds_size(self, temp_db):
+        """Test that concurrent threads share at most `size` connections."""
+        pool = ConnectionPool(temp_db, size=2)
+        seen = set()
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(20):
+                with pool.connection() as conn:
+                    conn.execute("SELECT 1").fetchone()
+                    with lock:
+                        seen.add(id(conn))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(seen) <= 2
+        pool.close()
+
+    def test_unhealthy_connection_is_replaced(self, temp_db):
+        """Test that a closed connection is discarded on checkout."""
+        pool = ConnectionPool(temp_db, size=1, ping_after=0)
+
+        with pool.connection() as conn:
+            conn.close()  # Simulate a broken connection
+
+        with pool.connection() as replacement:
+            assert replacement is not conn
+            assert replacement.execute("SELECT 1").fetchone()[0] == 1
+        pool.close()
+
+    def test_recently_used_connection_is_not_pinged(self, temp_db):
+        """Test that only connections idle past ping_after are checked on checkout."""
+        pool = ConnectionPool(temp_db, size=1, ping_after=60)
+        statements = []
+        with pool.connection() as conn:
+            conn.set_trace_callback(statements.append)
+
+        with pool.connection():
+            pass
+        assert statements == []
+
+        pool.ping_after = 0
+        with pool.connection():
+            pass
+        assert statements == ["SELECT 1"]
+        pool.close()
+
+    def test_connection_checked_after_error(self, temp_db):
+        """Test that a connection whose last use failed is checked even if fresh."""
+        pool = ConnectionPool(temp_db, size=1, ping_after=60)
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            with pool.connection() as conn:
+                conn.close()
+                conn.execute("SELECT 1")
+
+        with pool.connection() as replacement:
+            assert replacement is not conn
+            assert replacement.execute("SELECT 1").fetchone()[0] == 1
+        pool.close()
+
+    def test_transaction_rolls_back_on_error(self, temp_db):
+        """Test that failed transactions leave no partial writes."""
+        pool = ConnectionPool(temp_db, size=1)
+        with pool.transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with pool.transaction() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise sqlite3.IntegrityError("boom")
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        pool.close()
+
+    def test_immediate_transaction_holds_write_lock(self, temp_db):
+        """Test that an immediate transaction locks out writers before its first write."""
+        pool = ConnectionPool(temp_db, size=2)
+        with pool.transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with pool.transaction(immediate=True) as conn:
+            conn.execute("SELECT COUNT(*) FROM t").fetchone()
+            other = sqlite3.connect(temp_db, timeout=0)
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("INSERT INTO t VALUES (1)")
+            other.close()
+            conn.execute("INSERT INTO t VALUES (2)")
+
+        with pool.connection() as conn:
+            assert [row[0] for row in conn.execute("SELECT x FROM t")] == [2]
+        pool.close()
+
+    def test_close_refuses_new_checkouts(self, temp_db):
+        """Test that a closed pool raises instead of reopening."""
+        pool = ConnectionPool(temp_db, size=1)
+        assert pool.health_check()
+
+        pool.close()
+
+        assert pool.closed
+        assert not pool.health_check()
+        with pytest.raises(PoolClosedError):
+            with pool.connection():
+                pass
+
+
+class TestPooledRepository:
+    """Test SQLiteRepository on top of the pool."""
+
+    def test_concurrent_saves_and_reads(self, temp_db):
+        """Test that threads can save and read through a shared repository."""
+        repo = SQLiteRepository(temp_db, pool_size=3)
+
+        def worker(n):
+            for i in range(10):
+                repo.save(ContentItem(
+                    id=f"t{n}-{i}",
+                    source=ContentSource.YOUTUBE,
+                    content_type=ContentType.VIDEO,
+                    title=f"Drill {n}-{i}",
+                    url=f"https://youtube.com/watch?v=t{n}-{i}",
+                ))
+                assert repo.get(f"t{n}-{i}") is not None
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(repo.search_saved()) == 40
+        assert repo.health_check()
+        repo.close()
+
+
+class TestPragmaProfile:
+    """Test the configurable PRAGMA profile and WAL checkpointing."""
+
+    PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -2000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 1000,
+    }
+
+    def test_profile_applied_to_connections(self, temp_db):
+        """Test that the repository connections use the configured PRAGMAs."""
+        repo = SQLiteRepository(temp_db, pragmas=self.PRAGMAS)
+
+        with repo._pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2000
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1000
+        repo.close()
+
+    def test_reads_not_blocked_by_open_write(self, temp_db):
+        """Test that readers see the last commit while a write is in progress."""
+        repo = SQLiteRepository(temp_db, pool_size=2, pragmas=self.PRAGMAS)
+        repo.save(ContentItem(
+            id="committed",
+            source=ContentSource.YOUTUBE,
+            content_type=ContentType.VIDEO,
+            title="Committed",
+            url="https://youtube.com/watch?v=committed",
+        ))
+
+        writer = sqlite3.connect(temp_db, timeout=0)
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute(
+            "INSERT INTO content (source, id, content_type, title, url, fetched_at) "
+            "VALUES ('YouTube', 'pending', 'Video', 'Pending', 'u', '2024-01-01')"
+        )
+
+        # Reader must not wait on the writer's lock
+        assert repo.get("committed") is not None
+        assert repo.get("pending") is None
+
+        writer.commit()
+        writer.close()
+        assert repo.get("pending") is not None
+        repo.close()
+
+    def test_checkpoint(self, temp_db):
+        """Test that checkpoint copies WAL frames into the database."""
+        repo = SQLiteRepository(temp_db, pragmas=self.PRAGMAS)
+        repo.save(ContentItem(
+            id="wal1",
+            source=ContentSource.YOUTUBE,
+            content_type=ContentType.VIDEO,
+            title="WAL",
+            url="https://youtube.com/watch?v=wal1",
+        ))
+
+        busy, wal_frames, checkpointed = repo.checkpoint()
+
+        assert busy == 0
+        assert wal_frames == checkpointed
+        repo.close()
@@ -0,0 +1,321 @@
+"""Tests for SQLiteRepository write paths."""
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.models.content import ContentItem, ContentSource, ContentType, Difficulty
+from src.storage.repository import SaveResult
+from src.storage.sqlite import SQLiteRepository
+
+
+@pytest.fixture
+def repo():
+    """Create a repository on a temporary database."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    repo = SQLiteRepository(temp_file.name)
+    yield repo
+    repo.close()
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+def make_item(content_id: str, title: str = "Drill", **kwargs) -> ContentItem:
+    """Build a YouTube ContentItem for tests."""
+    return ContentItem(
+        id=content_id,
+        source=kwargs.pop("source", ContentSource.YOUTUBE),
+        content_type=ContentType.VIDEO,
+        title=title,
+        url=f"https://youtube.com/watch?v={content_id}",
+        **kwargs,
+    )
+
+
+class TestSaveMany:
+    """Test bulk saves."""
+
+    def test_reports_inserted_and_updated(self, repo):
+        """Test per-item status for new, existing and repeated items."""
+        repo.save(make_item("existing", "Old title"))
+
+        results = repo.save_many([
+            make_item("new1"),
+            make_item("existing", "New title"),
+            make_item("new2"),
+            make_item("new1", "Repeated in batch"),
+        ], chunk_size=2)
+
+        assert results == [
+            SaveResult.INSERTED,
+            SaveResult.UPDATED,
+            SaveResult.INSERTED,
+            SaveResult.UPDATED,
+        ]
+        assert repo.get("existing").title == "New title"
+        assert repo.get("new1").title == "Repeated in batch"
+        assert repo.count() == 3
+
+    def test_same_id_different_sources_are_distinct(self, repo):
+        """Test that status is keyed on (source, id), not id alone."""
+        results = repo.save_many([
+            make_item("abc", source=ContentSource.YOUTUBE),
+            make_item("abc", source=ContentSource.REDDIT),
+        ])
+
+        assert results == [SaveResult.INSERTED, SaveResult.INSERTED]
+
+    def test_sets_saved_at_and_indexes_text(self, repo):
+        """Test that bulk-saved rows are stamped and searchable."""
+        repo.save_many([make_item(f"v{i}", f"Butterfly {i}") for i in range(1200)])
+
+        assert repo.get("v0").saved_at is not None
+        assert len(repo.search("butterfly", limit=2000)) == 1200
+
+    def test_rolls_back_whole_batch_on_error(self, repo):
+        """Test that a failing item leaves nothing from the batch behind."""
+        bad = make_item("bad")
+        bad.title = None  # Violates NOT NULL
+
+        with pytest.raises(Exception):
+            repo.save_many([make_item("ok1"), bad], chunk_size=1)
+
+        assert repo.count() == 0
+
+    def test_existence_check_runs_inside_write_transaction(self, repo):
+        """Test that the status SELECT can't race a concurrent insert."""
+        statements = []
+        with repo._pool.connection() as conn:
+            conn.set_trace_callback(lambda sql: statements.append((sql, conn.in_transaction)))
+
+        repo.save_many([make_item("v1")])
+
+        checks = [in_transaction for sql, in_transaction in statements if "IN (VALUES" in sql]
+        assert "BEGIN IMMEDIATE" in [sql for sql, _ in statements]
+        assert checks == [True]
+        with repo._pool.connection() as conn:
+            conn.set_trace_callback(None)
+
+    def test_empty_batch(self, repo):
+        """Test that saving nothing is a no-op."""
+        assert repo.save_many([]) == []
+
+
+class TestUpdateMetadata:
+    """Test partial drill metadata updates."""
+
+    def test_updates_only_given_columns(self, repo):
+        """Test that unspecified columns keep their values."""
+        repo.save(make_item(
+            "v1",
+            "Butterfly push",
+            equipment="pucks",
+            age_group="bantam",
+            source_metadata={"channel_id": "abc"},
+        ))
+
+        updated = repo.update_metadata("v1", {"difficulty": "advanced", "drill_tags": ["edges"]})
+
+        assert updated.difficulty == "Advanced"
+        assert updated.drill_tags == ["edges"]
+        assert updated.equipment == "pucks"
+        assert updated.age_group == "bantam"
+        assert updated.source_metadata == {"channel_id": "abc"}
+        assert repo.get("v1").difficulty == "Advanced"
+
+    def test_keeps_row_identity(self, repo):
+        """Test that the row is updated in place, not deleted and re-inserted."""
+        repo.save(make_item("v1", "Butterfly push"))
+        with repo._pool.connection() as conn:
+            rowid = conn.execute("SELECT rowid FROM content WHERE id = 'v1'").fetchone()[0]
+
+        repo.update_metadata("v1", {"equipment": "cones"})
+
+        with repo._pool.connection() as conn:
+            assert conn.execute("SELECT rowid FROM content WHERE id = 'v1'").fetchone()[0] == rowid
+        assert [item.id for item in repo.search("butterfly")] == ["v1"]
+
+    def test_drill_description_is_searchable_after_update(self, repo):
+        """Test that text metadata updates reach the full-text index."""
+        repo.save(make_item("v1", "Edge work"))
+
+        repo.update_metadata("v1", {"drill_description": "Great for recovery"})
+
+        assert [item.id for item in repo.search("recovery")] == ["v1"]
+
+    def test_missing_item(self, repo):
+        """Test that updating an unknown ID returns None."""
+        assert repo.update_metadata("missing", {"equipment": "cones"}) is None
+
+    def test_rejects_non_metadata_columns(self, repo):
+        """Test that only drill metadata columns can be updated."""
+        repo.save(make_item("v1"))
+
+        with pytest.raises(ValueError):
+            repo.update_metadata("v1", {"title": "Hijacked"})
+
+
+class TestRowDecoding:
+    """Test the trusted fast decode path against the validating decoder."""
+
+    def test_fast_decode_matches_validated_decode(self, repo):
+        """Test that RowDecoder builds the same items as full validation."""
+        repo.save(make_item(
+            "full",
+            description="Lateral pushes",
+            author="Coach",
+            published_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            view_count=10,
+            source_metadata={"duration": "PT5M"},
+            tags=["butterfly"],
+            drill_tags=["warmup"],
+            difficulty=Difficulty.ADVANCED,
+            equipment="pucks",
+            age_group="bantam",
+        ))
+        repo.save(make_item("sparse"))
+
+        with repo._pool.connection() as conn:
+            rows = conn.execute("SELECT * FROM content ORDER BY id").fetchall()
+
+        fast = repo._decode_rows(rows)
+        slow = [repo._row_to_content_item(row) for row in rows]
+
+        assert [item.model_dump() for item in fast] == [item.model_dump() for item in slow]
+
+    def test_legacy_lowercase_difficulty(self, repo):
+        """Test that lowercase difficulty values are normalized on the fast path."""
+        repo.save(make_item("legacy"))
+        with repo._pool.transaction() as conn:
+            conn.execute("UPDATE content SET difficulty = 'beginner' WHERE id = 'legacy'")
+
+        assert repo.get("legacy").difficulty == Difficulty.BEGINNER
+
+    def test_falls_back_on_malformed_row(self, repo):
+        """Test that rows the fast path rejects still decode via validation."""
+        repo.save(make_item("broken"))
+        with repo._pool.transaction() as conn:
+            conn.execute("UPDATE content SET drill_tags = 'not json' WHERE id = 'broken'")
+
+        item = repo.get_by_id(ContentSource.YOUTUBE, "broken")
+
+        assert item.id == "broken"
+        assert item.drill_tags == []
+
+    def test_falls_back_without_metadata(self, repo):
+        """Test that the fallback handles rows selected without source_metadata."""
+        repo.save(make_item("broken", source_metadata={"duration": "PT5M"}, tags=["butterfly"]))
+        with repo._pool.transaction() as conn:
+            conn.execute("UPDATE content SET published_at = 'garbage' WHERE id = 'broken'")
+
+        item = repo.search("", include_metadata=False)[0]
+
+        assert item.id == "broken"
+        assert item.published_at is None
+        assert item.source_metadata == {}
+        assert item.tags == ["butterfly"]
+
+    def test_search_without_metadata(self, repo):
+        """Test that source_metadata is skipped when not requested."""
+        repo.save(make_item("meta", source_metadata={"duration": "PT5M"}, tags=["butterfly"]))
+
+        item = repo.search(include_metadata=False)[0]
+
+        assert item.source_metadata == {}
+        assert item.tags == ["butterfly"]
+        assert repo.search()[0].source_metadata == {"duration": "PT5M"}
+
+    def test_search_with_fields(self, repo):
+        """Test that a projection loads the requested and key columns only."""
+        repo.save(make_item("sparse", description="Long description", view_count=5))
+
+        item = repo.search(fields=["title"])[0]
+
+        assert item.id == "sparse"
+        assert item.title == "Drill"
+        assert item.description is None
+        assert item.view_count is None
+        assert "url" not in item.__dict__
+
+    def test_search_with_fields_falls_back(self, repo):
+        """Test that a projected row the fast path rejects still decodes sparsely."""
+        repo.save(make_item("broken", view_count=5))
+        with repo._pool.transaction() as conn:
+            conn.execute("UPDATE content SET saved_at = 'garbage' WHERE id = 'broken'")
+
+        item = repo.search(fields=["id", "title"])[0]
+
+        assert (item.id, item.title) == ("broken", "Drill")
+        assert item.saved_at is None
+        assert item.view_count is None
+        assert "url" not in item.__dict__
+
+    def test_search_with_unknown_field(self, repo):
+        """Test that unknown projection columns are rejected."""
+        with pytest.raises(ValueError, match="bogus"):
+            repo.search(fields=["bogus"])
+
+
+class TestStats:
+    """Test reading and writing engagement stats for refreshes."""
+
+    def test_stats_due(self, repo):
+        """Test that only items fetched before the cutoff are listed, oldest first."""
+        repo.save(make_item("fresh", fetched_at=datetime(2026, 3, 1, tzinfo=timezone.utc)))
+        repo.save(make_item("newer", fetched_at=datetime(2026, 2, 1, tzinfo=timezone.utc)))
+        repo.save(make_item("older", fetched_at=datetime(2026, 1, 1, tzinfo=timezone.utc), view_count=5))
+        repo.save(make_item("reddit", source=ContentSource.REDDIT, fetched_at=datetime(2026, 1, 1, tzinfo=timezone.utc)))
+
+        rows = repo.stats_due(datetime(2026, 2, 15, tzinfo=timezone.utc), [ContentSource.YOUTUBE])
+
+        assert [row.id for row in rows] == ["older", "newer"]
+        assert rows[0].view_count == 5
+        assert rows[0].fetched_at == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def test_update_stats(self, repo):
+        """Test that only the given columns change and fetched_at moves forward."""
+        repo.save(make_item("a", view_count=10, like_count=2, comment_count=1))
+        repo.save(make_item("b", view_count=7, like_count=1))
+        fetched_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+        updated = repo.update_stats(ContentSource.YOUTUBE, {"a": {"view_count": 15}, "b": {}}, fetched_at)
+
+        a, b = repo.get("a"), repo.get("b")
+        assert updated == 2
+        assert (a.view_count, a.like_count, a.comment_count) == (15, 2, 1)
+        assert (b.view_count, b.like_count) == (7, 1)
+        assert a.fetched_at == b.fetched_at == fetched_at
+
+    def test_update_stats_rejects_other_columns(self, repo):
+        """Test that update_stats can't change non-stat columns."""
+        with pytest.raises(ValueError, match="title"):
+            repo.update_stats(ContentSource.YOUTUBE, {"a": {"title": "New"}})
+
+
+class TestVacuum:
+    """Test compaction and full-text index rebuilds."""
+
+    def test_vacuum_keeps_search_working(self, repo):
+        """Test that search still finds the right rows after a vacuum."""
+        repo.save_many([make_item(f"v{i}", f"Drill {i}") for i in range(10)])
+        for i in range(0, 10, 2):
+            repo.delete(ContentSource.YOUTUBE, f"v{i}")
+        repo.save(make_item("late", "Butterfly recovery"))
+
+        repo.vacuum()
+
+        assert [item.id for item in repo.search("butterfly")] == ["late"]
+        assert sorted(item.id for item in repo.search("drill")) == ["v1", "v3", "v5", "v7", "v9"]
+
+    def test_rebuild_fts_reattaches_index(self, repo):
+        """Test that a detached index is rebuilt from the content table."""
+        repo.save(make_item("v1", "Butterfly push"))
+        with repo._pool.transaction() as conn:
+            conn.execute("UPDATE content_fts SET rowid = rowid + 1000")  # As if VACUUM renumbered content
+        assert repo.search("butterfly") == []
+
+        repo.rebuild_fts()
+
+        assert [item.id for item in repo.search("butterfly")] == ["v1"]
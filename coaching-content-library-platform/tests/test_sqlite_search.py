@@ -0,0 +1,197 @@
+"""Tests for SQLiteRepository search (FTS5 index, filters, query plans)."""
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.models.content import ContentItem, ContentSource, ContentType
+from src.storage.sqlite import SQLiteRepository
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    yield temp_file.name
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+def make_item(content_id: str, title: str, **kwargs) -> ContentItem:
+    """Build a YouTube ContentItem for tests."""
+    return ContentItem(
+        id=content_id,
+        source=kwargs.pop("source", ContentSource.YOUTUBE),
+        content_type=kwargs.pop("content_type", ContentType.VIDEO),
+        title=title,
+        url=f"https://youtube.com/watch?v={content_id}",
+        **kwargs,
+    )
+
+
+def query_plans(repo: SQLiteRepository, call) -> list[list[str]]:
+    """Run a repository call and return EXPLAIN QUERY PLAN details for its SELECTs."""
+    statements = []
+    with repo._pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        with repo._pool.connection() as conn:
+            conn.set_trace_callback(None)
+
+    plans = []
+    with repo._pool.connection() as conn:
+        for sql in statements:
+            if sql.startswith("SELECT content.*") or sql.startswith("SELECT * FROM content"):
+                plans.append([row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")])
+    return plans
+
+
+class TestFullTextSearch:
+    """Test the FTS5-backed text search."""
+
+    def test_search_matches_title_description_and_drill_fields(self, temp_db):
+        """Test that all indexed columns are searchable."""
+        repo = SQLiteRepository(temp_db)
+        repo.save(make_item("a", "Butterfly push basics"))
+        repo.save(make_item("b", "Edge work", description="Focus on the butterfly slide"))
+        repo.save(make_item("c", "Warmup", drill_description="Butterfly recovery reps"))
+        repo.save(make_item("d", "Tracking", drill_tags=["butterfly"]))
+        repo.save(make_item("e", "Glove saves"))
+
+        results = repo.search("butterfly")
+
+        assert {item.id for item in results} == {"a", "b", "c", "d"}
+
+    def test_title_matches_rank_first(self, temp_db):
+        """Test that results are ordered by BM25 relevance, not recency."""
+        repo = SQLiteRepository(temp_db)
+        repo.save(make_item("desc", "Edge work", description="a butterfly drill"))
+        repo.save(make_item("title", "Butterfly drill"))
+
+        results = repo.search("butterfly")
+
+        assert [item.id for item in results] == ["title", "desc"]
+
+    def test_prefix_and_multi_word_queries(self, temp_db):
+        """Test that words match as prefixes and all words are required."""
+        repo = SQLiteRepository(temp_db)
+        repo.save(make_item("a", "Butterfly push drill"))
+        repo.save(make_item("b", "Butterfly slide"))
+
+        assert {i.id for i in repo.search("butter")} == {"a", "b"}
+        assert [i.id for i in repo.search("butterfly push")] == ["a"]
+        assert [i.id for i in repo.search('push" NEAR(')] == []  # FTS syntax is quoted
+        assert [i.id for i in repo.search('"push*')] == ["a"]
+
+    def test_index_follows_updates_and_deletes(self, temp_db):
+        """Test that triggers keep the index in sync with the content table."""
+        repo = SQLiteRepository(temp_db)
+        item = make_item("a", "Butterfly push")
+        repo.save(item)
+
+        item.title = "Glove positioning"
+        repo.save(item)
+        assert repo.search("butterfly") == []
+        assert [i.id for i in repo.search("glove")] == ["a"]
+
+        repo.delete(ContentSource.YOUTUBE, "a")
+        assert repo.search("glove") == []
+
+        with sqlite3.connect(temp_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM content_fts").fetchone()[0] == 0
+
+    def test_search_saved_uses_index_with_filters(self, temp_db):
+        """Test search_saved text query combined with tag filters."""
+        repo = SQLiteRepository(temp_db)
+        repo.save(make_item("a", "Butterfly push", tags=["warmup"]))
+        repo.save(make_item("b", "Butterfly slide", tags=["game"]))
+
+        results = repo.search_saved(query="butterfly", tags=["warmup"])
+
+        assert [item.id for item in results] == ["a"]
+
+    def test_index_built_for_existing_database(self, temp_db):
+        """Test that databases created before the index get it backfilled."""
+        repo = SQLiteRepository(temp_db)
+        repo.save(make_item("old", "Butterfly push"))
+        repo.close()
+
+        with sqlite3.connect(temp_db) as conn:
+            for trigger in ("content_fts_ai", "content_fts_ad", "content_fts_au"):
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("DROP TABLE content_fts")
+
+        repo = SQLiteRepository(temp_db)
+
+        assert [item.id for item in repo.search("butterfly")] == ["old"]
+
+    def test_like_fallback_without_index(self, temp_db):
+        """Test substring search when FTS is unavailable."""
+        repo = SQLiteRepository(temp_db)
+        repo.save(make_item("a", "Butterfly push"))
+        repo._fts_enabled = False
+
+        assert [item.id for item in repo.search("terfly")] == ["a"]
+
+    def test_punctuation_only_query_falls_back(self, temp_db):
+        """Test that a query with no words still runs (via LIKE)."""
+        repo = SQLiteRepository(temp_db)
+        repo.save(make_item("a", "Butterfly (push)"))
+
+        assert [item.id for item in repo.search("(")] == ["a"]
+
+
+class TestQueryPlans:
+    """Guard against filter and sort queries regressing to full table scans."""
+
+    @pytest.fixture
+    def repo(self, temp_db):
+        """Repository with a few rows so the planner has a table to look at."""
+        repo = SQLiteRepository(temp_db, pool_size=1)
+        for i in range(5):
+            repo.save(make_item(f"v{i}", f"Drill {i}", difficulty="Beginner", age_group="bantam"))
+        return repo
+
+    @pytest.mark.parametrize("call", [
+        lambda r: r.get("v1"),
+        lambda r: r.search("", limit=10),
+        lambda r: r.search("", criteria={"source": ContentSource.YOUTUBE}, limit=10),
+        lambda r: r.search("", criteria={"content_type": ContentType.VIDEO}, limit=10),
+        lambda r: r.search("", criteria={"difficulty": "beginner"}, limit=10),
+        lambda r: r.search("", criteria={"age_group": "bantam"}, limit=10),
+        lambda r: r.search_saved(collection_id="warmups"),
+    ], ids=["get", "list", "source", "content_type", "difficulty", "age_group", "collection"])
+    def test_uses_index_without_sort(self, repo, call):
+        """Test that each query is index-driven and needs no temp sort."""
+        plans = query_plans(repo, lambda: call(repo))
+
+        assert plans
+        for plan in plans:
+            for detail in plan:
+                assert not (detail.startswith("SCAN content ") and "INDEX" not in detail), plan
+                assert detail != "SCAN content", plan
+                assert "TEMP B-TREE" not in detail, plan
+
+    def test_text_search_uses_fts_index(self, repo):
+        """Test that text queries go through the FTS5 virtual table."""
+        plans = query_plans(repo, lambda: repo.search("drill", limit=10))
+
+        assert any("content_fts VIRTUAL TABLE INDEX" in d for d in plans[0]), plans
+        assert "SEARCH content USING INTEGER PRIMARY KEY (rowid=?)" in plans[0], plans
+
+    def test_obsolete_managed_index_dropped(self, temp_db):
+        """Test that stray idx_content_* indexes are removed on startup."""
+        SQLiteRepository(temp_db).close()
+        with sqlite3.connect(temp_db) as conn:
+            conn.execute("CREATE INDEX idx_content_stale ON content (author)")
+
+        SQLiteRepository(temp_db).close()
+
+        with sqlite3.connect(temp_db) as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "idx_content_stale" not in names
+        assert "idx_content_difficulty" in names
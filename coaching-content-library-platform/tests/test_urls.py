@@ -0,0 +1,138 @@
+"""Tests for URL canonicalization and short-link resolution."""
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.ingestors.tiktok import TikTokIngestor
+from src.ingestors.urls import ContentRef, URLResolver, canonicalize, detect
+from src.models.content import ContentSource
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database path for the persistent cache."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    yield temp_file.name
+    for suffix in ("", "-wal", "-shm"):
+        Path(temp_file.name + suffix).unlink(missing_ok=True)
+
+
+class TestCanonicalize:
+    """Test URL parsing without network access."""
+
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://youtube.com/shorts/dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?t=42",
+    ])
+    def test_youtube_forms_share_one_canonical_url(self, url):
+        """Test that every YouTube URL shape maps to the watch URL."""
+        ref = canonicalize(ContentSource.YOUTUBE, url)
+
+        assert ref == ContentRef(
+            ContentSource.YOUTUBE, "dQw4w9WgXcQ", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        )
+
+    def test_reddit(self):
+        """Test that tracking params and slugs are dropped from Reddit URLs."""
+        ref = canonicalize(
+            ContentSource.REDDIT,
+            "https://old.reddit.com/r/hockeygoalies/comments/abc123/butterfly_tips/?utm_source=share",
+        )
+
+        assert ref.id == "abc123"
+        assert ref.url == "https://www.reddit.com/r/hockeygoalies/comments/abc123/"
+
+    def test_tiktok_short_link_is_flagged(self):
+        """Test that vm.tiktok.com codes are marked as needing expansion."""
+        ref = canonicalize(ContentSource.TIKTOK, "vm.tiktok.com/ZMabc123")
+
+        assert ref.short_link
+        assert ref.id == "ZMabc123"
+        assert ref.url == "https://vm.tiktok.com/ZMabc123/"
+
+    def test_unrecognized(self):
+        """Test that foreign URLs don't parse."""
+        assert canonicalize(ContentSource.INSTAGRAM, "https://example.com/p/abc") is None
+
+    def test_detect_source(self):
+        """Test that detect() finds the source for any supported URL."""
+        assert detect("https://www.instagram.com/reel/Cxyz_1/").source == ContentSource.INSTAGRAM
+        assert detect("https://example.com/") is None
+
+
+class TestURLResolver:
+    """Test short-link expansion and its caches."""
+
+    SHORT = "https://vm.tiktok.com/ZMabc123/"
+    FULL = "https://www.tiktok.com/@goalie.coach/video/7212345678901234567?is_from_webapp=1"
+
+    def test_expands_once(self):
+        """Test that a short link is expanded once and then served from memory."""
+        expander = Mock(return_value=self.FULL)
+        resolver = URLResolver(expander)
+
+        first = resolver.resolve(ContentSource.TIKTOK, self.SHORT)
+        second = resolver.resolve(ContentSource.TIKTOK, "https://vm.tiktok.com/ZMabc123")
+
+        assert first == second
+        assert first.id == "7212345678901234567"
+        assert first.url == "https://www.tiktok.com/@goalie.coach/video/7212345678901234567"
+        expander.assert_called_once_with(self.SHORT)
+
+    def test_expansion_persists(self, db_path):
+        """Test that expansions survive a new resolver on the same database."""
+        URLResolver(Mock(return_value=self.FULL), db_path=db_path).resolve(
+            ContentSource.TIKTOK, self.SHORT
+        )
+        expander = Mock()
+        resolver = URLResolver(expander, db_path=db_path)
+
+        ref = resolver.resolve(ContentSource.TIKTOK, self.SHORT, allow_network=False)
+
+        assert ref.id == "7212345678901234567"
+        expander.assert_not_called()
+        resolver.close()
+
+    def test_no_network(self):
+        """Test that uncached short links are returned unexpanded when offline."""
+        expander = Mock()
+        ref = URLResolver(expander).resolve(ContentSource.TIKTOK, self.SHORT, allow_network=False)
+
+        assert ref.short_link
+        expander.assert_not_called()
+
+    def test_failed_expansion_is_not_cached(self):
+        """Test that a failed expansion is retried next time."""
+        expander = Mock(side_effect=[None, self.FULL])
+        resolver = URLResolver(expander)
+
+        assert resolver.resolve(ContentSource.TIKTOK, self.SHORT).short_link
+        assert not resolver.resolve(ContentSource.TIKTOK, self.SHORT).short_link
+
+    def test_memory_cache_is_bounded(self):
+        """Test that the in-memory cache evicts least recently used links."""
+        resolver = URLResolver(
+            lambda url: f"https://www.tiktok.com/@u/video/{len(url)}", cache_size=2
+        )
+        for code in ("A1", "B22", "C333"):
+            resolver.resolve(ContentSource.TIKTOK, f"https://vm.tiktok.com/{code}/")
+
+        assert list(resolver._memory) == [
+            "https://vm.tiktok.com/B22/", "https://vm.tiktok.com/C333/"
+        ]
+
+    def test_tiktok_ingestor_stores_numeric_id(self):
+        """Test that TikTokIngestor saves share links under the real video ID."""
+        ingestor = TikTokIngestor(url_resolver=URLResolver(Mock(return_value=self.FULL)))
+
+        assert ingestor.extract_id(self.SHORT) == "ZMabc123"  # Not expanded yet
+        item = ingestor.from_url(self.SHORT)
+
+        assert item.id == "7212345678901234567"
+        assert item.url == "https://www.tiktok.com/@goalie.coach/video/7212345678901234567"
+        assert ingestor.extract_id(self.SHORT) == "7212345678901234567"
@@ -1,5 +1,15 @@
 """Tests for YouTube ingestor."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
 import pytest
+from unittest.mock import Mock, patch
+from googleapiclient.discovery import build
+
+from src.config import settings
 from src.ingestors.youtube import YouTubeIngestor
 
 
@@ -14,3 +24,151 @@ def test_youtube_fetch_content():
     ingestor = YouTubeIngestor(api_key="test_key")
     results = ingestor.search("goalie drills", max_results=5)
     assert isinstance(results, list)
+
+
+def fake_videos_client(missing=(), fail_on_call=None):
+    """YouTube client stub whose videos().list echoes the requested IDs."""
+    calls = []
+
+    def videos_list(part, id):
+        calls.append(id.split(','))
+        request = Mock()
+        if fail_on_call == len(calls):
+            request.execute.side_effect = RuntimeError("backend error")
+        else:
+            # Reverse to check that request order is restored
+            request.execute.return_value = {'items': [
+                {'id': video_id, 'snippet': {'title': f"Video {video_id}"}}
+                for video_id in reversed(id.split(',')) if video_id not in missing
+            ]}
+        return request
+
+    client = Mock()
+    client.videos.return_value.list.side_effect = videos_list
+    return client, calls
+
+
+def test_youtube_get_many_batches_by_50():
+    """Test that get_many uses one videos.list call per 50 IDs."""
+    ingestor = YouTubeIngestor(api_key="test_key")
+    ingestor._youtube, calls = fake_videos_client(missing={"vid00007"})
+    ids = [f"vid{i:05d}" for i in range(120)]
+
+    videos = ingestor.get_many(ids + ids[:10])
+
+    assert [len(chunk) for chunk in calls] == [50, 50, 20]
+    assert list(videos) == [video_id for video_id in ids if video_id != "vid00007"]
+    assert videos["vid00042"].title == "Video vid00042"
+
+
+def test_youtube_get_many_skips_failed_chunk():
+    """Test that one failed call only loses its own chunk."""
+    ingestor = YouTubeIngestor(api_key="test_key")
+    ingestor._youtube, _ = fake_videos_client(fail_on_call=1)
+
+    videos = ingestor.get_many([f"vid{i:05d}" for i in range(60)])
+
+    assert list(videos) == [f"vid{i:05d}" for i in range(50, 60)]
+
+
+class StubYouTubeHandler(BaseHTTPRequestHandler):
+    """Minimal search.list / videos.list server with a fixed delay per search."""
+
+    latency = 0.2
+    searched = []  # Terms searched, in arrival order
+    slow_terms = {}  # Term -> latency overriding `latency`
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+
+        if url.path.endswith("/search"):
+            term = params["q"][0]
+            self.searched.append(term)
+            time.sleep(self.slow_terms.get(term, self.latency))
+            count = int(params["maxResults"][0])
+            # Adjacent terms share one video so dedup is exercised
+            ids = [f"{term}-{i}" for i in range(count - 1)] + ["shared"]
+            body = {"items": [
+                {"id": {"kind": "youtube#video", "videoId": video_id}} for video_id in ids
+            ]}
+        else:
+            body = {"items": [
+                {"id": video_id, "snippet": {"title": video_id}}
+                for video_id in params["id"][0].split(",")
+            ]}
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_youtube():
+    """YouTubeIngestor pointed at a local stub API server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubYouTubeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ingestor = YouTubeIngestor(api_key="test_key")
+    ingestor._youtube = build(
+        'youtube', 'v3',
+        developerKey="test_key",
+        static_discovery=True,
+        client_options={"api_endpoint": f"http://127.0.0.1:{server.server_port}"},
+    )
+    yield ingestor
+    server.shutdown()
+    server.server_close()
+
+
+def test_youtube_get_recent_searches_terms_concurrently(stub_youtube):
+    """Test that discover searches overlap and give the sequential result."""
+    terms = [f"term{i}" for i in range(5)]
+
+    def timed_get_recent(concurrency):
+        with patch.object(settings, "youtube_discover_terms", terms), \
+                patch.object(settings, "youtube_discover_concurrency", concurrency):
+            start = time.perf_counter()
+            items = stub_youtube.get_recent(max_results=30)
+            return [item.id for item in items], time.perf_counter() - start
+
+    sequential_ids, sequential_time = timed_get_recent(1)
+    concurrent_ids, concurrent_time = timed_get_recent(5)
+
+    assert concurrent_ids == sequential_ids
+    assert len(concurrent_ids) == 30
+    assert sequential_time >= 5 * StubYouTubeHandler.latency
+    assert concurrent_time < 2 * StubYouTubeHandler.latency
+
+
+def test_youtube_get_recent_stops_searching_when_enough(stub_youtube):
+    """Test that, with the default settings, no more terms are searched once the first give enough."""
+    terms = settings.youtube_discover_terms
+
+    with patch.object(StubYouTubeHandler, "searched", []):
+        items = stub_youtube.get_recent(max_results=5)
+        searched = list(StubYouTubeHandler.searched)
+
+    assert len(items) == 5
+    # The first term alone is enough; only the search already in flight with it also ran
+    assert terms[0] in searched
+    assert len(searched) <= settings.youtube_discover_concurrency < len(terms)
+
+
+def test_youtube_get_recent_term_deadline(stub_youtube):
+    """Test that a term slower than youtube_discover_term_timeout is skipped on time."""
+    with patch.object(settings, "youtube_discover_terms", ["stuck", "term1"]), \
+            patch.object(settings, "youtube_discover_concurrency", 2), \
+            patch.object(settings, "youtube_discover_term_timeout", 0.4), \
+            patch.object(StubYouTubeHandler, "slow_terms", {"stuck": 1.5}):
+        start = time.perf_counter()
+        items = stub_youtube.get_recent(max_results=5)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 1
+    assert items and all(item.id.startswith("term1-") or item.id == "shared" for item in items)